@@ -0,0 +1,259 @@
+"""
+Benchmark of the solver and of the graph pipeline.
+
+Each case of the grid (number of buckets x capacity x actions x engine) is a
+puzzle whose buckets have the capacities capacity, capacity + 2, capacity + 4...
+and start empty, the objectif is the first bucket with one unit. The phases are
+timed separately, the best of the repeats is kept:
+
+    generate     Director.generate
+    materialize  the first use of the context cluster (the table of the numpy and dense engines)
+    queries      find_all_context_with_bucket, get_result and path_to on the objectif
+    graph        generate_graph_visualization of the full graph, rendered to DOT
+    write_dot    write_dot of the full graph in a temporary file
+
+The peak memory and the allocated blocks still alive after generate are measured
+with tracemalloc in a separate run, so they don't slow down the timings.
+
+Usage (from the root of the repository):
+
+    python -m benchmarks.bench --output baseline.json
+    python -m benchmarks.bench --buckets 2 3 --capacities 5 --actions DFP --engines object dense
+    python -m benchmarks.bench --output new.json --compare baseline.json --threshold 0.1 --min-time 0.005
+"""
+from src.models.actions.action import Action
+from src.models.actions.drain import Drain
+from src.models.actions.fill import Fill
+from src.models.actions.pour import Pour
+from src.models.bucket import Bucket
+from src.models.context import Context
+from src.models.director import Director
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from itertools import product
+from os import path
+from platform import platform, python_version
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable, Dict, List, Tuple
+import json
+import sys
+import tracemalloc
+
+ACTIONS = {"D": Drain, "F": Fill, "P": Pour}
+PHASES = ("generate", "materialize", "queries", "graph", "write_dot")
+
+
+def build_case(buckets: int, capacity: int, actions: str) -> Tuple[Context, List[Action], Bucket]:
+    """
+    Build the puzzle of a case of the grid.
+
+    Parameters:
+        buckets: int
+            the number of buckets
+        capacity: int
+            the capacity of the first bucket, the next ones are bigger by 2
+        actions: str
+            the letters of the actions: D for Drain, F for Fill and P for Pour
+
+    Return: Tuple[Context, List[Action], Bucket]
+        the initial context, the actions and the objectif.
+
+    Error:
+        ValueError:
+            if an action letter is unknown.
+    """
+    unknown = set(actions) - set(ACTIONS)
+    if unknown:
+        raise ValueError(f"Unknown actions {''.join(sorted(unknown))}, use D, F and P")
+
+    initial_context = Context([Bucket(f"b{index}", capacity + 2 * index) for index in range(buckets)])
+    return initial_context, [ACTIONS[letter]() for letter in actions], Bucket("b0", capacity, 1)
+
+
+def best_time(function: Callable[[], object], repeat: int) -> Tuple[float, object]:
+    """
+    Run a function several times.
+
+    Parameters:
+        function: Callable[[], object]
+            the function to time
+        repeat: int
+            the number of runs
+
+    Return: Tuple[float, object]
+        the shortest duration in seconds and the value returned by the last run.
+    """
+    best, value = float("inf"), None
+    for _ in range(repeat):
+        start = perf_counter()
+        value = function()
+        best = min(best, perf_counter() - start)
+    return best, value
+
+
+def run_case(buckets: int, capacity: int, actions: str, engine: str, repeat: int) -> Dict[str, object]:
+    """
+    Benchmark a case of the grid.
+
+    Parameters:
+        buckets: int
+            the number of buckets
+        capacity: int
+            the capacity of the first bucket
+        actions: str
+            the letters of the actions
+        engine: str
+            the engine of Director.generate
+        repeat: int
+            the number of runs of each phase
+
+    Return: Dict[str, object]
+        the description of the case, the number of states, the duration of each
+        phase, the states per second of generate, the peak memory and the allocated blocks.
+    """
+    initial_context, applyable_actions, objectif = build_case(buckets, capacity, actions)
+    generate = lambda: Director.generate(initial_context, applyable_actions, engine=engine)
+
+    timings = {}
+    timings["generate"], director = best_time(generate, repeat)
+
+    def materialize() -> Director:
+        fresh_director = generate()
+        start = perf_counter()
+        fresh_director.context_cluster
+        timings["materialize"] = min(timings.get("materialize", float("inf")), perf_counter() - start)
+        return fresh_director
+
+    for _ in range(repeat):
+        director = materialize()
+    director.set_objectif(objectif)
+
+    def queries() -> None:
+        contexts = director.find_all_context_with_bucket(objectif)
+        director.get_result()
+        if contexts:
+            director.path_to(contexts[0])
+
+    timings["queries"], _ = best_time(queries, repeat)
+    timings["graph"], _ = best_time(lambda: director.generate_graph_visualization().source, repeat)
+    with TemporaryDirectory() as directory:
+        timings["write_dot"], _ = best_time(lambda: director.write_dot(path.join(directory, "graph.dot")), repeat)
+
+    tracemalloc.start()
+    blocks_before = sys.getallocatedblocks()
+    traced_director = generate()
+    allocated_blocks = sys.getallocatedblocks() - blocks_before
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del traced_director
+
+    return {
+        "case": f"{buckets}x{capacity}-{actions}-{engine}",
+        "buckets": buckets,
+        "capacity": capacity,
+        "actions": actions,
+        "engine": engine,
+        "states": len(director),
+        **{f"{phase}_s": timings[phase] for phase in PHASES},
+        "states_per_s": len(director) / timings["generate"] if timings["generate"] else None,
+        "peak_memory": peak_memory,
+        "allocated_blocks": allocated_blocks,
+    }
+
+
+def compare(
+    results: List[Dict[str, object]], 
+    baseline: List[Dict[str, object]], 
+    threshold: float, 
+    min_time: float
+) -> bool:
+    """
+    Print the ratio between the durations of the results and of the baseline.
+
+    Parameters:
+        results: List[Dict[str, object]]
+            the results of the run
+        baseline: List[Dict[str, object]]
+            the results of a previous run
+        threshold: float
+            the relative slowdown above which a phase is a regression
+        min_time: float
+            the duration in seconds under which a phase is too short to be a regression
+
+    Return: bool
+        True if a phase of a case present in both runs is a regression.
+    """
+    baseline = {result["case"]: result for result in baseline}
+    regression = False
+
+    print(f"\n{'case':<24}" + "".join(f"{phase:>13}" for phase in PHASES))
+    for result in results:
+        previous = baseline.get(result["case"])
+        if previous is None:
+            continue
+
+        ratios = []
+        for phase in PHASES:
+            before, after = previous[f"{phase}_s"], result[f"{phase}_s"]
+            ratio = after / before if before else 1.0
+            slower = ratio > 1 + threshold and after >= min_time
+            regression |= slower
+            ratios.append(f"{ratio:>12.2f}{'!' if slower else ' '}")
+        print(f"{result['case']:<24}" + "".join(ratios))
+
+    return regression
+
+
+def main(arguments: List[str] = None) -> int:
+    """
+    Run the benchmark from the command line.
+
+    Parameters:
+        arguments: List[str] (optional)
+            the arguments of the command line, sys.argv by default
+
+    Return: int
+        the exit code, 1 if a regression was found by the comparison.
+    """
+    parser = ArgumentParser(description="Benchmark of the solver and of the graph pipeline.")
+    parser.add_argument("--buckets", type=int, nargs="+", default=[2, 3, 4], help="the numbers of buckets")
+    parser.add_argument("--capacities", type=int, nargs="+", default=[3, 7], help="the capacities of the first bucket")
+    parser.add_argument("--actions", nargs="+", default=["DFP", "FP"], help="the action sets, D for Drain, F for Fill and P for Pour")
+    parser.add_argument("--engines", nargs="+", default=["object"], help="the engines of Director.generate")
+    parser.add_argument("--repeat", type=int, default=3, help="the number of runs of each phase")
+    parser.add_argument("--output", help="the JSON file where the results are saved")
+    parser.add_argument("--compare", help="a JSON file of a previous run to compare with")
+    parser.add_argument("--threshold", type=float, default=0.1, help="the relative slowdown reported as a regression")
+    parser.add_argument("--min-time", type=float, default=0.005, help="the duration in seconds under which a phase is not compared")
+    options = parser.parse_args(arguments)
+
+    results = []
+    print(f"{'case':<24}{'states':>9}{'states/s':>12}" + "".join(f"{phase:>13}" for phase in PHASES) + f"{'peak MB':>10}{'blocks':>10}")
+    for buckets, capacity, actions, engine in product(options.buckets, options.capacities, options.actions, options.engines):
+        result = run_case(buckets, capacity, actions, engine, options.repeat)
+        results.append(result)
+        print(
+            f"{result['case']:<24}{result['states']:>9}{result['states_per_s'] or 0:>12.0f}"
+            + "".join(f"{result[f'{phase}_s']:>13.4f}" for phase in PHASES)
+            + f"{result['peak_memory'] / 1024 ** 2:>10.1f}{result['allocated_blocks']:>10}"
+        )
+
+    if options.output:
+        with open(options.output, "w") as output_file:
+            json.dump({
+                "date": datetime.now(timezone.utc).isoformat(),
+                "python": python_version(),
+                "platform": platform(),
+                "results": results,
+            }, output_file, indent=2)
+
+    if options.compare:
+        with open(options.compare) as baseline_file:
+            if compare(results, json.load(baseline_file)["results"], options.threshold, options.min_time):
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
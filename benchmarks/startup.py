@@ -0,0 +1,167 @@
+"""
+Measure of the import time of the entry points, to guard the cold start.
+
+Each entry point is imported in a new interpreter, so nothing is cached by a
+previous import, and the best of the repeats is kept. The dependencies who are
+always needed before it (Streamlit for the application) are imported first and
+not counted, so the time is the own cost of the code of the repository. After
+the import, the modules who must be loaded on first use only are checked:
+
+    src.app    the pages but the home page, the director, graphviz, turtle, numpy, Pympler, prometheus_client
+    src.solve  Streamlit, the pages, graphviz, turtle, numpy, prometheus_client
+
+Usage (from the root of the repository):
+
+    python -m benchmarks.startup --output startup.json
+    python -m benchmarks.startup --compare startup.json --threshold 0.2 --min-time 0.01
+"""
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from platform import platform, python_version
+from subprocess import run
+from typing import Dict, List, Tuple
+import json
+import sys
+
+TARGETS: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    "src.app": (
+        ("streamlit",),
+        ("src.pages.data", "src.models.director", "graphviz", "turtle", "numpy", "pympler", "prometheus_client"),
+    ),
+    "src.solve": (
+        (),
+        ("streamlit", "src.pages.home", "src.pages.data", "graphviz", "turtle", "numpy", "prometheus_client"),
+    ),
+}
+"""
+The modules imported before each entry point and the modules it must not import.
+"""
+
+PROBE = """
+import json, sys, time
+for module in {preloaded!r}:
+    __import__(module)
+started_at = time.perf_counter()
+__import__({target!r})
+duration = time.perf_counter() - started_at
+print(json.dumps({{"duration": duration, "modules": sorted(set({forbidden!r}) & set(sys.modules))}}))
+"""
+
+
+def measure(target: str, repeat: int) -> Dict[str, object]:
+    """
+    Import an entry point in new interpreters.
+
+    Parameters:
+        target: str
+            the module of the entry point, a key of TARGETS
+        repeat: int
+            the number of interpreters
+
+    Return: Dict[str, object]
+        the best import time in seconds and the forbidden modules who were imported.
+
+    Error:
+        RuntimeError:
+            if the import fails.
+    """
+    preloaded, forbidden = TARGETS[target]
+    code = PROBE.format(preloaded=preloaded, target=target, forbidden=forbidden)
+
+    durations = []
+    for _ in range(repeat):
+        process = run([sys.executable, "-c", code], capture_output=True, text=True)
+        if process.returncode != 0:
+            raise RuntimeError(f"the import of {target} failed:\n{process.stderr}")
+        probe = json.loads(process.stdout.splitlines()[-1])
+        durations.append(probe["duration"])
+
+    return {"target": target, "import_s": min(durations), "forbidden": probe["modules"]}
+
+
+def compare(
+    results: List[Dict[str, object]],
+    baseline: List[Dict[str, object]],
+    threshold: float,
+    min_time: float
+) -> bool:
+    """
+    Print the ratio between the import times of the results and of the baseline.
+
+    Parameters:
+        results: List[Dict[str, object]]
+            the results of the run
+        baseline: List[Dict[str, object]]
+            the results of a previous run
+        threshold: float
+            the relative slowdown above which an import is a regression
+        min_time: float
+            the duration in seconds under which an import is too short to be a regression
+
+    Return: bool
+        True if the import of an entry point present in both runs is a regression.
+    """
+    baseline = {result["target"]: result for result in baseline}
+    regression = False
+
+    print(f"\n{'target':<12}{'before':>10}{'after':>10}{'ratio':>9}")
+    for result in results:
+        previous = baseline.get(result["target"])
+        if previous is None:
+            continue
+
+        before, after = previous["import_s"], result["import_s"]
+        ratio = after / before if before else 1.0
+        slower = ratio > 1 + threshold and after >= min_time
+        regression |= slower
+        print(f"{result['target']:<12}{before * 1000:>8.1f}ms{after * 1000:>8.1f}ms{ratio:>8.2f}{'!' if slower else ' '}")
+
+    return regression
+
+
+def main(arguments: List[str] = None) -> int:
+    """
+    Measure the import time of the entry points from the command line.
+
+    Parameters:
+        arguments: List[str] (optional)
+            the arguments of the command line, sys.argv by default
+
+    Return: int
+        the exit code, 1 if a forbidden module is imported or if a regression was found by the comparison.
+    """
+    parser = ArgumentParser(description="Measure of the import time of the entry points.")
+    parser.add_argument("--targets", nargs="+", default=list(TARGETS), choices=list(TARGETS), help="the entry points")
+    parser.add_argument("--repeat", type=int, default=5, help="the number of imports of each entry point")
+    parser.add_argument("--output", help="the JSON file where the results are saved")
+    parser.add_argument("--compare", help="a JSON file of a previous run to compare with")
+    parser.add_argument("--threshold", type=float, default=0.2, help="the relative slowdown reported as a regression")
+    parser.add_argument("--min-time", type=float, default=0.01, help="the duration in seconds under which an import is not compared")
+    options = parser.parse_args(arguments)
+
+    results = []
+    failed = False
+    print(f"{'target':<12}{'import':>10}  forbidden modules imported")
+    for target in options.targets:
+        result = measure(target, options.repeat)
+        results.append(result)
+        failed |= bool(result["forbidden"])
+        print(f"{target:<12}{result['import_s'] * 1000:>8.1f}ms  {', '.join(result['forbidden']) or '-'}")
+
+    if options.output:
+        with open(options.output, "w") as output_file:
+            json.dump({
+                "date": datetime.now(timezone.utc).isoformat(),
+                "python": python_version(),
+                "platform": platform(),
+                "results": results,
+            }, output_file, indent=2)
+
+    if options.compare:
+        with open(options.compare) as baseline_file:
+            failed |= compare(results, json.load(baseline_file)["results"], options.threshold, options.min_time)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,7 @@
 from src.router import Router
-from src.pages.home import HomePage
 from src.components.navbar import NavBar
+from src.utils.config import Config
+from src.utils.metrics import serve_metrics
 
 class Application:
     """
@@ -15,7 +16,10 @@ class Application:
     """
 
     def __init__(self) -> None:
-        self.router = Router(HomePage())
+        self.router = Router("home")
+
+        if Config().metrics_port is not None:
+            serve_metrics(Config().metrics_port)
 
     def run(self) -> None:
         """
@@ -0,0 +1,89 @@
+"""
+Solve a batch of puzzles from the command line, without the application.
+
+The requests who share their buckets and their actions are grouped, so the
+contexts of each puzzle are generated once and all its objectives are answered
+from them. The puzzles are solved by a pool of processes and each result is
+written as a JSON line as soon as its puzzle is solved (see src.models.batch
+for the format of the requests).
+
+Usage (from the root of the repository):
+
+    python -m src.batch submissions.csv --output results.jsonl
+    python -m src.batch submissions.json --workers 4 --ordered
+    cat submissions.csv | python -m src.batch - --format csv --max-states 100000
+"""
+from src.models.batch import read_requests, solve_batch
+from src.models.budget import SearchBudget
+from src.utils.config import Config
+from argparse import ArgumentParser
+from os import path
+from typing import List
+import json
+import sys
+
+
+def main(arguments: List[str] = None) -> int:
+    """
+    Solve a batch from the command line.
+
+    Parameters:
+        arguments: List[str] (optional)
+            the arguments of the command line, sys.argv by default
+
+    Return: int
+        the exit code.
+    """
+    config = Config()
+    parser = ArgumentParser(prog="python -m src.batch", description="Solve a batch of bucket puzzles.")
+    parser.add_argument("input", help="the CSV or JSON file of the requests, - for the standard input")
+    parser.add_argument("--format", choices=("csv", "json"), help="the format of the input, guessed from its extension by default")
+    parser.add_argument("--output", help="the JSON lines file of the results, the standard output by default")
+    parser.add_argument("--workers", type=int, help="the number of processes, the number of cpu by default")
+    parser.add_argument("--engine", default="object", help="the engine of Director.generate")
+    parser.add_argument("--ordered", action="store_true", help="write the results in the order of the requests")
+    parser.add_argument("--max-states", type=int, default=config.max_states, help="the maximum number of contexts of a puzzle, 0 disables it")
+    parser.add_argument("--max-depth", type=int, default=config.max_depth, help="the maximum depth of a puzzle, 0 disables it")
+    parser.add_argument("--max-memory", type=int, default=config.max_memory, help="the maximum memory of a puzzle in MB, 0 disables it")
+    parser.add_argument("--deadline", type=float, default=config.deadline, help="the time limit of a puzzle in seconds, 0 disables it")
+    options = parser.parse_args(arguments)
+
+    file_format = options.format or ("csv" if path.splitext(options.input)[1].lower() == ".csv" else "json")
+    try:
+        if options.input == "-":
+            requests = read_requests(sys.stdin, file_format)
+        else:
+            with open(options.input, newline="") as stream:
+                requests = read_requests(stream, file_format)
+    except (OSError, ValueError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 2
+
+    budget = None
+    if options.engine == "object":
+        budget = SearchBudget(
+            max_states=options.max_states or None,
+            max_depth=options.max_depth or None,
+            max_memory=(options.max_memory or 0) * 1024 ** 2 or None,
+            deadline=options.deadline or None
+        )
+
+    try:
+        results = solve_batch(requests, options.workers, options.engine, budget, options.ordered)
+    except ValueError as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 2
+
+    output = open(options.output, "w") if options.output else sys.stdout
+    try:
+        for result in results:
+            output.write(json.dumps(result) + "\n")
+            output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -46,7 +46,7 @@ class BucketInput(IComponent):
 
     def render(self, attach_to: Any = st) -> None:
         """
-        render the component.
+        render the component, the current volume can't exceed the max volume.
 
         Parameters:
             attach_to (streamlit.component.Component): The component to attach to.
@@ -57,17 +57,18 @@ class BucketInput(IComponent):
             key=self.id if self.key is None else self.key
         )
 
-        self.current_volume = attach_to.number_input(
-            "Insert current volume of bucket",
+        self.max_volume = attach_to.number_input(
+            "Insert max volume of bucket",
             min_value=0,
-            value=0,
             step=1,
             key=self.id if self.key is None else self.key
         )
 
-        self.max_volume = attach_to.number_input(
-            "Insert max volume of bucket",
+        self.current_volume = attach_to.number_input(
+            "Insert current volume of bucket",
             min_value=0,
+            max_value=self.max_volume,
+            value=0,
             step=1,
             key=self.id if self.key is None else self.key
         )
\ No newline at end of file
@@ -1,12 +1,188 @@
 from abc import ABC, abstractmethod
 from src.models.bucket import Bucket
-from typing import List, TYPE_CHECKING
+from typing import Dict, Iterator, List, Sequence, Tuple, Type, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.models.context import Context
 
 class Action:
+    """
+    A class that represent an action who can evolve a context.
+
+    A move is a small integer who encodes the action, the bucket who perform
+    the action and the target bucket of the action (the same bucket when
+    the action has no target).
+
+    Attributes:
+        code: int
+            the code of the action in the moves.
+        registry: Dict[int, Type[Action]]
+            the actions indexed by their code.
+
+    Methods:
+        execute(context: Context, on_bucket: Bucket)
+            Apply the action to the context and return the new contexts.
+
+        reverse(context: Context, on_bucket: Bucket)
+            Return the contexts who lead to the context when the action is applied.
+
+        is_applicable(context: Context, on_bucket: int, target_bucket: int = None)
+            Return True if the action changes the volumes of the context.
+
+        successors(context: Context, on_bucket: int)
+            Yield the contexts obtained by the action, only those who differ from the context.
+
+        describe(on_bucket: str, target_bucket: str)
+            Return the trace of the action applied on the named buckets.
+
+        encode_move(size: int, on_bucket: int, target_bucket: int)
+            Return the move of the action applied on the buckets at the given indexes.
+
+        decode_move(move: int, size: int)
+            Return the code of the action and the indexes of the buckets of a move.
+
+        describe_move(move: int, names: Sequence[str])
+            Return the trace of a move.
+    """
+
+    code: int = -1
+    registry: Dict[int, Type['Action']] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if "code" in cls.__dict__:
+            Action.registry[cls.code] = cls
 
     @abstractmethod
     def execute(self, context: 'Context', on_bucket: Bucket) -> List['Context']:
         raise NotImplementedError()
+
+    def reverse(self, context: 'Context', on_bucket: Bucket) -> List['Context']:
+        """
+        Return the contexts who lead to the context when the action is applied.
+        Each predecessor is derived from the context, and its move is the move 
+        who leads from the predecessor to the context.
+
+        Parameters:
+            context: Context
+                the context obtained after the action
+            on_bucket: Bucket
+                the bucket who perform the action
+
+        Return: List[Context]
+            the predecessors of the context.
+        """
+        raise NotImplementedError(f"the action {self} cannot be reversed")
+
+    def is_applicable(self, context: 'Context', on_bucket: int, target_bucket: int = None) -> bool:
+        """
+        Return True if the action changes the volumes of the context. The predicate
+        only reads the volumes, nothing is created to answer it.
+
+        Parameters:
+            context: Context
+                the context in which the action would be applied
+            on_bucket: int
+                the index of the bucket who perform the action
+            target_bucket: int (optional)
+                the index of the target bucket of the action
+
+        Return: bool
+            True if the action is effective, the default is True when it is unknown.
+        """
+        return True
+
+    def successors(self, context: 'Context', on_bucket: int) -> Iterator['Context']:
+        """
+        Yield the contexts obtained by the action, only those who differ from the
+        context. The default applies execute when the action is applicable and drops
+        the moves who change nothing, the actions override it to create a context
+        only for an effective move.
+
+        Parameters:
+            context: Context
+                the context in which the action is applied
+            on_bucket: int
+                the index of the bucket who perform the action
+
+        Return: Iterator[Context]
+            the contexts derived from the context, with their move recorded.
+        """
+        if not self.is_applicable(context, on_bucket):
+            return
+
+        for successor in self.execute(context.derive(), context.buckets[on_bucket]):
+            if successor.state != context.state:
+                yield successor
+
+    @classmethod
+    def describe(cls, on_bucket: str, target_bucket: str) -> str:
+        """
+        Return the trace of the action applied on the named buckets.
+
+        Parameters:
+            on_bucket: str
+                the name of the bucket who perform the action
+            target_bucket: str
+                the name of the target bucket of the action
+
+        Return: str
+            the trace of the action.
+        """
+        raise NotImplementedError()
+
+    @classmethod
+    def encode_move(cls, size: int, on_bucket: int, target_bucket: int = None) -> int:
+        """
+        Return the move of the action applied on the buckets at the given indexes.
+
+        Parameters:
+            size: int
+                the number of buckets of the context
+            on_bucket: int
+                the index of the bucket who perform the action
+            target_bucket: int (optional)
+                the index of the target bucket of the action
+
+        Return: int
+            the move.
+        """
+        if target_bucket is None:
+            target_bucket = on_bucket
+        return (cls.code * size + on_bucket) * size + target_bucket
+
+    @staticmethod
+    def decode_move(move: int, size: int) -> Tuple[int, int, int]:
+        """
+        Return the code of the action and the indexes of the buckets of a move.
+
+        Parameters:
+            move: int
+                the move to decode
+            size: int
+                the number of buckets of the context
+
+        Return: Tuple[int, int, int]
+            the code of the action, the index of the bucket who perform the
+            action and the index of the target bucket.
+        """
+        move, target_bucket = divmod(move, size)
+        code, on_bucket = divmod(move, size)
+        return code, on_bucket, target_bucket
+
+    @staticmethod
+    def describe_move(move: int, names: Sequence[str]) -> str:
+        """
+        Return the trace of a move.
+
+        Parameters:
+            move: int
+                the move to describe
+            names: Sequence[str]
+                the names of the buckets of the context
+
+        Return: str
+            the trace of the move.
+        """
+        code, on_bucket, target_bucket = Action.decode_move(move, len(names))
+        return Action.registry[code].describe(names[on_bucket], names[target_bucket])
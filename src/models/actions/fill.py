@@ -1,13 +1,16 @@
 from src.models.actions.action import Action
 from src.models.context import Context
+from src.models.state import State
 from src.models.bucket import Bucket
-from typing import List
+from typing import Iterator, List
 
 class Fill(Action):
 
+    code = 1
+
     def add_trace_to_history(self, context: Context, on_bucket: Bucket) -> None:
         """
-        Add a trace to the history of the context
+        Add a trace to the history of the context by recording the move of the action
         
         Parameters: 
             context: Context
@@ -15,9 +18,23 @@ class Fill(Action):
             on_bucket: Bucket
                 The bucket that is being Fill
         """
-        context.history.append(
-            f"Fill the bucket {on_bucket.name}"
-        )
+        context.move = self.encode_move(len(context.layout), on_bucket.index)
+
+    @classmethod
+    def describe(cls, on_bucket: str, target_bucket: str) -> str:
+        """
+        Return the trace of the action applied on the named bucket.
+
+        Parameters:
+            on_bucket: str
+                the name of the bucket who is being Fill
+            target_bucket: str
+                unused, the action has no target
+
+        Return: str
+            the trace of the action.
+        """
+        return f"Fill the bucket {on_bucket}"
 
     def execute(self, context: Context, on_bucket: Bucket) -> List[Context]:
         """
@@ -37,5 +54,69 @@ class Fill(Action):
         self.add_trace_to_history(context, on_bucket)
         return [context]
 
+    def is_applicable(self, context: Context, on_bucket: int, target_bucket: int = None) -> bool:
+        """
+        Return True if the bucket is not full, otherwise the action changes nothing.
+
+        Parameters:
+            context: Context
+                the context in which the action would be applied
+            on_bucket: int
+                the index of the bucket to fill
+            target_bucket: int (optional)
+                unused, the action has no target
+
+        Return: bool
+            True if the bucket can be filled.
+        """
+        return context.state.volumes[on_bucket] != context.layout.capacities[on_bucket]
+
+    def successors(self, context: Context, on_bucket: int) -> Iterator[Context]:
+        """
+        Yield the context where the bucket is filled, nothing if it is already full.
+
+        Parameters:
+            context: Context
+                the context in which the action is applied
+            on_bucket: int
+                the index of the bucket to fill
+
+        Return: Iterator[Context]
+            the new context, derived from the context.
+        """
+        if self.is_applicable(context, on_bucket):
+            volumes = context.state.volumes
+            capacity = context.layout.capacities[on_bucket]
+            yield context.derive(
+                State(volumes[:on_bucket] + (capacity,) + volumes[on_bucket + 1:]),
+                self.encode_move(len(volumes), on_bucket)
+            )
+
+    def reverse(self, context: Context, on_bucket: Bucket) -> List[Context]:
+        """
+        Return the contexts who lead to the context when the bucket is filled, the bucket
+        could have contained any volume before.
+        
+        Parameters:
+            context: Context
+                the context obtained after the action
+            on_bucket: Bucket
+                the bucket who has been filled
+        
+        Return: List[Context]
+            the predecessors of the context, empty if the bucket is not full
+        """
+        on_bucket = context.get_bucket(on_bucket)
+        if on_bucket is None or on_bucket.current_volume != on_bucket.max_volume:
+            return []
+
+        predecessors = []
+        for volume in range(on_bucket.max_volume):
+            predecessor = context.derive()
+            predecessor.buckets[on_bucket.index].current_volume = volume
+            self.add_trace_to_history(predecessor, on_bucket)
+            predecessors.append(predecessor)
+        return predecessors
+
     def __str__(self) -> str:
         return "Fill"
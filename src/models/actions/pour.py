@@ -1,14 +1,17 @@
 from src.models.actions.action import Action
 from src.models.context import Context
+from src.models.state import State
 from src.models.bucket import Bucket
-from typing import List
+from typing import Iterator, List
 
 
 class Pour(Action):
 
+    code = 2
+
     def add_trace_to_history(self, context: Context, on_bucket: Bucket, target_bucket: Bucket) -> None:
         """
-        Add a trace to the history of the context
+        Add a trace to the history of the context by recording the move of the action
         
         Parameters: 
             context: Context
@@ -18,9 +21,23 @@ class Pour(Action):
             target_bucket: Bucket
                 The bucket that is being pour into
         """
-        context.history.append(
-            f"bucket {on_bucket.name} pour in bucket {target_bucket.name}"
-        )
+        context.move = self.encode_move(len(context.layout), on_bucket.index, target_bucket.index)
+
+    @classmethod
+    def describe(cls, on_bucket: str, target_bucket: str) -> str:
+        """
+        Return the trace of the action applied on the named buckets.
+
+        Parameters:
+            on_bucket: str
+                the name of the bucket who is being poured out
+            target_bucket: str
+                the name of the bucket who is being pour into
+
+        Return: str
+            the trace of the action.
+        """
+        return f"bucket {on_bucket} pour in bucket {target_bucket}"
 
 
     def _execute(self, context: Context, on_bucket: Bucket, target_bucket: Bucket) -> Context:
@@ -61,10 +78,107 @@ class Pour(Action):
             the new context that is created by applying the action
         """
         return [
-            self._execute(context.clone(), on_bucket.clone(), target_bucket.clone())
+            self._execute(context.clone(), on_bucket, target_bucket)
             for target_bucket in context.buckets
             if target_bucket != on_bucket
         ]
 
+    def is_applicable(self, context: Context, on_bucket: int, target_bucket: int = None) -> bool:
+        """
+        Return True if the on_bucket is not empty and the target bucket is not full,
+        otherwise the pour changes nothing. Without target, return True if at least
+        one other bucket can receive the volume of the on_bucket.
+
+        Parameters:
+            context: Context
+                the context in which the action would be applied
+            on_bucket: int
+                the index of the bucket who would be poured out
+            target_bucket: int (optional)
+                the index of the bucket to pour into
+
+        Return: bool
+            True if some volume can be poured.
+        """
+        volumes = context.state.volumes
+        if volumes[on_bucket] == 0:
+            return False
+
+        capacities = context.layout.capacities
+        if target_bucket is not None:
+            return target_bucket != on_bucket and volumes[target_bucket] != capacities[target_bucket]
+        return any(
+            index != on_bucket and volume != capacity
+            for index, (volume, capacity) in enumerate(zip(volumes, capacities))
+        )
+
+    def successors(self, context: Context, on_bucket: int) -> Iterator[Context]:
+        """
+        Yield the contexts where the on_bucket is poured into each other bucket, only
+        the targets who are not full, and nothing if the on_bucket is empty.
+
+        Parameters:
+            context: Context
+                the context in which the action is applied
+            on_bucket: int
+                the index of the bucket who is being poured out
+
+        Return: Iterator[Context]
+            the new contexts, derived from the context, in the order of the targets.
+        """
+        volumes = context.state.volumes
+        on_volume = volumes[on_bucket]
+        size = len(volumes)
+        capacities = context.layout.capacities
+        for target_bucket in range(size):
+            if not self.is_applicable(context, on_bucket, target_bucket):
+                continue
+
+            target_volume = volumes[target_bucket]
+            poured_volume = min(on_volume, capacities[target_bucket] - target_volume)
+            new_volumes = list(volumes)
+            new_volumes[on_bucket] = on_volume - poured_volume
+            new_volumes[target_bucket] = target_volume + poured_volume
+            yield context.derive(State(new_volumes), self.encode_move(size, on_bucket, target_bucket))
+
+    def reverse(self, context: Context, on_bucket: Bucket) -> List[Context]:
+        """
+        Return the contexts who lead to the context when the on_bucket is poured 
+        into an other bucket. A pour stops when the on_bucket is empty or when the
+        target bucket is full, so only these contexts have predecessors.
+        
+        Parameters:
+            context: Context
+                the context obtained after the action
+            on_bucket: Bucket
+                The bucket that has been poured out
+        
+        Return: List[Context]
+            the predecessors of the context
+        """
+        on_bucket = context.get_bucket(on_bucket)
+        if on_bucket is None:
+            return []
+
+        predecessors = []
+        for target_bucket in context.buckets:
+            if target_bucket.index == on_bucket.index:
+                continue
+            if on_bucket.current_volume != 0 and target_bucket.current_volume != target_bucket.max_volume:
+                continue
+
+            poured_volumes = min(
+                target_bucket.current_volume, 
+                on_bucket.max_volume - on_bucket.current_volume
+            )
+            for poured_volume in range(1, poured_volumes + 1):
+                predecessor = context.derive()
+                buckets = predecessor.buckets
+                buckets[on_bucket.index].current_volume = on_bucket.current_volume + poured_volume
+                buckets[target_bucket.index].current_volume = target_bucket.current_volume - poured_volume
+                self.add_trace_to_history(predecessor, on_bucket, target_bucket)
+                predecessors.append(predecessor)
+        return predecessors
+
     def __str__(self) -> str:
         return "Pour"
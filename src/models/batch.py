@@ -0,0 +1,422 @@
+from src.models.actions.action import Action
+from src.models.actions.drain import Drain
+from src.models.actions.fill import Fill
+from src.models.actions.pour import Pour
+from src.models.bucket import Bucket
+from src.models.budget import SearchBudget
+from src.models.context import Context
+from src.models.director import Director
+from functools import partial
+from multiprocessing import Pool
+from os import cpu_count
+from typing import Any, Callable, Dict, Iterable, Iterator, List, TextIO, Tuple, Union
+import csv
+import json
+import re
+
+ACTIONS = {"drain": Drain, "fill": Fill, "pour": Pour}
+ENGINES = ("object", "numpy", "parallel", "dense")
+
+Puzzle = Tuple[Tuple[Tuple[str, int, int], ...], Tuple[str, ...]]
+"""
+The buckets of a puzzle as (name, maximum volume, current volume), sorted by
+maximum volume then by name, and the sorted names of its actions.
+"""
+
+
+class BatchRequest:
+    """
+    A class that represent a request of a batch: a puzzle and the objectives to
+    answer on its contexts. An objective is a bucket of the puzzle and the volume
+    it has to contain.
+
+    Attributes:
+        request_id: str
+            the identifier of the request, repeated in its results.
+        buckets: List[Tuple[str, int, int]]
+            the name, the maximum volume and the current volume of each bucket.
+        actions: List[str]
+            the names of the actions, "drain", "fill" or "pour".
+        objectives: List[Tuple[str, int]]
+            the name of the bucket and the volume of each objective.
+
+    Methods:
+        puzzle()
+            Return the puzzle of the request, the same for the requests who share their contexts.
+
+        build_context()
+            Return the initial context of the puzzle.
+
+        build_actions()
+            Return the actions of the puzzle.
+    """
+
+    def __init__(
+        self,
+        request_id: str,
+        buckets: List[Tuple[str, int, int]],
+        actions: List[str],
+        objectives: List[Tuple[str, int]]
+    ) -> None:
+        """
+        Parameters:
+            request_id: str
+                the identifier of the request
+            buckets: List[Tuple[str, int, int]]
+                the name, the maximum volume and the current volume of each bucket
+            actions: List[str]
+                the names of the actions, the case is ignored
+            objectives: List[Tuple[str, int]]
+                the name of the bucket and the volume of each objective
+
+        Error:
+            ValueError:
+                if a volume is out of its bucket, if an action is unknown or if
+                an objective is not on a bucket of the puzzle.
+        """
+        self.request_id = str(request_id)
+        self.buckets = [(str(name), int(max_volume), int(current_volume)) for name, max_volume, current_volume in buckets]
+        self.actions = [str(action).lower() for action in actions]
+        self.objectives = [(str(name), int(volume)) for name, volume in objectives]
+
+        if not self.buckets:
+            raise ValueError(f"the request {self.request_id} has no bucket")
+        for name, max_volume, current_volume in self.buckets:
+            if not 0 <= current_volume <= max_volume:
+                raise ValueError(f"the bucket {name} of the request {self.request_id} contains {current_volume} / {max_volume}")
+        for action in self.actions:
+            if action not in ACTIONS:
+                raise ValueError(f"the action {action} of the request {self.request_id} is unknown")
+
+        capacities = {name: max_volume for name, max_volume, _ in self.buckets}
+        for name, volume in self.objectives:
+            if name not in capacities:
+                raise ValueError(f"the objective {name} of the request {self.request_id} is not a bucket")
+            if not 0 <= volume <= capacities[name]:
+                raise ValueError(f"the objective {name} of the request {self.request_id} cannot contain {volume}")
+
+
+    def puzzle(self) -> Puzzle:
+        """
+        Return the puzzle of the request. The order of the buckets and of the actions
+        doesn't change the reachable contexts, so they are sorted.
+
+        Return: Puzzle
+            the sorted buckets and the sorted names of the actions.
+        """
+        return (
+            tuple(sorted(self.buckets, key=lambda bucket: (bucket[1], bucket[0], bucket[2]))),
+            tuple(sorted(set(self.actions)))
+        )
+
+
+    def build_context(self) -> Context:
+        """
+        Return: Context
+            the initial context of the puzzle, its buckets in the order of the puzzle.
+        """
+        return Context([Bucket(*bucket) for bucket in self.puzzle()[0]])
+
+
+    def build_actions(self) -> List[Action]:
+        """
+        Return: List[Action]
+            the actions of the puzzle, in the order of the puzzle.
+        """
+        return [ACTIONS[action]() for action in self.puzzle()[1]]
+
+
+def _split(value: Union[str, List[Any]]) -> List[Any]:
+    """
+    Split a cell of a CSV file on the spaces and the semicolons, a JSON list is kept.
+
+    Parameters:
+        value: Union[str, List[Any]]
+            the value of the cell or of the JSON field
+
+    Return: List[Any]
+        the items of the value.
+    """
+    if isinstance(value, str):
+        return [item for item in re.split(r"[\s;]+", value) if item]
+    return list(value)
+
+
+def _parse_bucket(value: Union[str, List[Any], Dict[str, Any]]) -> Tuple[str, int, int]:
+    """
+    Parse a bucket written "name:max_volume:current_volume", [name, max_volume, current_volume]
+    or {"name", "max_volume", "current_volume"}, the current volume is 0 by default.
+
+    Parameters:
+        value: Union[str, List[Any], Dict[str, Any]]
+            the bucket
+
+    Return: Tuple[str, int, int]
+        the name, the maximum volume and the current volume of the bucket.
+    """
+    if isinstance(value, dict):
+        return value["name"], int(value["max_volume"]), int(value.get("current_volume", 0))
+    items = value.split(":") if isinstance(value, str) else list(value)
+    if len(items) not in (2, 3):
+        raise ValueError(f"the bucket {value} must have a name, a maximum volume and a current volume")
+    return items[0], int(items[1]), int(items[2]) if len(items) == 3 else 0
+
+
+def _parse_objective(value: Union[str, List[Any], Dict[str, Any]]) -> Tuple[str, int]:
+    """
+    Parse an objective written "name:volume", [name, volume] or {"name", "volume"}.
+
+    Parameters:
+        value: Union[str, List[Any], Dict[str, Any]]
+            the objective
+
+    Return: Tuple[str, int]
+        the name of the bucket and the volume it has to contain.
+    """
+    if isinstance(value, dict):
+        return value["name"], int(value["volume"])
+    items = value.split(":") if isinstance(value, str) else list(value)
+    if len(items) != 2:
+        raise ValueError(f"the objective {value} must have the name of a bucket and a volume")
+    return items[0], int(items[1])
+
+
+def parse_request(record: Dict[str, Any], position: int = 1) -> BatchRequest:
+    """
+    Build a request from a row of a CSV file or an object of a JSON list.
+
+    Parameters:
+        record: Dict[str, Any]
+            the fields id (optional), buckets, actions and objectives
+        position: int (optional)
+            the position of the record, its identifier when it has none
+
+    Return: BatchRequest
+        the request.
+
+    Error:
+        ValueError:
+            if a field is missing or malformed.
+    """
+    try:
+        objectives = record.get("objectives", record.get("objective"))
+        if isinstance(objectives, dict):
+            objectives = [objectives]
+        return BatchRequest(
+            record.get("id") or position,
+            [_parse_bucket(bucket) for bucket in _split(record["buckets"])],
+            _split(record["actions"]),
+            [_parse_objective(objective) for objective in _split(objectives or [])]
+        )
+    except (KeyError, TypeError, ValueError) as error:
+        raise ValueError(f"the request at position {position} is invalid: {error}") from error
+
+
+def read_requests(stream: TextIO, file_format: str = "json") -> List[BatchRequest]:
+    """
+    Read the requests of a batch. A CSV file has the columns id, buckets, actions
+    and objectives, their items separated by spaces or semicolons:
+
+        id,buckets,actions,objectives
+        alice,a:3:0 b:5:0,fill drain pour,b:4
+
+    A JSON file is a list of objects with the same fields, the items as lists.
+
+    Parameters:
+        stream: TextIO
+            the content of the file
+        file_format: str (optional)
+            "csv" or "json"
+
+    Return: List[BatchRequest]
+        the requests, in the order of the file.
+
+    Error:
+        ValueError:
+            if the format is unknown or if a request is invalid.
+    """
+    if file_format == "csv":
+        records = list(csv.DictReader(stream))
+    elif file_format == "json":
+        records = json.load(stream)
+        if not isinstance(records, list):
+            raise ValueError("a JSON batch must be a list of requests")
+    else:
+        raise ValueError(f"Unknown format {file_format}")
+
+    return [parse_request(record, position) for position, record in enumerate(records, 1)]
+
+
+def group_requests(requests: Iterable[BatchRequest]) -> Dict[Puzzle, List[BatchRequest]]:
+    """
+    Group the requests who share their puzzle, its contexts are generated only once.
+
+    Parameters:
+        requests: Iterable[BatchRequest]
+            the requests of the batch
+
+    Return: Dict[Puzzle, List[BatchRequest]]
+        the requests of each puzzle, the puzzles in order of their first request.
+    """
+    groups = {}
+    for request in requests:
+        groups.setdefault(request.puzzle(), []).append(request)
+    return groups
+
+
+def answer_objectives(director: Director, request: BatchRequest) -> List[Dict[str, Any]]:
+    """
+    Answer the objectives of a request from the contexts of its puzzle.
+
+    Parameters:
+        director: Director
+            the director of the puzzle of the request, generated or solved
+        request: BatchRequest
+            the request
+
+    Return: List[Dict[str, Any]]
+        a result per objective: the id of the request, the bucket and the volume
+        of the objective, reachable (None if the search was stopped before finding
+        it), the number of moves and the path, the number of contexts generated
+        and the limit who stopped the search.
+    """
+    capacities = {name: max_volume for name, max_volume, _ in request.buckets}
+
+    results = []
+    for name, volume in request.objectives:
+        path = director.path_to(Bucket(name, capacities[name], volume))
+        results.append({
+            "id": request.request_id,
+            "bucket": name,
+            "volume": volume,
+            "reachable": True if path is not None else False if director.complete else None,
+            "moves": len(path) if path is not None else None,
+            "path": path,
+            "states": len(director),
+            "stop_reason": director.stop_reason,
+        })
+    return results
+
+
+def solve_group(requests: List[BatchRequest], engine: str = "object", budget: SearchBudget = None) -> List[Dict[str, Any]]:
+    """
+    Generate the contexts of the puzzle of the requests once, then answer all
+    their objectives from them.
+
+    Parameters:
+        requests: List[BatchRequest]
+            the requests who share their puzzle
+        engine: str (optional)
+            the engine of Director.generate
+        budget: SearchBudget (optional)
+            the limits of the search, only with the object engine
+
+    Return: List[Dict[str, Any]]
+        the results of answer_objectives for each request.
+    """
+    director = Director.generate(requests[0].build_context(), requests[0].build_actions(), engine, budget=budget)
+    return [result for request in requests for result in answer_objectives(director, request)]
+
+
+def solve_batch(
+    requests: Iterable[BatchRequest],
+    workers: int = None,
+    engine: str = "object",
+    budget: SearchBudget = None,
+    ordered: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """
+    Solve the requests of a batch, the puzzles are shared between a pool of
+    processes and the results are yielded as soon as a puzzle is solved. The
+    parameters are checked before the pool is started.
+
+    Parameters:
+        requests: Iterable[BatchRequest]
+            the requests of the batch
+        workers: int (optional)
+            the number of processes, the number of cpu by default, 1 solves in this process
+        engine: str (optional)
+            the engine of Director.generate, the parallel engine only in this process
+        budget: SearchBudget (optional)
+            the limits of the search of each puzzle, only with the object engine
+        ordered: bool (optional)
+            yield the results in the order of the requests instead of the order they are solved
+
+    Return: Iterator[Dict[str, Any]]
+        the results of solve_group, the results of a request are yielded together.
+
+    Error:
+        ValueError:
+            if the engine is unknown, if it cannot use the budget or run in the pool,
+            or if the number of workers is not positive.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine}")
+    if budget is not None and engine != "object":
+        raise ValueError(f"the {engine} engine cannot use a budget")
+    if workers is None:
+        workers = cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"the number of workers must be positive, {workers} is given")
+
+    requests = list(requests)
+    groups = list(group_requests(requests).values())
+    workers = min(workers, len(groups))
+    if engine == "parallel" and workers > 1:
+        raise ValueError("the parallel engine starts its own processes, it cannot run in a pool, use 1 worker")
+
+    return _solve_groups(requests, groups, partial(solve_group, engine=engine, budget=budget), workers, ordered)
+
+
+def _solve_groups(
+    requests: List[BatchRequest],
+    groups: List[List[BatchRequest]],
+    solve: Callable[[List[BatchRequest]], List[Dict[str, Any]]],
+    workers: int,
+    ordered: bool
+) -> Iterator[Dict[str, Any]]:
+    """
+    Solve the groups of solve_batch, in this process or in a pool of processes.
+
+    Parameters:
+        requests: List[BatchRequest]
+            the requests of the batch, in their order
+        groups: List[List[BatchRequest]]
+            the requests of each puzzle
+        solve: Callable[[List[BatchRequest]], List[Dict[str, Any]]]
+            solve_group with the engine and the budget
+        workers: int
+            the number of processes, 1 solves in this process
+        ordered: bool
+            yield the results in the order of the requests
+
+    Return: Iterator[Dict[str, Any]]
+        the results of the groups.
+    """
+    if workers <= 1:
+        solved = map(solve, groups)
+    else:
+        pool = Pool(workers)
+        solved = (pool.imap if ordered else pool.imap_unordered)(solve, groups)
+
+    try:
+        if not ordered:
+            for results in solved:
+                yield from results
+            return
+
+        positions = {id(request): position for position, request in enumerate(requests)}
+        waiting = {}
+        next_position = 0
+        for group, results in zip(groups, solved):
+            offset = 0
+            for request in group:
+                waiting[positions[id(request)]] = results[offset:offset + len(request.objectives)]
+                offset += len(request.objectives)
+            while next_position in waiting:
+                yield from waiting.pop(next_position)
+                next_position += 1
+    finally:
+        if workers > 1:
+            pool.terminate()
+            pool.join()
@@ -129,3 +129,48 @@ class Bucket:
             a string that represents the bucket object.
         """
         return f"volume: {self.current_volume} / {self.max_volume}"
+
+
+class BucketView(Bucket):
+    """
+    A class that represent a bucket of a context.
+    The view doesn't store the volume by itself, it reads and writes it
+    in the state of the context it belongs to.
+
+    Attributes:
+        context: Context
+            the context who contains the bucket.
+        index: int
+            the index of the bucket in the context.
+    """
+
+    def __init__(self, context, index: int) -> None:
+        """
+        Parameters:
+            context: Context
+                the context who contains the bucket.
+            index: int
+                the index of the bucket in the context.
+        """
+        self.context = context
+        self.index = index
+
+
+    @property
+    def name(self) -> str:
+        return self.context.layout.names[self.index]
+
+
+    @property
+    def max_volume(self) -> int:
+        return self.context.layout.capacities[self.index]
+
+
+    @property
+    def current_volume(self) -> int:
+        return self.context.state.volumes[self.index]
+
+
+    @current_volume.setter
+    def current_volume(self, volume: int) -> None:
+        self.context.state = self.context.state.replace(self.index, volume)
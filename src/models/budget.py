@@ -0,0 +1,80 @@
+from typing import Union
+
+
+class SearchBudget:
+    """
+    A class that represent the limits of a search. A limit set to None is not checked.
+
+    Attributes:
+        max_states: int
+            the search stops once more contexts are discovered.
+        max_depth: int
+            the contexts of this depth are not expanded.
+        max_memory: int
+            the search stops once the estimated memory of the director is bigger, in bytes.
+        deadline: float
+            the search stops once it runs for longer, in seconds.
+
+    Methods:
+        exceeded(director: Director, depth: int, elapsed: float)
+            Return the limit exceeded by the search, None if the search can go on.
+    """
+
+    REASONS = ("max_states", "max_depth", "max_memory", "deadline")
+
+    def __init__(
+        self,
+        max_states: int = None,
+        max_depth: int = None,
+        max_memory: int = None,
+        deadline: float = None
+    ) -> None:
+        """
+        Parameters:
+            max_states: int (optional)
+                the maximum number of discovered contexts
+            max_depth: int (optional)
+                the depth of the last level discovered
+            max_memory: int (optional)
+                the maximum estimated memory of the director, in bytes
+            deadline: float (optional)
+                the maximum duration of the search, in seconds
+
+        Error:
+            ValueError:
+                if a limit is negative.
+        """
+        for name, limit in zip(self.REASONS, (max_states, max_depth, max_memory, deadline)):
+            if limit is not None and limit < 0:
+                raise ValueError(f"the limit {name} must be positive, {limit} is given")
+
+        self.max_states = max_states
+        self.max_depth = max_depth
+        self.max_memory = max_memory
+        self.deadline = deadline
+
+
+    def exceeded(self, director, depth: int, elapsed: float) -> Union[str, None]:
+        """
+        Return the limit exceeded by the search, None if the search can go on.
+
+        Parameters:
+            director: Director
+                the director being generated
+            depth: int
+                the depth of the context about to be expanded
+            elapsed: float
+                the duration of the search so far, in seconds
+
+        Return: Union[str, None]
+            "max_states", "max_depth", "max_memory" or "deadline", None if no limit is exceeded.
+        """
+        if self.max_depth is not None and depth >= self.max_depth:
+            return "max_depth"
+        if self.max_states is not None and len(director) > self.max_states:
+            return "max_states"
+        if self.max_memory is not None and director.estimate_memory() > self.max_memory:
+            return "max_memory"
+        if self.deadline is not None and elapsed > self.deadline:
+            return "deadline"
+        return None
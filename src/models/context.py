@@ -1,17 +1,31 @@
 from src.models.actions.action import Action
-from src.models.bucket import Bucket
-from typing import List, Union
+from src.models.bucket import Bucket, BucketView
+from src.models.state import Layout, State
+from typing import Iterator, List, Union
 
 
 class Context:
     """
     A class that represent a context.
+    The context is a view over a layout, shared by all the contexts of the
+    same puzzle, and an immutable state who contains the volumes.
 
     Attributes:
+        layout: Layout
+            the names and the maximum volumes of the buckets.
+        state: State
+            the current volumes of the buckets.
         buckets: List[Bucket]
             the bucket of the context.
+        parent: Context
+            the context from which this context has been obtained.
+        move: int
+            the move who has been applied on the parent to obtain this context.
+        depth: int
+            the number of actions applied since the initial context.
         history: List[str]
-            the history of the previous actions of the context.
+            the history of the previous actions of the context, 
+            computed from the parents when it is read.
 
     Methods:
         get_bucket(target_bucket: Bucket)
@@ -23,23 +37,111 @@ class Context:
         
         apply_action(action: Action, on_bucket: Bucket)
             Given an action, apply it to the bucket and return the resulting contexts
+
+        revert_action(action: Action, on_bucket: Bucket)
+            Given an action, return the contexts who lead to the current one with this action
+
+        successors(applyable_actions: List[Action])
+            Yield the contexts obtained by the effective moves of the actions
         
         clone()
             Return a new context object that is a clone of the current one.
+
+        derive(state: State = None, move: int = None)
+            Return a new context object whose parent is the current one.
+
+        from_state(layout: Layout, state: State)
+            Create a context from a layout and a state without sorting the buckets.
         
         get_representation()
             Return a string representation of the buckets in the context
     """
 
+    __slots__ = ("layout", "state", "parent", "move", "depth", "_buckets")
+
     def __init__(self, buckets: List[Bucket]) -> None:
         """
         Parameters:
             buckets: List[Bucket]
                 the list of buckets who is contained by the context
+
+        Error:
+            ValueError:
+                if the volume of a bucket is negative or bigger than its maximum volume,
+                the engines would not agree on the contexts reachable from it.
         """
+        for bucket in buckets:
+            if not 0 <= bucket.current_volume <= bucket.max_volume:
+                raise ValueError(
+                    f"the bucket {bucket.name} contains {bucket.current_volume} "
+                    f"but its volume must be between 0 and {bucket.max_volume}"
+                )
+
         buckets.sort(key=lambda bucket: bucket.max_volume)
-        self.buckets = buckets
-        self.history = []
+        self.layout = Layout(
+            (bucket.name for bucket in buckets),
+            (bucket.max_volume for bucket in buckets)
+        )
+        self.state = State(bucket.current_volume for bucket in buckets)
+        self.parent = None
+        self.move = None
+        self.depth = 0
+        self._buckets = None
+
+
+    @classmethod
+    def from_state(cls, layout: Layout, state: State) -> 'Context':
+        """
+        Create a context from a layout and a state without sorting the buckets.
+
+        Parameters:
+            layout: Layout
+                the names and the maximum volumes of the buckets
+            state: State
+                the current volumes of the buckets
+
+        Return: Context
+            the context who is a view over the layout and the state.
+        """
+        context = cls.__new__(cls)
+        context.layout = layout
+        context.state = state
+        context.parent = None
+        context.move = None
+        context.depth = 0
+        context._buckets = None
+        return context
+
+
+    @property
+    def buckets(self) -> List[Bucket]:
+        """
+        Return: List[Bucket]
+            the buckets of the context, they read and write their volume in the state.
+        """
+        if self._buckets is None:
+            self._buckets = [BucketView(self, index) for index in range(len(self.layout))]
+        return self._buckets
+
+
+    @property
+    def history(self) -> List[str]:
+        """
+        Return: List[str]
+            the history of the previous actions of the context, 
+            built by walking up the parents of the context. In a search
+            reduced by symmetry, the moves are the ones of the canonical
+            parents, Director.path_to gives the moves on the buckets.
+        """
+        moves = []
+        context = self
+        while context is not None:
+            if context.move is not None:
+                moves.append(context.move)
+            context = context.parent
+
+        names = self.layout.names
+        return [Action.describe_move(move, names) for move in reversed(moves)]
     
 
     def __eq__(self, context: 'Context') -> bool:
@@ -53,12 +155,7 @@ class Context:
         if not isinstance(context, Context):
             raise TypeError(f"the context type is expected but type {type(context)} is given")
 
-        return all(
-            bucket_current_context == bucket_other_context
-            for bucket_current_context, bucket_other_context in zip(
-                self.buckets, context.buckets
-            )
-        )
+        return self.state == context.state and self.layout == context.layout
 
 
     def get_bucket(self, target_bucket: Bucket) -> Union[Bucket, None]:
@@ -73,9 +170,21 @@ class Context:
         Returns:
             The bucket that matches the target bucket.
         """
-        return next(
-            (bucket for bucket in self.buckets if target_bucket == bucket), None
-        )
+        if isinstance(target_bucket, BucketView) and target_bucket.context.layout is self.layout:
+            indexes = (target_bucket.index,)
+        else:
+            indexes = self.layout.indexes_of(target_bucket.name)
+
+        capacities = self.layout.capacities
+        volumes = self.state.volumes
+
+        for index in indexes:
+            if (
+                capacities[index] == target_bucket.max_volume 
+                and volumes[index] == target_bucket.current_volume
+            ):
+                return self._buckets[index] if self._buckets is not None else BucketView(self, index)
+        return None
 
 
     def contains_bucket(self, target_bucket: Bucket) -> bool:
@@ -105,19 +214,55 @@ class Context:
         Return: List[Context]
             A list of contexts that have been created from this action.
         """
-        return action.execute(self.clone(), on_bucket)
-    
+        return action.execute(self.derive(), on_bucket)
+
+
+    def revert_action(self, action: Action, on_bucket: Bucket) -> List['Context']:
+        """
+        Given an action, return the contexts who lead to the current one with this action
+        
+        Parameters:
+            action: Action
+                The action that we want to revert
+            on_bucket: Bucket
+                The bucket who perform the action
+
+        Return: List[Context]
+            A list of contexts whose parent is the current one, their move leads to their parent.
+        """
+        return action.reverse(self, on_bucket)
+
+
+    def successors(self, applyable_actions: List[Action]) -> Iterator['Context']:
+        """
+        Yield the contexts obtained by the effective moves of the actions, in the order
+        of apply_action: by action, then by bucket. The moves who don't change the
+        volumes (draining an empty bucket, filling a full one, pouring from an empty
+        bucket or into a full one) don't create any context.
+
+        Parameters:
+            applyable_actions: List[Action]
+                the actions that we want to apply to the context
+
+        Return: Iterator[Context]
+            the contexts whose parent is the current one, their volumes differ from it.
+        """
+        indexes = range(len(self.layout))
+        for action in applyable_actions:
+            for index in indexes:
+                yield from action.successors(self, index)
+
 
     def __hash__(self):
         """
         The __hash__ method is called when we try to convert an object to a hash value. 
         In this case, we want to make sure that when we create a Stock object, 
-        the hash value is based on the list of bucket.
+        the hash value is based on the volumes of the buckets.
 
         Return: int
-            The hash value of the list of bucket.
+            The hash value of the state, computed once by the state.
         """
-        return hash(tuple(self.buckets))
+        return hash(self.state)
 
 
     def __str__(self):
@@ -138,11 +283,34 @@ class Context:
         Return: Context
             a new context object that is a clone of the current one.
         """
-        clone_context = Context([bucket.clone() for bucket in self.buckets])
-        clone_context.history = self.history.copy()
+        clone_context = Context.from_state(self.layout, self.state)
+        clone_context.parent = self.parent
+        clone_context.move = self.move
+        clone_context.depth = self.depth
         return clone_context
 
 
+    def derive(self, state: State = None, move: int = None) -> 'Context':
+        """
+        Return a new context object whose parent is the current one, 
+        the action applied on it has to record its move.
+
+        Parameters:
+            state: State (optional)
+                the volumes of the new context, the current ones by default
+            move: int (optional)
+                the move who leads from the current context to the new one
+
+        Return: Context
+            a new context object with the same buckets as the current one.
+        """
+        derived_context = Context.from_state(self.layout, self.state if state is None else state)
+        derived_context.parent = self
+        derived_context.move = move
+        derived_context.depth = self.depth + 1
+        return derived_context
+
+
     def get_representation(self) -> str:
         """
         Return a string representation of the buckets in the context
@@ -151,6 +319,8 @@ class Context:
             A string representation of the buckets of the context.
         """
         return "\n".join(
-            f"{bucket.name} = {bucket.current_volume} / {bucket.max_volume}" 
-            for bucket in self.buckets
+            f"{name} = {current_volume} / {max_volume}" 
+            for name, max_volume, current_volume in zip(
+                self.layout.names, self.layout.capacities, self.state.volumes
+            )
         )
@@ -1,9 +1,28 @@
 from src.models.actions.action import Action
 from src.models.context import Context
 from src.models.bucket import Bucket
-from graphviz import Digraph
-from typing import List, Union
-from os import getcwd, path
+from src.models.budget import SearchBudget
+from src.models.heuristics import Heuristic, default_heuristic
+from src.models.search_stats import SearchStats
+from src.models.state import State, StateTable
+from src.models.storage import MappedTable, read_table, write_table
+from src.models.symmetry import Symmetry
+from src.utils.metrics import observe_search
+from collections import deque
+from heapq import heappop, heappush
+from math import inf
+from threading import Lock
+from time import monotonic, perf_counter
+from typing import Callable, Dict, Iterator, List, Tuple, Union, TYPE_CHECKING
+from os import getcwd, makedirs, path
+
+if TYPE_CHECKING:
+    from graphviz import Digraph
+
+MONITOR_INTERVAL = 1024
+"""
+The number of contexts expanded between two calls of the monitor inside a level.
+"""
 
 
 class Director:
@@ -11,10 +30,37 @@ class Director:
     The Director class is used to generate a context cluster from a given context
 
     Attributes:
-        context_cluster: Set
-            the set that represent all the context possible.
+        context_cluster: Dict[Context, Context]
+            all the context possible, indexed by their state.
+        bucket_index: Dict[Tuple[str, int, int], List[Context]]
+            the contexts who contain a bucket, indexed by the name, the maximum 
+            volume and the current volume of the bucket, in discovery order.
         objectif: Union[Context, Bucket]
             the objectif you want to retrieve
+        solutions: List[Context]
+            the contexts who match the objectif, found by the solve method.
+        expanded: int
+            the number of contexts whose actions have been applied.
+        stats: SearchStats
+            the counters and the timers of generate: the expanded contexts, the 
+            successors, the duplicates, the high water mark of the queue and 
+            the time of each level.
+        table: StateTable
+            the contexts generated as columns by the numpy engine, the context 
+            cluster is built from it the first time it is used.
+        transitions: List[Tuple[Context, Context, int]]
+            every parent, successor and move found by generate when they are 
+            recorded, None otherwise.
+        symmetry: Symmetry
+            the interchangeable buckets when the search is reduced by symmetry, the 
+            contexts are then the canonical ones of their class, None otherwise.
+        complete: bool
+            False if the search of generate or of a solve method was stopped by its 
+            monitor or its budget before the end, or while the search of iter_generate 
+            is not over.
+        stop_reason: str
+            why the search was stopped: "cancelled" by the monitor or the limit of the 
+            budget exceeded, None if the search was not stopped.
 
     Methods:
         set_objectif(new_objectif: Union[Context, Bucket])
@@ -23,9 +69,45 @@ class Director:
         get_result()
             Find results from the objectif of the director.
 
+        is_objectif(context: Context)
+            True if the context matches the objectif of the director else False
+
+        iter_generate(initial_context: Context, applyable_actions: List[Action])
+            Generate the context cluster in the director one level at a time.
+
+        solve(initial_context: Context, applyable_actions: List[Action], objectif: Union[Context, Bucket])
+            Search the shortest contexts who match the objectif, stopping as soon as they are found.
+
+        solve_bidirectional(initial_context: Context, applyable_actions: List[Action], objectif: Context)
+            Search the shortest path to the objectif context from both ends at the same time.
+
+        solve_astar(initial_context: Context, applyable_actions: List[Action], objectif: Union[Context, Bucket])
+            Search the shortest context who match the objectif, guided by a heuristic.
+
         add_context(context: Context)
             Add a context to the director
 
+        load_table(table: StateTable)
+            Set the contexts of the director from a state table.
+
+        copy()
+            Return a director who shares the contexts of this one, without its objectif.
+
+        estimate_memory()
+            Return an estimation of the memory used by the contexts of the director.
+
+        to_table()
+            Return the contexts of the director as a state table.
+
+        save(file_path: str)
+            Write the contexts of the director in a binary file.
+
+        load(file_path: str)
+            Return a director whose contexts are read from a binary file.
+
+        close()
+            Close the file of a director read by load.
+
         find_context(target_context: Context)
             Given a target context, return the context in the context 
             cluster of the director that matches the target context.
@@ -38,14 +120,30 @@ class Director:
 
         context_exist(target_context: Context)
             True if the given context is in the context_cluster else False
+
+        path_to(context: Union[Context, Bucket])
+            Return the list of the actions who lead from the initial context to the context.
         
-        generate_graph_visualization(directory: str = path.join(getcwd(), "resources"))
+        generate_graph_visualization(directory: str = path.join(getcwd(), "resources"), all_transitions: bool = False)
             Generate a graph visualization of the context clusters.
+
+        write_dot(file_path: str = path.join(getcwd(), "resources", "graph.dot"))
+            Write the graph visualization of the context clusters in a DOT file.
     """ 
 
     def __init__(self) -> None:
-        self.context_cluster = set()
+        self._context_cluster = {}
+        self._bucket_index = {}
+        self.table = None
+        self._pending_table = None
+        self._pending_lock = Lock()
+        self.transitions = None
         self.objectif = None
+        self.solutions = []
+        self.stats = SearchStats()
+        self.symmetry = None
+        self.complete = True
+        self.stop_reason = None
 
 
     def set_objectif(self, new_objectif: Union[Context, Bucket]) -> None:
@@ -75,19 +173,288 @@ class Director:
         return [self.find_context(self.objectif)]
 
 
+    def is_objectif(self, context: Context) -> bool:
+        """
+        Parameters:
+            context: Context
+                the context to check
+
+        Returns: bool
+            True if the context matches the objectif of the director else False
+
+        Error:
+            ValueError:
+                if the objective is not set previously, raise an error.
+        """
+        if self.objectif is None:
+            raise ValueError("the goal was not set before")
+
+        if isinstance(self.objectif, Bucket):
+            return context.contains_bucket(self.objectif)
+        return context == self.objectif
+
+
+    @property
+    def expanded(self) -> int:
+        """
+        Return: int
+            the number of contexts whose actions have been applied, kept in the stats.
+        """
+        return self.stats.expanded
+
+
+    @expanded.setter
+    def expanded(self, expanded: int) -> None:
+        self.stats.expanded = expanded
+
+
+    @property
+    def context_cluster(self) -> Dict[Context, Context]:
+        """
+        Return: Dict[Context, Context]
+            all the context possible, indexed by their state.
+        """
+        if self._pending_table is not None:
+            self.__load_pending_table()
+        return self._context_cluster
+
+
+    @property
+    def bucket_index(self) -> Dict[Tuple[str, int, int], List[Context]]:
+        """
+        Return: Dict[Tuple[str, int, int], List[Context]]
+            the contexts who contain a bucket, in discovery order.
+        """
+        if self._pending_table is not None:
+            self.__load_pending_table()
+        return self._bucket_index
+
+
+    def load_table(self, table: StateTable) -> None:
+        """
+        Set the contexts of the director from a state table. The contexts 
+        are only built the first time the context cluster is used.
+
+        Parameters:
+            table: StateTable
+                the contexts as columns, in discovery order
+        """
+        self._context_cluster = {}
+        self._bucket_index = {}
+        self.table = table
+        self._pending_table = table
+
+
+    def copy(self) -> 'Director':
+        """
+        Return a director who shares the contexts of this one, without its objectif.
+        The contexts must not be modified, but the copy can set its own objectif.
+
+        Return: Director
+            the copy of the director.
+        """
+        director = Director()
+        director._context_cluster = self.context_cluster
+        director._bucket_index = self.bucket_index
+        director.table = self.table
+        director.transitions = self.transitions
+        director.stats = self.stats
+        director.symmetry = self.symmetry
+        director.complete = self.complete
+        director.stop_reason = self.stop_reason
+        return director
+
+
+    def estimate_memory(self) -> int:
+        """
+        Return an estimation of the memory used by the contexts of the director:
+        the context, its state and its volumes, its entry in the context cluster
+        and its entries in the bucket index. It is not measured, the cost of a 
+        context was measured once with tracemalloc on CPython 3.11 (290, 309 and 
+        316 bytes for 3, 4 and 5 buckets) and fitted to 240 + 16 bytes per bucket. 
+        The transitions and the stats are not counted.
+
+        Return: int
+            the estimated memory, in bytes.
+        """
+        size = len(self.table.layout) if self.table is not None else next(
+            (len(context.layout) for context in self._context_cluster), 0
+        )
+        return len(self) * (240 + 16 * size)
+
+
+    def to_table(self) -> StateTable:
+        """
+        Return the contexts of the director as a state table. The rows are 
+        ordered by depth, so the parent of a row is always before it.
+
+        Return: StateTable
+            the contexts as columns.
+
+        Error:
+            ValueError:
+                if the director has no context.
+        """
+        if self._pending_table is not None:
+            return self._pending_table
+        if not self._context_cluster:
+            raise ValueError("the director has no context")
+
+        contexts = sorted(self._context_cluster, key=lambda context: context.depth)
+        rows = {context: row for row, context in enumerate(contexts)}
+        return StateTable(
+            contexts[0].layout,
+            [context.state.volumes for context in contexts],
+            [rows[context.parent] if context.parent is not None else -1 for context in contexts],
+            [context.move if context.parent is not None else -1 for context in contexts]
+        )
+
+
+    def save(self, file_path: str) -> None:
+        """
+        Write the contexts of the director in a binary file, with their parents 
+        and their moves, and whether the search was complete and why it was 
+        stopped. The objectif and the transitions are not saved.
+
+        Parameters:
+            file_path: str
+                the path of the file, its directory is created if needed
+
+        Error:
+            ValueError:
+                if a name of a bucket is not a str.
+        """
+        directory = path.dirname(file_path)
+        if directory:
+            makedirs(directory, exist_ok=True)
+        write_table(self.to_table(), file_path, self.complete, self.stop_reason)
+
+
+    @classmethod
+    def load(cls, file_path: str) -> 'Director':
+        """
+        Return a director whose contexts are read from a binary file written by save.
+        The file is memory mapped, the contexts are only built the first time the 
+        context cluster is used, and the file is closed once they are built. The 
+        director is also a context manager who closes the file (see close).
+
+        Parameters:
+            file_path: str
+                the path of the file
+
+        Return: Director
+            the director of the saved contexts.
+
+        Error:
+            ValueError:
+                if the file is not a state table.
+        """
+        director = cls()
+        table = read_table(file_path)
+        director.load_table(table)
+        director.complete = table.complete
+        director.stop_reason = table.stop_reason
+        return director
+
+
+    def close(self) -> None:
+        """
+        Close the file of a director read by load. Its contexts are built first 
+        if they are not yet, so the director can still be used once it is closed.
+        """
+        self.__load_pending_table()
+
+
+    def __enter__(self) -> 'Director':
+        return self
+
+
+    def __exit__(self, *exception) -> None:
+        self.close()
+
+
+    def __load_pending_table(self) -> None:
+        """
+        Build the contexts of the pending table, with their parents and their moves,
+        then close the file of a table read by load.
+        A cached director is shared by several threads: the first one builds the 
+        contexts under the lock, in dictionaries of its own, and the table stops 
+        being pending only once they are complete, so the other threads either 
+        wait for the lock or see the whole context cluster.
+        """
+        with self._pending_lock:
+            table = self._pending_table
+            if table is None:
+                return
+
+            context_cluster, bucket_index = {}, {}
+            contexts = []
+            for volumes, parent, move in table.rows():
+                context = Context.from_state(table.layout, State(volumes))
+                if parent >= 0:
+                    context.parent = contexts[parent]
+                    context.move = move
+                    context.depth = context.parent.depth + 1
+                contexts.append(context)
+                self.__index_context(context, context_cluster, bucket_index)
+
+            self._context_cluster = context_cluster
+            self._bucket_index = bucket_index
+            self._pending_table = None
+            if isinstance(table, MappedTable):
+                table.close()
+
+
+    @staticmethod
+    def __index_context(
+        context: Context, 
+        context_cluster: Dict[Context, Context], 
+        bucket_index: Dict[Tuple[str, int, int], List[Context]]
+    ) -> None:
+        """
+        Add a context to a context cluster and index it by each of its buckets.
+
+        Parameters:
+            context: Context
+                the context to be added
+            context_cluster: Dict[Context, Context]
+                the contexts indexed by their state
+            bucket_index: Dict[Tuple[str, int, int], List[Context]]
+                the contexts indexed by their buckets
+        """
+        context_cluster[context] = context
+
+        for bucket in zip(context.layout.names, context.layout.capacities, context.state.volumes):
+            contexts = bucket_index.get(bucket)
+            if contexts is None:
+                bucket_index[bucket] = [context]
+            else:
+                contexts.append(context)
+
+
     def add_context(self, context: Context) -> None:
         """
-        Add a context to the director
+        Add a context to the director and index it by each of its buckets
         
         Parameters:
             context: Context
                 the context to be added to the director
         """
-        self.context_cluster.add(context)
+        self.__index_context(context, self.context_cluster, self._bucket_index)
     
 
     @classmethod
-    def generate(cls, initial_context: Context, applyable_actions: List[Action]) -> 'Director':
+    def generate(
+        cls, 
+        initial_context: Context, 
+        applyable_actions: List[Action], 
+        engine: str = "object",
+        workers: int = None,
+        record_transitions: bool = False,
+        monitor: Callable[['Director', int], bool] = None,
+        budget: SearchBudget = None,
+        symmetric: bool = False
+    ) -> 'Director':
         """
         Given an initial context and a list of actions, generate a context cluster
         
@@ -96,25 +463,459 @@ class Director:
                 The initial context to create the cluster
             applyable_actions: List[Action]
                 A list of actions that can evolve a contexte
+            engine: str (optional)
+                "object" to apply the actions context by context, "numpy" to apply 
+                them to a whole level of contexts at once with numpy arrays, "parallel"
+                to share each level between several processes, "dense" to search on 
+                the mixed-radix codes of the states with a bitset of the visited states
+            workers: int (optional)
+                the number of processes of the parallel engine, the number of cpu by default
+            record_transitions: bool (optional)
+                record every transition between two different contexts, not only 
+                the ones who discovered a context, only with the object engine
+            monitor: Callable[[Director, int], bool] (optional)
+                called with the director and the current depth before each level and 
+                regularly while a level is expanded (see iter_generate), the search stops 
+                and the director is not complete if it returns True, only with the object engine
+            budget: SearchBudget (optional)
+                the limits of the search, the director is not complete if one is 
+                exceeded, only with the object engine
+            symmetric: bool (optional)
+                keep one context per class of contexts who differ only by the volumes 
+                of interchangeable buckets, only with the object engine (see iter_generate)
         
         Return: Director
             A director class that represent the context cluster.
+
+        Error:
+            ValueError:
+                if the engine is unknown or if the transitions, the monitor, the 
+                budget or the symmetries cannot be used by the engine.
         """
         context_cluster = cls()
-        context_cluster.add_context(initial_context)
-        priority_file = [initial_context]
 
-        while priority_file:
-            current_context = priority_file.pop(0)
-            
-            for action in applyable_actions:
-                for bucket in current_context.buckets:
-                    for context in current_context.apply_action(action, bucket):
-                        if context not in context_cluster.context_cluster:
-                            context_cluster.add_context(context)
-                            priority_file.append(context)
-            
+        if record_transitions and engine != "object":
+            raise ValueError(f"the {engine} engine cannot record the transitions")
+        if (monitor is not None or budget is not None or symmetric) and engine != "object":
+            raise ValueError(f"the {engine} engine cannot use a monitor, a budget or the symmetries")
+
+        started_at = perf_counter()
+        if engine == "numpy":
+            from src.models.engines.vectorized import generate_table
+
+            context_cluster.load_table(generate_table(initial_context, applyable_actions))
+        elif engine == "parallel":
+            from src.models.engines.parallel import generate_table
+
+            context_cluster.load_table(generate_table(initial_context, applyable_actions, workers))
+        elif engine == "dense":
+            from src.models.engines.dense import generate_table
+
+            context_cluster.load_table(generate_table(initial_context, applyable_actions))
+        elif engine == "object":
+            for _ in context_cluster.iter_generate(
+                initial_context, applyable_actions, record_transitions, budget, symmetric, monitor
+            ):
+                pass
+        else:
+            raise ValueError(f"Unknown engine {engine}")
+
+        if context_cluster.table is not None:
+            context_cluster.expanded = len(context_cluster.table)
+            context_cluster.stats.duration = perf_counter() - started_at
+            observe_search(engine, context_cluster.stats.duration, len(context_cluster))
         return context_cluster
+
+
+    def iter_generate(
+        self,
+        initial_context: Context,
+        applyable_actions: List[Action],
+        record_transitions: bool = False,
+        budget: SearchBudget = None,
+        symmetric: bool = False,
+        monitor: Callable[['Director', int], bool] = None
+    ) -> Iterator[List[Context]]:
+        """
+        Generate the context cluster in the director one level at a time. Each level
+        is yielded once all its contexts are discovered, before they are expanded, so
+        the search can be paused, resumed later or stopped between two levels. The 
+        director is not complete until the generator is exhausted. The duration of
+        the search counts only the expansion of the levels, not the pauses, and it
+        is recorded in the metrics when the generator ends or is closed.
+
+        Parameters:
+            initial_context: Context
+                The initial context to create the cluster
+            applyable_actions: List[Action]
+                A list of actions that can evolve a contexte
+            record_transitions: bool (optional)
+                record every transition between two different contexts, not only 
+                the ones who discovered a context
+            budget: SearchBudget (optional)
+                the limits of the search, checked before each context is expanded, 
+                the generator stops and keeps the exceeded limit in stop_reason
+            symmetric: bool (optional)
+                the buckets who have the same capacity and the same initial volume are 
+                interchangeable, only the canonical context of each class is kept (the 
+                volumes of each group are sorted). The queries match any context of the 
+                class and path_to replays the moves to give them on the concrete buckets
+            monitor: Callable[[Director, int], bool] (optional)
+                called with the director and the current depth before each level and 
+                every MONITOR_INTERVAL expanded contexts, the generator stops with the 
+                stop_reason "cancelled" if it returns True
+
+        Return: Iterator[List[Context]]
+            the contexts of each level in discovery order, starting with the initial context.
+        """
+        self.complete = False
+        self.stop_reason = None
+        symmetry = self.symmetry = Symmetry(initial_context, applyable_actions) if symmetric else None
+        self.add_context(initial_context)
+        cluster = self.context_cluster
+        transitions = self.transitions = [] if record_transitions else None
+        level = [initial_context]
+        stats = self.stats
+        started_at = monotonic()
+
+        try:
+            while level:
+                if monitor is not None and monitor(self, level[0].depth):
+                    self.stop_reason = "cancelled"
+                    return
+                yield level
+
+                next_level = []
+                level_started_at = perf_counter()
+                try:
+                    for position, current_context in enumerate(level):
+                        if budget is not None:
+                            self.stop_reason = budget.exceeded(self, current_context.depth, monotonic() - started_at)
+                            if self.stop_reason is not None:
+                                return
+                        if monitor is not None and position % MONITOR_INTERVAL == MONITOR_INTERVAL - 1:
+                            if monitor(self, current_context.depth):
+                                self.stop_reason = "cancelled"
+                                return
+                        stats.expanded += 1
+
+                        successors = duplicates = 0
+                        for context in current_context.successors(applyable_actions):
+                            successors += 1
+                            if symmetry is not None:
+                                symmetry.canonicalize(context)
+                            known_context = cluster.get(context)
+                            if known_context is None:
+                                self.add_context(context)
+                                next_level.append(context)
+                                known_context = context
+                            else:
+                                duplicates += 1
+                            if transitions is not None and known_context is not current_context:
+                                transitions.append((current_context, known_context, context.move))
+
+                        stats.successors += successors
+                        stats.duplicates += duplicates
+                        waiting = len(level) - position - 1 + len(next_level)
+                        if waiting > stats.queue_high_water:
+                            stats.queue_high_water = waiting
+                finally:
+                    stats.level_times.append(perf_counter() - level_started_at)
+                    stats.duration += stats.level_times[-1]
+                level = next_level
+
+            self.complete = True
+        finally:
+            observe_search("object", stats.duration, len(self))
+
+
+    @classmethod
+    def solve(
+        cls, 
+        initial_context: Context, 
+        applyable_actions: List[Action], 
+        objectif: Union[Context, Bucket],
+        count: int = 1,
+        same_depth: bool = False,
+        budget: SearchBudget = None
+    ) -> 'Director':
+        """
+        Search the shortest contexts who match the objectif. Unlike generate, the search
+        stops as soon as the wanted contexts are dequeued instead of building the whole cluster.
+        
+        Parameters:
+            initial_context: Context
+                The initial context of the search
+            applyable_actions: List[Action]
+                A list of actions that can evolve a contexte
+            objectif: Union[Context, Bucket]
+                the objectif you want to retrieve
+            count: int (optional)
+                the number of matching contexts to collect, by increasing depth
+            same_depth: bool (optional)
+                collect every matching context at the minimal depth, count is then ignored
+            budget: SearchBudget (optional)
+                the limits of the search, checked before each context is expanded
+        
+        Return: Director
+            A director who contains the explored contexts and the matching 
+            contexts in its solutions, the solutions is empty if the objectif is 
+            unreachable or if the budget is exceeded before, it is then not complete.
+        """
+        director = cls()
+        director.set_objectif(objectif)
+        director.add_context(initial_context)
+        priority_file = deque([initial_context])
+        started_at = monotonic()
+
+        while priority_file:
+            current_context = priority_file.popleft()
+
+            if same_depth and director.solutions and current_context.depth > director.solutions[0].depth:
+                break
+            if budget is not None and director.__exceeds(budget, current_context.depth, started_at):
+                break
+
+            if director.is_objectif(current_context):
+                director.solutions.append(current_context)
+                if not same_depth and len(director.solutions) >= count:
+                    break
+
+            director.expanded += 1
+            for context in current_context.successors(applyable_actions):
+                if context not in director.context_cluster:
+                    director.add_context(context)
+                    priority_file.append(context)
+
+        return director
+
+
+    @classmethod
+    def solve_bidirectional(
+        cls, 
+        initial_context: Context, 
+        applyable_actions: List[Action], 
+        objectif: Context,
+        budget: SearchBudget = None
+    ) -> 'Director':
+        """
+        Search the shortest path to the objectif context from both ends at the same time:
+        forward from the initial context and backward from the objectif, with the 
+        reverse of the actions. The smallest frontier is expanded level by level until 
+        the two searches meet.
+        
+        Parameters:
+            initial_context: Context
+                The initial context of the search
+            applyable_actions: List[Action]
+                A list of actions that can evolve a contexte, they must be reversible
+            objectif: Context
+                the context you want to reach
+            budget: SearchBudget (optional)
+                the limits of the search, checked before each context is expanded, the 
+                depth is the one of the paths between the two frontiers and the contexts 
+                explored backward are not counted
+        
+        Return: Director
+            A director who contains the contexts explored forward and the objectif 
+            context in its solutions, the solutions is empty if the objectif is 
+            unreachable or if the budget is exceeded before, it is then not complete.
+        """
+        director = cls()
+        director.set_objectif(objectif)
+        director.add_context(initial_context)
+
+        if objectif.layout != initial_context.layout:
+            return director
+        if initial_context == objectif:
+            director.solutions.append(initial_context)
+            return director
+
+        goal_context = Context.from_state(initial_context.layout, objectif.state)
+        backward_cluster = {goal_context: goal_context}
+        forward_file, backward_file = [initial_context], [goal_context]
+        started_at = monotonic()
+
+        while forward_file and backward_file:
+            meetings = []
+            next_file = []
+            depth = forward_file[0].depth + backward_file[0].depth
+
+            if len(forward_file) <= len(backward_file):
+                for current_context in forward_file:
+                    if budget is not None and director.__exceeds(budget, depth, started_at):
+                        return director
+                    director.expanded += 1
+                    for context in current_context.successors(applyable_actions):
+                        if context not in director.context_cluster:
+                            director.add_context(context)
+                            next_file.append(context)
+                            if context in backward_cluster:
+                                meetings.append((context, backward_cluster[context]))
+                forward_file = next_file
+            else:
+                for current_context in backward_file:
+                    if budget is not None and director.__exceeds(budget, depth, started_at):
+                        return director
+                    director.expanded += 1
+                    for action in applyable_actions:
+                        for bucket in current_context.buckets:
+                            for context in current_context.revert_action(action, bucket):
+                                if context not in backward_cluster:
+                                    backward_cluster[context] = context
+                                    next_file.append(context)
+                                    if context in director.context_cluster:
+                                        meetings.append((director.context_cluster[context], context))
+                backward_file = next_file
+
+            if meetings:
+                forward_context, backward_context = min(
+                    meetings, 
+                    key=lambda meeting: meeting[0].depth + meeting[1].depth
+                )
+                director.solutions.append(director.__join_path(forward_context, backward_context))
+                break
+
+        return director
+
+
+    @classmethod
+    def solve_astar(
+        cls, 
+        initial_context: Context, 
+        applyable_actions: List[Action], 
+        objectif: Union[Context, Bucket],
+        heuristic: Heuristic = default_heuristic,
+        budget: SearchBudget = None
+    ) -> 'Director':
+        """
+        Search the shortest context who match the objectif with the A* algorithm: 
+        the contexts are expanded by increasing depth plus estimated remaining 
+        actions, so the search goes toward the objectif instead of exploring every 
+        context of a depth. The heuristics of src.models.heuristics are admissible 
+        and consistent, so the path found is the shortest one.
+        
+        Parameters:
+            initial_context: Context
+                The initial context of the search
+            applyable_actions: List[Action]
+                A list of actions that can evolve a contexte
+            objectif: Union[Context, Bucket]
+                the objectif you want to retrieve
+            heuristic: Heuristic (optional)
+                the lower bound of the number of actions to reach the objectif
+            budget: SearchBudget (optional)
+                the limits of the search, checked before each context is expanded, the 
+                contexts too deep are skipped and the search goes on with the others
+        
+        Return: Director
+            A director who contains the explored contexts and the matching context 
+            in its solutions, the solutions is empty if the objectif is unreachable 
+            or if the budget is exceeded before, it is then not complete.
+        """
+        director = cls()
+        director.set_objectif(objectif)
+        director.add_context(initial_context)
+
+        estimation = heuristic(initial_context, objectif)
+        priority_file = [] if estimation == inf else [(estimation, 0, initial_context)]
+        expanded_contexts = set()
+        counter = 1
+        started_at = monotonic()
+        too_deep = False
+
+        while priority_file:
+            _, _, current_context = heappop(priority_file)
+            if current_context in expanded_contexts:
+                continue
+
+            if director.is_objectif(current_context):
+                director.solutions.append(current_context)
+                break
+            if budget is not None and director.__exceeds(budget, current_context.depth, started_at):
+                if director.stop_reason != "max_depth":
+                    break
+                too_deep = True
+                continue
+
+            expanded_contexts.add(current_context)
+            director.expanded += 1
+
+            for context in current_context.successors(applyable_actions):
+                known_context = director.context_cluster.get(context)
+
+                if known_context is None:
+                    estimation = heuristic(context, objectif)
+                    if estimation == inf:
+                        continue
+                    director.add_context(context)
+                elif context.depth < known_context.depth and known_context not in expanded_contexts:
+                    known_context.parent = context.parent
+                    known_context.move = context.move
+                    known_context.depth = context.depth
+                    estimation = heuristic(known_context, objectif)
+                    context = known_context
+                else:
+                    continue
+
+                heappush(priority_file, (context.depth + estimation, counter, context))
+                counter += 1
+
+        if too_deep and not director.solutions and director.stop_reason is None:
+            director.stop_reason = "max_depth"
+            director.complete = False
+        return director
+
+
+    def __exceeds(self, budget: SearchBudget, depth: int, started_at: float) -> bool:
+        """
+        Check the budget of a solve method before a context is expanded, the director 
+        is not complete and keeps the exceeded limit in stop_reason if it is exceeded.
+
+        Parameters:
+            budget: SearchBudget
+                the limits of the search
+            depth: int
+                the depth of the context about to be expanded
+            started_at: float
+                the time.monotonic of the start of the search
+
+        Return: bool
+            True if the search must stop.
+        """
+        self.stop_reason = budget.exceeded(self, depth, monotonic() - started_at)
+        self.complete = self.stop_reason is None
+        return not self.complete
+
+
+    def __join_path(self, forward_context: Context, backward_context: Context) -> Context:
+        """
+        Extend the forward context with the moves of the backward context up to the objectif, 
+        the new contexts are added to the director.
+
+        Parameters:
+            forward_context: Context
+                the context reached by the forward search
+            backward_context: Context
+                the same context reached by the backward search
+
+        Return: Context
+            the objectif context, whose parents lead to the initial context.
+        """
+        context = forward_context
+        while backward_context.parent is not None:
+            next_context = context.derive()
+            next_context.state = backward_context.parent.state
+            next_context.move = backward_context.move
+
+            if next_context in self.context_cluster:
+                next_context = self.context_cluster[next_context]
+            else:
+                self.add_context(next_context)
+
+            context = next_context
+            backward_context = backward_context.parent
+        return context
     
 
     def find_context(self, target_context: Context) -> Union[Context, None]:
@@ -127,16 +928,15 @@ class Director:
                 The context we're looking for
         
         Returns: Union[Context, None]
-            The context that matches the target context.
+            The context that matches the target context, its canonical context 
+            when the search is reduced by symmetry.
         """
-        return next(
-            (
-                context
-                for context in self.context_cluster
-                if target_context == context
-            ),
-            None,
-        )
+        if self.symmetry is not None and target_context.layout == self.symmetry.layout:
+            target_context = Context.from_state(
+                target_context.layout, 
+                State(self.symmetry.canonical(target_context.state.volumes))
+            )
+        return self.context_cluster.get(target_context)
 
 
     def find_context_with_bucket(self, bucket: Bucket) -> Union[Context, None]:
@@ -148,16 +948,17 @@ class Director:
                 The bucket that we want to find the context for
         
         Returns: Union[Context, None]
-            The context that contains the bucket.
+            The first discovered context that contains the bucket, or an interchangeable 
+            bucket with the same volume when the search is reduced by symmetry.
         """
-        return next(
-            (
-                context
-                for context in self.context_cluster
-                if context.contains_bucket(bucket)
-            ),
-            None,
+        if self.symmetry is not None:
+            contexts = self.find_all_context_with_bucket(bucket)
+            return contexts[0] if contexts else None
+
+        contexts = self.bucket_index.get(
+            (bucket.name, bucket.max_volume, bucket.current_volume)
         )
+        return contexts[0] if contexts else None
     
 
     def find_all_context_with_bucket(self, bucket: Bucket) -> List[Context]:
@@ -169,13 +970,23 @@ class Director:
                 The bucket that we want to find in context.
         
         Returns: List[Context]
-            A list of contexts that contain the bucket.
+            A list of contexts that contain the bucket, in discovery order. When the 
+            search is reduced by symmetry, the contexts where an interchangeable bucket 
+            has the volume, by depth.
         """
-        return [
-            context
-            for context in self.context_cluster
-            if context.contains_bucket(bucket)
-        ]
+        if self.symmetry is None:
+            return list(self.bucket_index.get(
+                (bucket.name, bucket.max_volume, bucket.current_volume), ()
+            ))
+
+        layout = self.symmetry.layout
+        contexts = {}
+        for index in layout.indexes_of(bucket.name):
+            for other_index in self.symmetry.group_of(index):
+                contexts.update(dict.fromkeys(self.bucket_index.get(
+                    (layout.names[other_index], bucket.max_volume, bucket.current_volume), ()
+                )))
+        return sorted(contexts, key=lambda context: context.depth)
 
 
     def context_exist(self, target_context: Context) -> bool:
@@ -186,50 +997,282 @@ class Director:
         return self.find_context(target_context) is not None
     
 
+    def path_to(self, context: Union[Context, Bucket]) -> Union[List[str], None]:
+        """
+        Return the list of the actions who lead from the initial context to the context.
+        The path is built from the parents of the context only when it is asked. When 
+        the search is reduced by symmetry, the moves of the canonical contexts are 
+        replayed to lead exactly to the given context, with the names of its buckets.
+
+        Parameters:
+            context: Union[Context, Bucket]
+                the context we want to reach, or a bucket to reach the first context who contains it
+
+        Returns: Union[List[str], None]
+            the traces of the actions, or None if the context is not in the context cluster.
+        """
+        if isinstance(context, Bucket):
+            found_context = self.find_context_with_bucket(context)
+            if found_context is None or self.symmetry is None:
+                return found_context.history if found_context is not None else None
+
+            volumes = list(found_context.state.volumes)
+            layout = self.symmetry.layout
+            index, other_index = next(
+                (index, other_index)
+                for index in layout.indexes_of(context.name) if layout.capacities[index] == context.max_volume
+                for other_index in self.symmetry.group_of(index) if volumes[other_index] == context.current_volume
+            )
+            volumes[index], volumes[other_index] = volumes[other_index], volumes[index]
+            return self.symmetry.concrete_history(found_context, volumes)
+
+        found_context = self.find_context(context)
+        if found_context is None or self.symmetry is None:
+            return found_context.history if found_context is not None else None
+        return self.symmetry.concrete_history(found_context, context.state.volumes)
+
+
+    def __len__(self) -> int:
+        """
+        Return: int
+            the number of contexts of the director, without building a pending table.
+        """
+        if self._pending_table is not None:
+            return len(self._pending_table)
+        return len(self._context_cluster)
+
+
     def __str__(self) -> str:
         """
         The function is used to cast the object in string
 
         Return: str
-            a string that represents the Director object.
+            a string that represents the Director object, the paths of the
+            contexts of a search reduced by symmetry are the ones of path_to.
         """
-        return "\n==================\n".join(str(context) for context in self.context_cluster)
+        if self.symmetry is None:
+            return "\n==================\n".join(str(context) for context in self.context_cluster)
+
+        return "\n==================\n".join(
+            "\n".join(f"{bucket.name} -> {bucket}" for bucket in context.buckets)
+            + "\npath to obtain this context: " + " -> ".join(self.path_to(context))
+            for context in self.context_cluster
+        )
 
 
-    def generate_graph_visualization(self, directory: str = path.join(getcwd(), "resources")) -> Digraph:
+    def __graph_elements(
+        self, 
+        all_transitions: bool = False, 
+        mode: str = "full", 
+        max_depth: int = None, 
+        max_nodes: int = None
+    ) -> Iterator[Tuple]:
         """
-        Generate a graph visualization of the context clusters.
+        Yield the nodes, then the edges, of the graph visualization. The nodes are 
+        identified by their discovery order and labelled with their representation.
+        The contexts hidden by the mode are dropped or gathered in summary nodes.
+
+        Parameters:
+            all_transitions: bool (optional)
+                use every transition recorded by generate instead of only the 
+                edges who discovered each context
+            mode: str (optional)
+                "full" for every context, "shortest_path" for the paths from the 
+                initial context to the objectif contexts, "depth" to gather the 
+                contexts deeper than max_depth by level, "cap" to gather the 
+                contexts after the first max_nodes
+            max_depth: int (optional)
+                the deepest level drawn in the "depth" mode
+            max_nodes: int (optional)
+                the number of contexts drawn in the "cap" mode
+
+        Yields: Tuple
+            ("node", node_id, attributes) or ("edge", tail_id, head_id, attributes).
+
+        Error:
+            ValueError:
+                if the mode is unknown or misses its parameter, or if all the 
+                transitions are asked but they were not recorded.
+        """
+        if all_transitions and self.transitions is None:
+            raise ValueError("the transitions were not recorded, generate the director with record_transitions=True")
+        if mode not in ("full", "shortest_path", "depth", "cap"):
+            raise ValueError(f"Unknown mode {mode}")
+        if (mode == "depth" and max_depth is None) or (mode == "cap" and max_nodes is None):
+            raise ValueError(f"the {mode} mode needs its {'max_depth' if mode == 'depth' else 'max_nodes'} parameter")
+
+        objectif_context = (
+            {context for context in self.get_result() if context is not None}
+            if self.objectif is not None else set()
+        )
+
+        shortest_path_context = set()
+        if mode == "shortest_path":
+            for context in objectif_context:
+                while context is not None and context not in shortest_path_context:
+                    shortest_path_context.add(context)
+                    context = context.parent
+
+        node_ids = {}
+        summaries = {}
+
+        for node_id, context in enumerate(self.context_cluster):
+            if mode == "shortest_path" and context not in shortest_path_context:
+                continue
+
+            if mode == "depth" and context.depth > max_depth:
+                summary_id = f"depth_{context.depth}"
+            elif mode == "cap" and node_id >= max_nodes:
+                summary_id = "others"
+            else:
+                node_ids[context] = str(node_id)
+                color = ("red" if context in objectif_context else "black") if context.parent is not None else "blue"
+                yield ("node", str(node_id), {"label": context.get_representation(), "color": color})
+                continue
+
+            node_ids[context] = summary_id
+            summary = summaries.setdefault(summary_id, [0, False])
+            summary[0] += 1
+            summary[1] = summary[1] or context in objectif_context
+
+        for summary_id, (count, contains_objectif) in summaries.items():
+            yield ("node", summary_id, {
+                "label": (
+                    f"{count} contexts at depth {summary_id[len('depth_'):]}" 
+                    if summary_id.startswith("depth_") else f"{count} other contexts"
+                ),
+                "color": "red" if contains_objectif else "gray",
+                "style": "dashed"
+            })
+
+        if all_transitions:
+            edges = self.transitions
+        else:
+            edges = (
+                (context.parent, context, context.move)
+                for context in self.context_cluster
+                if context.parent is not None
+            )
+
+        summary_edges = set()
+        for parent, context, move in edges:
+            tail_id, head_id = node_ids.get(parent), node_ids.get(context)
+            if tail_id is None or head_id is None or tail_id == head_id:
+                continue
+
+            if tail_id in summaries or head_id in summaries:
+                if (tail_id, head_id) not in summary_edges:
+                    summary_edges.add((tail_id, head_id))
+                    yield ("edge", tail_id, head_id, {"style": "dashed"})
+            elif move is None:
+                yield ("edge", tail_id, head_id, {"label": ""})
+            elif self.symmetry is not None:
+                yield ("edge", tail_id, head_id, {"label": self.symmetry.describe_edge(parent, context, move)})
+            else:
+                yield ("edge", tail_id, head_id, {"label": Action.describe_move(move, context.layout.names)})
+
+
+    def generate_graph_visualization(
+        self, 
+        directory: str = path.join(getcwd(), "resources"), 
+        all_transitions: bool = False,
+        mode: str = "full", 
+        max_depth: int = None, 
+        max_nodes: int = None
+    ) -> 'Digraph':
+        """
+        Generate a graph visualization of the context clusters. The nodes are 
+        identified by their discovery order and labelled with their representation, 
+        so the graph is built in a time linear in the number of contexts and edges.
         
         Parameters
             directory: str (optional)
                 the directory where the graph will be saved
+            all_transitions: bool (optional)
+                draw every transition recorded by generate instead of only the 
+                edges who discovered each context
+            mode: str (optional)
+                "full", "shortest_path", "depth" or "cap", to draw only a part of 
+                large graphs (see write_dot)
+            max_depth: int (optional)
+                the deepest level drawn in the "depth" mode
+            max_nodes: int (optional)
+                the number of contexts drawn in the "cap" mode
+
+        Error:
+            ValueError:
+                if the mode is unknown or misses its parameter, or if all the 
+                transitions are asked but they were not recorded.
         """
+        from graphviz import Digraph
+
         dot = Digraph(
             filename="graph", 
             directory=directory
         )
 
-        sorted_context_by_history = sorted(self.context_cluster, key=lambda context: len(context.history))
-        objectif_context = self.get_result() if self.objectif is not None else []
+        for element in self.__graph_elements(all_transitions, mode, max_depth, max_nodes):
+            if element[0] == "node":
+                dot.node(element[1], **element[2])
+            else:
+                dot.edge(element[1], element[2], **element[3])
 
-        for context in sorted_context_by_history:        
-            color = ("red" if context in objectif_context else "black") if context.history else "blue"
+        return dot
 
-            dot.node(
-                context.get_representation(),
-                color = color
+
+    def write_dot(
+        self, 
+        file_path: str = path.join(getcwd(), "resources", "graph.dot"), 
+        all_transitions: bool = False,
+        mode: str = "full", 
+        max_depth: int = None, 
+        max_nodes: int = None
+    ) -> str:
+        """
+        Write the graph visualization of the context clusters in a DOT file, 
+        line by line, without building the whole graph in memory.
+
+        Parameters:
+            file_path: str (optional)
+                the path of the DOT file
+            all_transitions: bool (optional)
+                draw every transition recorded by generate instead of only the 
+                edges who discovered each context
+            mode: str (optional)
+                "full" for every context, "shortest_path" for the paths from the 
+                initial context to the objectif contexts, "depth" to gather the 
+                contexts deeper than max_depth by level, "cap" to gather the 
+                contexts after the first max_nodes
+            max_depth: int (optional)
+                the deepest level drawn in the "depth" mode
+            max_nodes: int (optional)
+                the number of contexts drawn in the "cap" mode
+
+        Return: str
+            the path of the DOT file.
+
+        Error:
+            ValueError:
+                if the mode is unknown or misses its parameter, or if all the 
+                transitions are asked but they were not recorded.
+        """
+        def attributes(values: Dict[str, str]) -> str:
+            return " ".join(
+                f'{key}="' + value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+                for key, value in values.items()
             )
 
-        for first_context in sorted_context_by_history:
-            for second_context in sorted_context_by_history:
-                if (
-                    len(first_context.history) == len(second_context.history) - 1
-                    and first_context.history == second_context.history[:-1]
-                ):
-                    dot.edge(
-                        first_context.get_representation(),
-                        second_context.get_representation(),
-                        label=second_context.history[-1]
-                    )
+        directory = path.dirname(file_path)
+        if directory:
+            makedirs(directory, exist_ok=True)
 
-        return dot
+        with open(file_path, "w", encoding="utf-8") as dot_file:
+            dot_file.write("digraph {\n")
+            for element in self.__graph_elements(all_transitions, mode, max_depth, max_nodes):
+                if element[0] == "node":
+                    dot_file.write(f"\t{element[1]} [{attributes(element[2])}]\n")
+                else:
+                    dot_file.write(f"\t{element[1]} -> {element[2]} [{attributes(element[3])}]\n")
+            dot_file.write("}\n")
+
+        return file_path
@@ -0,0 +1,213 @@
+from src.models.actions.action import Action
+from src.models.actions.drain import Drain
+from src.models.actions.fill import Fill
+from src.models.actions.pour import Pour
+from src.models.context import Context
+from src.models.state import StateTable
+from array import array
+from typing import Iterator, List, Sequence, Tuple
+
+DENSE_LIMIT = 2 ** 30
+"""
+The maximum number of states of a puzzle for the bitset of the visited contexts,
+2 ** 30 states take 128 MB. Above it, the visited contexts are kept in a set.
+"""
+
+
+class MixedRadix:
+    """
+    A class that represent the numbering of the states of a puzzle. The volume of
+    the bucket i is a digit in base capacity_i + 1, so each state has a unique code
+    between 0 and the number of states.
+
+    Attributes:
+        capacities: Tuple[int, ...]
+            the maximum volumes of the buckets.
+        radixes: Tuple[int, ...]
+            the weight of the volume of each bucket in the code.
+        states: int
+            the number of possible states.
+
+    Methods:
+        encode(volumes: Sequence[int])
+            Return the code of the volumes.
+
+        decode(code: int)
+            Return the volumes of the code.
+    """
+
+    def __init__(self, capacities: Sequence[int]) -> None:
+        """
+        Parameters:
+            capacities: Sequence[int]
+                the maximum volumes of the buckets
+        """
+        self.capacities = tuple(capacities)
+
+        radixes, states = [], 1
+        for capacity in self.capacities:
+            radixes.append(states)
+            states *= capacity + 1
+        self.radixes = tuple(radixes)
+        self.states = states
+
+
+    def encode(self, volumes: Sequence[int]) -> int:
+        """
+        Return the code of the volumes.
+
+        Parameters:
+            volumes: Sequence[int]
+                the volumes of the buckets
+
+        Return: int
+            the code of the volumes.
+
+        Error:
+            ValueError:
+                if a volume is out of its bucket, its code would be the one of another state.
+        """
+        for volume, capacity in zip(volumes, self.capacities):
+            if not 0 <= volume <= capacity:
+                raise ValueError(f"the volume {volume} is not between 0 and the capacity {capacity}")
+        return sum(volume * radix for volume, radix in zip(volumes, self.radixes))
+
+
+    def decode(self, code: int) -> Tuple[int, ...]:
+        """
+        Return the volumes of the code.
+
+        Parameters:
+            code: int
+                the code of the volumes
+
+        Return: Tuple[int, ...]
+            the volumes of the buckets.
+        """
+        volumes = []
+        for capacity in self.capacities:
+            code, volume = divmod(code, capacity + 1)
+            volumes.append(volume)
+        return tuple(volumes)
+
+
+class DenseVolumes:
+    """
+    A class that represent the volumes column of a state table as the codes of
+    the states, the volumes are decoded when they are read.
+
+    Attributes:
+        codes: Sequence[int]
+            the code of each row.
+        radix: MixedRadix
+            the numbering of the states.
+    """
+
+    def __init__(self, codes: Sequence[int], radix: MixedRadix) -> None:
+        """
+        Parameters:
+            codes: Sequence[int]
+                the code of each row
+            radix: MixedRadix
+                the numbering of the states
+        """
+        self.codes = codes
+        self.radix = radix
+
+
+    def __getitem__(self, row: int) -> Tuple[int, ...]:
+        return self.radix.decode(self.codes[row])
+
+
+    def __iter__(self) -> Iterator[Tuple[int, ...]]:
+        return map(self.radix.decode, self.codes)
+
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+def generate_table(initial_context: Context, applyable_actions: List[Action]) -> StateTable:
+    """
+    Generate every context reachable from the initial context on the codes of
+    the states. The visited contexts are a bitset indexed by code, the parents
+    are an int32 array and the moves an uint8 array when they fit, so a context
+    costs a few bytes instead of a Context object. When the puzzle has more
+    than DENSE_LIMIT states, the bitset is replaced by a set of codes.
+
+    Parameters:
+        initial_context: Context
+            the initial context of the search
+        applyable_actions: List[Action]
+            the actions that can evolve a context, only Drain, Fill and Pour are supported
+
+    Return: StateTable
+        the contexts in the same discovery order as the object engine, the
+        move of the initial context is 0 since the moves are unsigned.
+
+    Error:
+        ValueError:
+            if an action is not supported by the engine or if a volume of the 
+            initial context is out of its bucket.
+    """
+    for action in applyable_actions:
+        if not isinstance(action, (Drain, Fill, Pour)):
+            raise ValueError(f"the action {action} is not supported by the dense engine")
+
+    layout = initial_context.layout
+    size = len(layout)
+    radix = MixedRadix(layout.capacities)
+    capacities, radixes = radix.capacities, radix.radixes
+
+    moves = []
+    for action in applyable_actions:
+        for on_bucket in range(size):
+            if isinstance(action, Pour):
+                moves.extend(
+                    (action.code, action.encode_move(size, on_bucket, target_bucket), on_bucket, target_bucket)
+                    for target_bucket in range(size) if target_bucket != on_bucket
+                )
+            else:
+                moves.append((action.code, action.encode_move(size, on_bucket), on_bucket, on_bucket))
+
+    initial_code = radix.encode(initial_context.state.volumes)
+    codes = array("q", [initial_code]) if radix.states < 2 ** 63 else [initial_code]
+    parents = array("i", [-1])
+    table_moves = array("B" if 3 * size * size <= 256 else "H" if 3 * size * size <= 2 ** 16 else "i", [0])
+
+    dense = radix.states <= DENSE_LIMIT
+    if dense:
+        visited = bytearray((radix.states + 7) // 8)
+        visited[initial_code >> 3] |= 1 << (initial_code & 7)
+    else:
+        visited = {initial_code}
+
+    row = 0
+    while row < len(codes):
+        code = codes[row]
+        volumes = radix.decode(code)
+
+        for action_code, move, on_bucket, target_bucket in moves:
+            if action_code == Drain.code:
+                new_code = code - volumes[on_bucket] * radixes[on_bucket]
+            elif action_code == Fill.code:
+                new_code = code + (capacities[on_bucket] - volumes[on_bucket]) * radixes[on_bucket]
+            else:
+                poured_volume = min(volumes[on_bucket], capacities[target_bucket] - volumes[target_bucket])
+                new_code = code + poured_volume * (radixes[target_bucket] - radixes[on_bucket])
+
+            if dense:
+                if visited[new_code >> 3] & (1 << (new_code & 7)):
+                    continue
+                visited[new_code >> 3] |= 1 << (new_code & 7)
+            else:
+                if new_code in visited:
+                    continue
+                visited.add(new_code)
+
+            codes.append(new_code)
+            parents.append(row)
+            table_moves.append(move)
+        row += 1
+
+    return StateTable(layout, DenseVolumes(codes, radix), parents, table_moves)
@@ -0,0 +1,231 @@
+from src.models.actions.action import Action
+from src.models.actions.drain import Drain
+from src.models.actions.fill import Fill
+from src.models.actions.pour import Pour
+from src.models.context import Context
+from src.models.state import StateTable
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection
+from os import cpu_count
+from typing import List, Tuple
+
+Move = Tuple[int, int, int, int]
+"""
+The code of the action, the move, the index of the bucket who perform
+the action and the index of the target bucket.
+"""
+
+Candidate = Tuple[Tuple[int, ...], int, int, int]
+"""
+The volumes of a new context, the index of its parent, its rank among the
+successors of its parent and the move who leads to it.
+"""
+
+
+def _moves_of(applyable_actions: List[Action], size: int) -> List[Move]:
+    """
+    List the moves in the same order as the object engine: by action, then by bucket, then by target.
+
+    Parameters:
+        applyable_actions: List[Action]
+            the actions that can evolve a context
+        size: int
+            the number of buckets
+
+    Return: List[Move]
+        the moves.
+    """
+    moves = []
+    for action in applyable_actions:
+        for on_bucket in range(size):
+            if isinstance(action, Pour):
+                moves.extend(
+                    (action.code, action.encode_move(size, on_bucket, target_bucket), on_bucket, target_bucket)
+                    for target_bucket in range(size) if target_bucket != on_bucket
+                )
+            else:
+                moves.append((action.code, action.encode_move(size, on_bucket), on_bucket, on_bucket))
+    return moves
+
+
+def _successors(volumes: Tuple[int, ...], capacities: Tuple[int, ...], moves: List[Move]) -> List[Tuple[int, int, Tuple[int, ...]]]:
+    """
+    Apply every move to the volumes.
+
+    Parameters:
+        volumes: Tuple[int, ...]
+            the volumes of the context
+        capacities: Tuple[int, ...]
+            the maximum volumes of the buckets
+        moves: List[Move]
+            the moves to apply
+
+    Return: List[Tuple[int, int, Tuple[int, ...]]]
+        the rank of the move, the move and the new volumes, for the moves who change the volumes.
+    """
+    successors = []
+    for rank, (code, move, on_bucket, target_bucket) in enumerate(moves):
+        new_volumes = list(volumes)
+        if code == Drain.code:
+            new_volumes[on_bucket] = 0
+        elif code == Fill.code:
+            new_volumes[on_bucket] = capacities[on_bucket]
+        else:
+            poured_volume = min(volumes[on_bucket], capacities[target_bucket] - volumes[target_bucket])
+            new_volumes[on_bucket] -= poured_volume
+            new_volumes[target_bucket] += poured_volume
+
+        new_volumes = tuple(new_volumes)
+        if new_volumes != volumes:
+            successors.append((rank, move, new_volumes))
+    return successors
+
+
+def _work(connection: Connection, capacities: Tuple[int, ...], moves: List[Move], workers: int) -> None:
+    """
+    The loop of a worker process. The worker owns the visited contexts whose hash
+    falls in its shard and the part of the frontier made of these contexts.
+
+    Commands:
+        ("seed", volumes)
+            add the initial context to the shard and to the frontier.
+        ("expand", indexes)
+            receive the global indexes of the frontier and send back the
+            successors of the frontier, grouped by the shard who owns them.
+        ("dedupe", candidates)
+            keep the candidates who were not visited, the first one in
+            discovery order for each context, and send them back.
+        ("stop",)
+            stop the worker.
+
+    Parameters:
+        connection: Connection
+            the connection with the main process
+        capacities: Tuple[int, ...]
+            the maximum volumes of the buckets
+        moves: List[Move]
+            the moves to apply
+        workers: int
+            the number of workers
+    """
+    visited = set()
+    frontier = []
+
+    while True:
+        command, *arguments = connection.recv()
+
+        if command == "seed":
+            visited.add(arguments[0])
+            frontier = [arguments[0]]
+
+        elif command == "expand":
+            batches = [[] for _ in range(workers)]
+            for volumes, index in zip(frontier, arguments[0]):
+                for rank, move, new_volumes in _successors(volumes, capacities, moves):
+                    batches[hash(new_volumes) % workers].append((new_volumes, index, rank, move))
+            connection.send(batches)
+
+        elif command == "dedupe":
+            candidates = sorted(arguments[0], key=lambda candidate: (candidate[1], candidate[2]))
+            new_candidates = []
+            for candidate in candidates:
+                if candidate[0] not in visited:
+                    visited.add(candidate[0])
+                    new_candidates.append(candidate)
+            frontier = [candidate[0] for candidate in new_candidates]
+            connection.send(new_candidates)
+
+        else:
+            connection.close()
+            return
+
+
+def generate_table(initial_context: Context, applyable_actions: List[Action], workers: int = None) -> StateTable:
+    """
+    Generate every context reachable from the initial context with a pool of
+    processes, one level of the breadth first search at a time. Each worker
+    owns a shard of the visited contexts, it expands its part of the level and
+    the new contexts are exchanged in batches between the levels. The contexts
+    are numbered in the same discovery order as the serial search.
+
+    Parameters:
+        initial_context: Context
+            the initial context of the search
+        applyable_actions: List[Action]
+            the actions that can evolve a context, only Drain, Fill and Pour are supported
+        workers: int (optional)
+            the number of processes, the number of cpu by default
+
+    Return: StateTable
+        the contexts in the same discovery order as the serial search.
+
+    Error:
+        ValueError:
+            if an action is not supported or if the number of workers is not positive.
+    """
+    for action in applyable_actions:
+        if not isinstance(action, (Drain, Fill, Pour)):
+            raise ValueError(f"the action {action} is not supported by the parallel engine")
+
+    if workers is None:
+        workers = cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"the number of workers must be positive, {workers} is given")
+
+    layout = initial_context.layout
+    initial_volumes = initial_context.state.volumes
+    moves = _moves_of(applyable_actions, len(layout))
+
+    connections, processes = [], []
+    try:
+        for _ in range(workers):
+            connection, worker_connection = Pipe()
+            process = Process(
+                target=_work,
+                args=(worker_connection, layout.capacities, moves, workers),
+                daemon=True
+            )
+            process.start()
+            connections.append(connection)
+            processes.append(process)
+
+        initial_shard = hash(initial_volumes) % workers
+        connections[initial_shard].send(("seed", initial_volumes))
+
+        volumes, parents, table_moves = [initial_volumes], [-1], [-1]
+        frontier_indexes = [[] for _ in range(workers)]
+        frontier_indexes[initial_shard] = [0]
+
+        while any(frontier_indexes):
+            for connection, indexes in zip(connections, frontier_indexes):
+                connection.send(("expand", indexes))
+            batches = [connection.recv() for connection in connections]
+
+            for shard, connection in enumerate(connections):
+                connection.send(("dedupe", [
+                    candidate for worker_batches in batches for candidate in worker_batches[shard]
+                ]))
+            new_candidates = [connection.recv() for connection in connections]
+
+            discovered = sorted(
+                (candidate[1], candidate[2], shard, position)
+                for shard, candidates in enumerate(new_candidates)
+                for position, candidate in enumerate(candidates)
+            )
+            frontier_indexes = [[0] * len(candidates) for candidates in new_candidates]
+            for _, _, shard, position in discovered:
+                new_volumes, parent, _, move = new_candidates[shard][position]
+                frontier_indexes[shard][position] = len(volumes)
+                volumes.append(new_volumes)
+                parents.append(parent)
+                table_moves.append(move)
+
+        for connection in connections:
+            connection.send(("stop",))
+    finally:
+        for process in processes:
+            process.join(timeout=1)
+            if process.is_alive():
+                process.terminate()
+
+    return StateTable(layout, volumes, parents, table_moves)
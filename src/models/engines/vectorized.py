@@ -0,0 +1,128 @@
+from src.models.actions.action import Action
+from src.models.actions.drain import Drain
+from src.models.actions.fill import Fill
+from src.models.actions.pour import Pour
+from src.models.context import Context
+from src.models.state import StateTable
+from typing import List, Tuple
+import numpy as np
+
+
+def _successor_blocks(
+    frontier: np.ndarray,
+    capacities: np.ndarray,
+    applyable_actions: List[Action]
+) -> Tuple[List[np.ndarray], List[int]]:
+    """
+    Apply every action on every bucket to the whole frontier, in the same
+    order as the object engine: by action, then by bucket, then by target.
+
+    Parameters:
+        frontier: np.ndarray
+            the volumes of the contexts of the level, one row per context
+        capacities: np.ndarray
+            the maximum volumes of the buckets
+        applyable_actions: List[Action]
+            the actions that can evolve a context
+
+    Return: Tuple[List[np.ndarray], List[int]]
+        the volumes obtained by each move, with the same rows as the frontier, and the moves.
+    """
+    size = len(capacities)
+    blocks, moves = [], []
+
+    for action in applyable_actions:
+        for on_bucket in range(size):
+            if isinstance(action, Drain) or isinstance(action, Fill):
+                block = frontier.copy()
+                block[:, on_bucket] = 0 if isinstance(action, Drain) else capacities[on_bucket]
+                blocks.append(block)
+                moves.append(action.encode_move(size, on_bucket))
+                continue
+
+            for target_bucket in range(size):
+                if target_bucket == on_bucket:
+                    continue
+                poured_volumes = np.minimum(
+                    frontier[:, on_bucket],
+                    capacities[target_bucket] - frontier[:, target_bucket]
+                )
+                block = frontier.copy()
+                block[:, on_bucket] -= poured_volumes
+                block[:, target_bucket] += poured_volumes
+                blocks.append(block)
+                moves.append(action.encode_move(size, on_bucket, target_bucket))
+
+    return blocks, moves
+
+
+def generate_table(initial_context: Context, applyable_actions: List[Action]) -> StateTable:
+    """
+    Generate every context reachable from the initial context, one level of the
+    breadth first search at a time. A level is a 2-D array (contexts x buckets),
+    the actions are applied to the whole level at once and the new contexts are
+    deduplicated in bulk against the sorted keys of the visited contexts.
+
+    Parameters:
+        initial_context: Context
+            the initial context of the search
+        applyable_actions: List[Action]
+            the actions that can evolve a context, only Drain, Fill and Pour are supported
+
+    Return: StateTable
+        the contexts in the same discovery order as the object engine.
+
+    Error:
+        ValueError:
+            if an action is not supported or if the states cannot be encoded in 64 bits.
+    """
+    for action in applyable_actions:
+        if not isinstance(action, (Drain, Fill, Pour)):
+            raise ValueError(f"the action {action} is not supported by the numpy engine")
+
+    layout = initial_context.layout
+    capacities = np.array(layout.capacities, dtype=np.int64)
+
+    radixes, weight = [], 1
+    for capacity in layout.capacities:
+        radixes.append(weight)
+        weight *= capacity + 1
+    if weight >= 2 ** 63:
+        raise ValueError("the states of the context are too large to be encoded in 64 bits")
+    radixes = np.array(radixes, dtype=np.int64)
+
+    frontier = np.array([initial_context.state.volumes], dtype=np.int64).reshape(1, len(capacities))
+    visited = frontier @ radixes
+    volumes, parents, moves = [frontier], [np.array([-1])], [np.array([-1])]
+    first_row = 0
+
+    while len(frontier):
+        blocks, block_moves = _successor_blocks(frontier, capacities, applyable_actions)
+        if not blocks:
+            break
+
+        candidates = np.stack(blocks, axis=1).reshape(-1, len(capacities))
+        candidate_keys = candidates @ radixes
+
+        positions = np.minimum(np.searchsorted(visited, candidate_keys), len(visited) - 1)
+        unseen = visited[positions] != candidate_keys
+        _, first_indexes = np.unique(
+            np.where(unseen, candidate_keys, -1),
+            return_index=True
+        )
+        new_indexes = np.sort(first_indexes[unseen[first_indexes]])
+
+        parents.append(first_row + new_indexes // len(block_moves))
+        moves.append(np.array(block_moves)[new_indexes % len(block_moves)])
+        first_row += len(frontier)
+
+        frontier = candidates[new_indexes]
+        volumes.append(frontier)
+        visited = np.sort(np.concatenate([visited, candidate_keys[new_indexes]]))
+
+    return StateTable(
+        layout,
+        np.concatenate(volumes),
+        np.concatenate(parents),
+        np.concatenate(moves)
+    )
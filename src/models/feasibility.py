@@ -0,0 +1,149 @@
+from src.models.actions.action import Action
+from src.models.actions.drain import Drain
+from src.models.actions.fill import Fill
+from src.models.actions.pour import Pour
+from src.models.bucket import Bucket
+from src.models.context import Context
+from math import gcd
+from typing import List
+
+
+class Feasibility:
+    """
+    A class that represent the answer of a feasibility check.
+
+    Attributes:
+        verdict: str
+            POSSIBLE, IMPOSSIBLE or UNKNOWN when only a search can tell.
+        proof: str
+            the sketch of the proof of the verdict.
+    """
+
+    POSSIBLE = "possible"
+    IMPOSSIBLE = "impossible"
+    UNKNOWN = "unknown"
+
+    def __init__(self, verdict: str, proof: str) -> None:
+        """
+        Parameters:
+            verdict: str
+                POSSIBLE, IMPOSSIBLE or UNKNOWN
+            proof: str
+                the sketch of the proof of the verdict
+        """
+        self.verdict = verdict
+        self.proof = proof
+
+
+    @property
+    def possible(self) -> bool:
+        return self.verdict == Feasibility.POSSIBLE
+
+
+    @property
+    def impossible(self) -> bool:
+        return self.verdict == Feasibility.IMPOSSIBLE
+
+
+    def __str__(self) -> str:
+        """
+        The function is used to cast the object in string
+
+        Return: str
+            the verdict followed by its proof.
+        """
+        return f"{self.verdict}: {self.proof}"
+
+
+def check_feasibility(
+    initial_context: Context,
+    applyable_actions: List[Action],
+    objectif: Bucket
+) -> Feasibility:
+    """
+    Check if the objectif bucket can be reached from the initial context with
+    the actions, from the capacities and the volumes only, without any search.
+
+    Parameters:
+        initial_context: Context
+            the initial context of the search
+        applyable_actions: List[Action]
+            the actions that can evolve a context
+        objectif: Bucket
+            the bucket you want to obtain
+
+    Return: Feasibility
+        the verdict with the sketch of its proof.
+    """
+    layout = initial_context.layout
+    volumes = initial_context.state.volumes
+    target = objectif.current_volume
+    capacity = objectif.max_volume
+
+    indexes = [
+        index for index in layout.indexes_of(objectif.name)
+        if layout.capacities[index] == capacity
+    ]
+    if not indexes:
+        return Feasibility(
+            Feasibility.IMPOSSIBLE,
+            f"there is no bucket {objectif.name} with a max volume of {capacity}."
+        )
+
+    if not 0 <= target <= capacity:
+        return Feasibility(
+            Feasibility.IMPOSSIBLE,
+            f"a bucket with a max volume of {capacity} cannot contain {target}."
+        )
+
+    if initial_context.contains_bucket(objectif):
+        return Feasibility(Feasibility.POSSIBLE, "the initial context already contains the bucket.")
+
+    divisor = gcd(*layout.capacities, *volumes)
+    if divisor and target % divisor:
+        return Feasibility(
+            Feasibility.IMPOSSIBLE,
+            f"filling gives a max volume, draining gives 0 and pouring moves a volume or "
+            f"the free space of a bucket, so every volume stays a multiple of {divisor}, "
+            f"the gcd of the max volumes and the initial volumes, and {target} is not."
+        )
+
+    can_fill = any(isinstance(action, Fill) for action in applyable_actions)
+    can_drain = any(isinstance(action, Drain) for action in applyable_actions)
+    can_pour = any(isinstance(action, Pour) for action in applyable_actions)
+
+    if (can_fill and target == capacity) or (can_drain and target == 0):
+        return Feasibility(
+            Feasibility.POSSIBLE,
+            f"{'filling' if target == capacity else 'draining'} the bucket {objectif.name} gives {target}."
+        )
+
+    if not can_pour:
+        return Feasibility(
+            Feasibility.IMPOSSIBLE,
+            f"without pouring, the bucket {objectif.name} can only contain its initial volume"
+            + (", 0" if can_drain else "") + (f", {capacity}" if can_fill else "") + "."
+        )
+
+    total_volume = sum(volumes)
+    if not can_fill and target > total_volume:
+        return Feasibility(
+            Feasibility.IMPOSSIBLE,
+            f"without filling, the total volume {total_volume} never increases "
+            f"and it is lower than {target}."
+        )
+
+    if can_fill and can_drain:
+        for index in indexes:
+            for other_index, other_capacity in enumerate(layout.capacities):
+                pair_divisor = gcd(capacity, other_capacity)
+                if other_index != index and pair_divisor and target % pair_divisor == 0:
+                    return Feasibility(
+                        Feasibility.POSSIBLE,
+                        f"drain every bucket, then fill the bucket {layout.names[other_index]}, "
+                        f"pour it in the bucket {objectif.name} and drain {objectif.name} "
+                        f"when it is full: {objectif.name} takes every multiple of "
+                        f"{pair_divisor} up to {capacity}, and {target} is one of them."
+                    )
+
+    return Feasibility(Feasibility.UNKNOWN, "no argument decides it, a search is needed.")
@@ -0,0 +1,108 @@
+from src.models.bucket import Bucket
+from src.models.context import Context
+from math import ceil, gcd, inf
+from typing import Callable, Union
+
+Heuristic = Callable[[Context, Union[Context, Bucket]], float]
+"""
+A heuristic estimates the number of actions needed to reach the objectif
+from a context. It must never overestimate it, inf means unreachable.
+"""
+
+
+def target_volume_distance(context: Context, objectif: Union[Context, Bucket]) -> float:
+    """
+    Lower bound of the number of actions needed to obtain the target volume.
+    For a bucket objectif, it is 0 when the bucket already contains the volume,
+    1 when a single action on the bucket (fill, drain or pour from or into it)
+    gives the volume and 2 otherwise. For a context objectif, an action changes
+    at most two buckets, so it is half the number of buckets with a wrong volume.
+
+    Parameters:
+        context: Context
+            the context to estimate
+        objectif: Union[Context, Bucket]
+            the objectif of the search
+
+    Return: float
+        the lower bound.
+    """
+    layout = context.layout
+    volumes = context.state.volumes
+
+    if isinstance(objectif, Context):
+        if layout != objectif.layout:
+            return inf
+        wrong_volumes = sum(
+            volume != target_volume
+            for volume, target_volume in zip(volumes, objectif.state.volumes)
+        )
+        return ceil(wrong_volumes / 2)
+
+    target = objectif.current_volume
+    distance = inf
+    for index in layout.indexes_of(objectif.name):
+        capacity = layout.capacities[index]
+        if capacity != objectif.max_volume:
+            continue
+
+        volume = volumes[index]
+        if volume == target:
+            return 0
+        if target in (0, capacity) or any(
+            target == min(volume + other_volume, capacity)
+            or target == volume - min(volume, other_capacity - other_volume)
+            for other_index, (other_capacity, other_volume) in enumerate(zip(layout.capacities, volumes))
+            if other_index != index
+        ):
+            distance = min(distance, 1)
+        else:
+            distance = min(distance, 2)
+    return distance
+
+
+def gcd_bound(context: Context, objectif: Union[Context, Bucket]) -> float:
+    """
+    Every action keeps the volumes multiple of the gcd of the capacities and
+    of the current volumes, so a target volume who is not a multiple of it,
+    or who is bigger than the capacity, is unreachable.
+
+    Parameters:
+        context: Context
+            the context to estimate
+        objectif: Union[Context, Bucket]
+            the objectif of the search
+
+    Return: float
+        inf if the objectif is unreachable else 0.
+    """
+    divisor = gcd(*context.layout.capacities, *context.state.volumes)
+
+    if isinstance(objectif, Context):
+        targets = zip(objectif.state.volumes, objectif.layout.capacities)
+    else:
+        targets = [(objectif.current_volume, objectif.max_volume)]
+
+    for target, capacity in targets:
+        if target > capacity or (divisor and target % divisor):
+            return inf
+    return 0
+
+
+def combine(*heuristics: Heuristic) -> Heuristic:
+    """
+    Combine admissible heuristics by taking their maximum, which is still admissible.
+
+    Parameters:
+        heuristics: Heuristic
+            the heuristics to combine
+
+    Return: Heuristic
+        the combined heuristic.
+    """
+    def heuristic(context: Context, objectif: Union[Context, Bucket]) -> float:
+        return max(bound(context, objectif) for bound in heuristics)
+    return heuristic
+
+
+default_heuristic = combine(gcd_bound, target_volume_distance)
@@ -0,0 +1,53 @@
+from typing import Dict, List, Union
+
+
+class SearchStats:
+    """
+    A class that represent the counters and the timers of a search.
+
+    Attributes:
+        expanded: int
+            the number of contexts whose actions have been applied.
+        successors: int
+            the number of contexts produced by the effective moves of the actions.
+        duplicates: int
+            the number of successors who were already discovered.
+        queue_high_water: int
+            the maximum number of contexts waiting to be expanded.
+        level_times: List[float]
+            the seconds spent to expand each level, in order of depth.
+        duration: float
+            the seconds spent by the whole search.
+
+    Methods:
+        as_dict()
+            Return the counters and the timers as a dictionary.
+    """
+
+    __slots__ = ("expanded", "successors", "duplicates", "queue_high_water", "level_times", "duration")
+
+    def __init__(self) -> None:
+        self.expanded = 0
+        self.successors = 0
+        self.duplicates = 0
+        self.queue_high_water = 0
+        self.level_times = []
+        self.duration = 0.0
+
+
+    def as_dict(self) -> Dict[str, Union[int, float, List[float]]]:
+        """
+        Return the counters and the timers as a dictionary.
+
+        Return: Dict[str, Union[int, float, List[float]]]
+            the value of each attribute.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+    def __str__(self) -> str:
+        return (
+            f"{self.expanded} expanded, {self.successors} successors, {self.duplicates} duplicates, "
+            f"queue high water {self.queue_high_water}, "
+            f"{len(self.level_times)} levels in {self.duration:.3f} s"
+        )
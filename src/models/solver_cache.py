@@ -0,0 +1,152 @@
+from src.models.actions.action import Action
+from src.models.budget import SearchBudget
+from src.models.context import Context
+from src.models.director import Director
+from src.utils.lru_cache import LRUCache
+from src.utils.singleton import SingletonMeta
+from threading import Lock
+from typing import Callable, Dict, Hashable, List, Tuple
+
+
+class SolverCache(metaclass=SingletonMeta):
+    """
+    A process-wide cache of the generated directors, shared by all the sessions.
+    The puzzles are identified by their fingerprint: the buckets, their
+    capacities, their initial volumes and the active actions.
+
+    Attributes:
+        cache: LRUCache
+            the directors indexed by the fingerprint of their puzzle.
+        flights: Dict[Hashable, Tuple[Lock, int]]
+            the lock of each puzzle being generated and the number of threads who want it,
+            so concurrent misses of the same puzzle run a single search.
+
+    Methods:
+        fingerprint(initial_context: Context, applyable_actions: List[Action])
+            Return the fingerprint of a puzzle.
+
+        generate(initial_context: Context, applyable_actions: List[Action], engine: str = "object")
+            Return the director of the puzzle, generated only if it is not in the cache.
+
+        stats()
+            Return the statistics of the cache.
+    """
+
+    def __init__(self, max_entries: int = 32, max_memory: int = 512 * 1024 ** 2) -> None:
+        """
+        Parameters:
+            max_entries: int (optional)
+                the maximum number of cached puzzles
+            max_memory: int (optional)
+                the maximum estimated memory of the cached puzzles, in bytes
+        """
+        self.cache = LRUCache(max_entries, max_memory)
+        self.flights = {}
+        self._flights_lock = Lock()
+
+
+    @staticmethod
+    def fingerprint(initial_context: Context, applyable_actions: List[Action]) -> Hashable:
+        """
+        Return the fingerprint of a puzzle. The order of the actions doesn't change
+        the reachable contexts, so the actions are identified by their sorted types.
+
+        Parameters:
+            initial_context: Context
+                the initial context of the puzzle
+            applyable_actions: List[Action]
+                the actions that can evolve a context
+
+        Return: Hashable
+            the fingerprint of the puzzle.
+        """
+        return (
+            initial_context.layout.names,
+            initial_context.layout.capacities,
+            initial_context.state.volumes,
+            tuple(sorted({type(action).__qualname__ for action in applyable_actions})),
+        )
+
+
+    def generate(
+        self, 
+        initial_context: Context, 
+        applyable_actions: List[Action], 
+        engine: str = "object", 
+        workers: int = None,
+        monitor: Callable[[Director, int], bool] = None,
+        budget: SearchBudget = None
+    ) -> Director:
+        """
+        Return the director of the puzzle, generated only if it is not in the cache.
+        The director returned is a copy, so its objectif can be set without
+        changing the one of the other sessions. A director stopped by its monitor
+        or its budget is not complete and is not cached. When the puzzle is
+        already being generated by another thread, the search is not run twice:
+        the call waits for it and returns its director, or runs its own search
+        if the other one was stopped before the end.
+
+        Parameters:
+            initial_context: Context
+                the initial context of the puzzle
+            applyable_actions: List[Action]
+                the actions that can evolve a context
+            engine: str (optional)
+                the engine of Director.generate, all the engines give the same director
+            workers: int (optional)
+                the number of processes of the parallel engine
+            monitor: Callable[[Director, int], bool] (optional)
+                the monitor of Director.generate, it is not called when the director is cached,
+                it is called with an empty director while waiting for another thread
+            budget: SearchBudget (optional)
+                the limits of Director.generate, a cached director is returned even if it exceeds them
+
+        Return: Director
+            the director of the puzzle.
+        """
+        key = self.fingerprint(initial_context, applyable_actions)
+
+        director = self.cache.get(key)
+        if director is not None:
+            return director.copy()
+
+        with self._flights_lock:
+            flight, waiting = self.flights.get(key, (Lock(), 0))
+            self.flights[key] = (flight, waiting + 1)
+
+        try:
+            while not flight.acquire(timeout=0.1):
+                if monitor is not None and monitor(Director(), 0):
+                    director = Director()
+                    director.complete = False
+                    director.stop_reason = "cancelled"
+                    return director
+
+            try:
+                director = self.cache.peek(key)
+                if director is None:
+                    director = Director.generate(initial_context, applyable_actions, engine, workers, monitor=monitor, budget=budget)
+                    if not director.complete:
+                        return director
+                    self.cache.put(key, director, director.estimate_memory())
+            finally:
+                flight.release()
+        finally:
+            with self._flights_lock:
+                flight, waiting = self.flights[key]
+                if waiting > 1:
+                    self.flights[key] = (flight, waiting - 1)
+                else:
+                    del self.flights[key]
+
+        return director.copy()
+
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the statistics of the cache.
+
+        Return: Dict[str, int]
+            the number of entries, the estimated memory, the hits, the misses and the evictions.
+        """
+        return self.cache.stats()
@@ -0,0 +1,217 @@
+from typing import Dict, Iterable, Iterator, Sequence, Tuple
+
+
+class Layout:
+    """
+    A class that represent the layout of the buckets of a puzzle.
+    The layout is shared by all the contexts of the same puzzle, so the names
+    and the capacities of the buckets are stored only once.
+
+    Attributes:
+        names: Tuple[str, ...]
+            the names of the buckets, in the order of the context.
+        capacities: Tuple[int, ...]
+            the maximum volume of the buckets, in the order of the context.
+        positions: Dict[str, Tuple[int, ...]]
+            the indexes of the buckets for each bucket name.
+
+    Methods:
+        indexes_of(name: str)
+            Return the indexes of the buckets who have the given name.
+    """
+
+    __slots__ = ("names", "capacities", "positions", "_hash")
+
+    def __init__(self, names: Iterable[str], capacities: Iterable[int]) -> None:
+        """
+        Parameters:
+            names: Iterable[str]
+                the names of the buckets
+            capacities: Iterable[int]
+                the maximum volume of the buckets
+        """
+        self.names = tuple(names)
+        self.capacities = tuple(capacities)
+        self._hash = hash((self.names, self.capacities))
+
+        positions: Dict[str, Tuple[int, ...]] = {}
+        for index, name in enumerate(self.names):
+            positions[name] = positions.get(name, ()) + (index,)
+        self.positions = positions
+
+
+    def indexes_of(self, name: str) -> Tuple[int, ...]:
+        """
+        Return the indexes of the buckets who have the given name.
+
+        Parameters:
+            name: str
+                the name of the bucket
+
+        Return: Tuple[int, ...]
+            the indexes of the buckets, empty if no bucket has this name.
+        """
+        return self.positions.get(name, ())
+
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+    def __eq__(self, layout: object) -> bool:
+        """
+        The function is used to compare two Layout objects.
+
+        Parameter:
+            layout: Layout
+                the layout you want to compare.
+        """
+        if self is layout:
+            return True
+        if not isinstance(layout, Layout):
+            return NotImplemented
+        return self.names == layout.names and self.capacities == layout.capacities
+
+
+    def __hash__(self) -> int:
+        return self._hash
+
+
+class State:
+    """
+    A class that represent the volumes of the buckets of a context.
+    A state is immutable, its hash is computed once when it is created.
+
+    Attributes:
+        volumes: Tuple[int, ...]
+            the current volume of the buckets, in the order of the layout.
+
+    Methods:
+        replace(index: int, volume: int)
+            Return a new state where the volume of the bucket at index is replaced.
+    """
+
+    __slots__ = ("volumes", "_hash")
+
+    def __init__(self, volumes: Iterable[int]) -> None:
+        """
+        Parameters:
+            volumes: Iterable[int]
+                the current volume of the buckets
+        """
+        self.volumes = tuple(volumes)
+        self._hash = hash(self.volumes)
+
+
+    def replace(self, index: int, volume: int) -> 'State':
+        """
+        Return a new state where the volume of the bucket at index is replaced.
+
+        Parameters:
+            index: int
+                the index of the bucket
+            volume: int
+                the new volume of the bucket
+
+        Return: State
+            the new state.
+        """
+        volumes = self.volumes
+        return State(volumes[:index] + (volume,) + volumes[index + 1:])
+
+
+    def __getitem__(self, index: int) -> int:
+        return self.volumes[index]
+
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.volumes)
+
+
+    def __len__(self) -> int:
+        return len(self.volumes)
+
+
+    def __eq__(self, state: object) -> bool:
+        """
+        The function is used to compare two State objects.
+
+        Parameter:
+            state: State
+                the state you want to compare.
+        """
+        if self is state:
+            return True
+        if not isinstance(state, State):
+            return NotImplemented
+        return self._hash == state._hash and self.volumes == state.volumes
+
+
+    def __hash__(self) -> int:
+        return self._hash
+
+
+class StateTable:
+    """
+    A class that represent the contexts of a puzzle as columns instead of objects.
+    The rows are in discovery order, so the parent of a row is always before it.
+
+    Attributes:
+        layout: Layout
+            the names and the maximum volumes of the buckets.
+        volumes: Sequence[Sequence[int]]
+            the volumes of the buckets of each row.
+        parents: Sequence[int]
+            the index of the parent of each row, -1 for the initial context.
+        moves: Sequence[int]
+            the move who leads from the parent to each row, ignored for the initial context.
+
+    Methods:
+        rows()
+            Iterate over the volumes, the parent and the move of each row.
+    """
+
+    __slots__ = ("layout", "volumes", "parents", "moves")
+
+    def __init__(
+        self, 
+        layout: Layout, 
+        volumes: Sequence[Sequence[int]], 
+        parents: Sequence[int], 
+        moves: Sequence[int]
+    ) -> None:
+        """
+        Parameters:
+            layout: Layout
+                the names and the maximum volumes of the buckets
+            volumes: Sequence[Sequence[int]]
+                the volumes of the buckets of each row
+            parents: Sequence[int]
+                the index of the parent of each row, -1 for the initial context
+            moves: Sequence[int]
+                the move who leads from the parent to each row, ignored for the initial context
+        """
+        self.layout = layout
+        self.volumes = volumes
+        self.parents = parents
+        self.moves = moves
+
+
+    def rows(self) -> Iterator[Tuple[Tuple[int, ...], int, int]]:
+        """
+        Iterate over the volumes, the parent and the move of each row.
+
+        Return: Iterator[Tuple[Tuple[int, ...], int, int]]
+            the volumes, the index of the parent and the move of each row.
+        """
+        volumes, parents, moves = (
+            column.tolist() if hasattr(column, "tolist") else column
+            for column in (self.volumes, self.parents, self.moves)
+        )
+
+        for row_volumes, parent, move in zip(volumes, parents, moves):
+            yield tuple(row_volumes), parent, move
+
+
+    def __len__(self) -> int:
+        return len(self.parents)
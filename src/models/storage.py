@@ -0,0 +1,225 @@
+from src.models.budget import SearchBudget
+from src.models.state import Layout, StateTable
+from array import array
+from itertools import chain
+from mmap import ACCESS_READ, mmap
+from os import fstat
+from struct import calcsize, pack, unpack_from
+from sys import byteorder
+from typing import Sequence
+
+MAGIC = b"BKTG"
+VERSION = 1
+HEADER = "<4sHBBHxxq"
+"""
+The magic bytes, the version, the byte order of the columns (0 for little, 1 for big),
+the end of the search (0 if it is complete, 1 + the index of its stop reason in
+STOP_REASONS otherwise), the number of buckets and the number of rows. Each bucket is then described by its
+capacity (int64), the length of its name (uint16) and its name in utf-8. The header
+is padded to 8 bytes and followed by the volumes (rows x buckets), the parents and
+the moves, all in int32.
+"""
+
+
+STOP_REASONS = (None, "cancelled") + SearchBudget.REASONS
+"""
+Why a search was stopped, None when it was stopped without a reason.
+"""
+
+
+class MappedTable(StateTable):
+    """
+    A class that represent a state table read from a file: its columns are views
+    over the memory mapped file, who stays open until the table is closed. The
+    table is used as a context manager, or closed by close once its rows are read.
+
+    Attributes:
+        content: mmap
+            the memory mapped file.
+        complete: bool
+            False if the search who generated the table was stopped before the end.
+        stop_reason: str
+            why the search was stopped, None if it was not stopped.
+
+    Methods:
+        close()
+            Release the columns and close the file.
+    """
+
+    __slots__ = ("content", "complete", "stop_reason")
+
+    def __init__(
+        self, 
+        layout: Layout, 
+        volumes: Sequence[Sequence[int]], 
+        parents: Sequence[int], 
+        moves: Sequence[int], 
+        content: mmap,
+        complete: bool = True,
+        stop_reason: str = None
+    ) -> None:
+        """
+        Parameters:
+            layout: Layout
+                the names and the maximum volumes of the buckets
+            volumes: Sequence[Sequence[int]]
+                the volumes of the buckets of each row, a view over the content
+            parents: Sequence[int]
+                the index of the parent of each row, a view over the content
+            moves: Sequence[int]
+                the move who leads from the parent to each row, a view over the content
+            content: mmap
+                the memory mapped file
+            complete: bool (optional)
+                False if the search was stopped before the end
+            stop_reason: str (optional)
+                why the search was stopped
+        """
+        super().__init__(layout, volumes, parents, moves)
+        self.content = content
+        self.complete = complete
+        self.stop_reason = stop_reason
+
+
+    def close(self) -> None:
+        """
+        Release the columns and close the file, the rows can't be read anymore.
+        """
+        for column in (self.volumes, self.parents, self.moves):
+            if isinstance(column, memoryview):
+                column.release()
+        self.content.close()
+
+
+    def __enter__(self) -> 'MappedTable':
+        return self
+
+
+    def __exit__(self, *exception) -> None:
+        self.close()
+
+
+def _column_bytes(column: Sequence) -> bytes:
+    """
+    Return the content of a column in int32, the columns of the
+    numpy engine and of a read table are converted at once.
+
+    Parameters:
+        column: Sequence
+            the column, flat or with one row per context
+
+    Return: bytes
+        the values of the column in int32, row by row.
+    """
+    if isinstance(column, memoryview):
+        return column.tobytes()
+    if hasattr(column, "astype"):
+        return column.astype("=i4").tobytes()
+    if column and not isinstance(column[0], int):
+        return array("i", chain.from_iterable(column)).tobytes()
+    return array("i", column).tobytes()
+
+
+def write_table(table: StateTable, file_path: str, complete: bool = True, stop_reason: str = None) -> None:
+    """
+    Write a state table in a binary file.
+
+    Parameters:
+        table: StateTable
+            the state table to write, the volumes, the capacities and the moves must fit in int32
+        file_path: str
+            the path of the file
+        complete: bool (optional)
+            False if the search who generated the table was stopped before the end
+        stop_reason: str (optional)
+            why the search was stopped, one of STOP_REASONS
+
+    Error:
+        ValueError:
+            if a name of a bucket is not a str, it would be read back as a str, or
+            if the stop reason is unknown.
+    """
+    layout = table.layout
+    for name in layout.names:
+        if not isinstance(name, str):
+            raise ValueError(f"the name of the bucket {name!r} must be a str to be saved")
+    if stop_reason not in STOP_REASONS:
+        raise ValueError(f"Unknown stop reason {stop_reason}")
+
+    header = bytearray(pack(
+        HEADER, MAGIC, VERSION, byteorder == "big",
+        0 if complete else 1 + STOP_REASONS.index(stop_reason),
+        len(layout), len(table)
+    ))
+    for name, capacity in zip(layout.names, layout.capacities):
+        encoded_name = name.encode("utf-8")
+        header += pack("<qH", capacity, len(encoded_name)) + encoded_name
+    header += bytes(-len(header) % 8)
+
+    with open(file_path, "wb") as table_file:
+        table_file.write(header)
+        for column in (table.volumes, table.parents, table.moves):
+            table_file.write(_column_bytes(column))
+
+
+def read_table(file_path: str) -> MappedTable:
+    """
+    Read a state table from a binary file. The file is memory mapped and the
+    columns are views over it, so nothing is copied until the rows are read.
+    The file stays open until the table is closed.
+
+    Parameters:
+        file_path: str
+            the path of the file
+
+    Return: MappedTable
+        the state table, its columns are memoryviews, with the end of its search.
+
+    Error:
+        ValueError:
+            if the file is not a state table, was written with an other byte order
+            or is shorter than its header says.
+    """
+    with open(file_path, "rb") as table_file:
+        if fstat(table_file.fileno()).st_size < calcsize(HEADER):
+            raise ValueError(f"the file {file_path} is not a state table")
+        content = mmap(table_file.fileno(), 0, access=ACCESS_READ)
+
+    magic, version, big_endian, stopped, size, length = unpack_from(HEADER, content)
+    if magic != MAGIC or version != VERSION or stopped > len(STOP_REASONS):
+        content.close()
+        raise ValueError(f"the file {file_path} is not a state table")
+    if big_endian != (byteorder == "big"):
+        content.close()
+        raise ValueError(f"the file {file_path} was written with an other byte order")
+
+    offset = calcsize(HEADER)
+    names, capacities = [], []
+    for _ in range(size):
+        if offset + calcsize("<qH") > len(content):
+            break
+        capacity, name_length = unpack_from("<qH", content, offset)
+        offset += calcsize("<qH")
+        if offset + name_length > len(content):
+            break
+        names.append(bytes(content[offset:offset + name_length]).decode("utf-8"))
+        capacities.append(capacity)
+        offset += name_length
+    offset += -offset % 8
+
+    volumes_end = offset + 4 * length * size
+    parents_end = volumes_end + 4 * length
+    if len(names) < size or length < 0 or parents_end + 4 * length > len(content):
+        content.close()
+        raise ValueError(f"the file {file_path} is truncated, its header announces {length} rows of {size} buckets")
+
+    with memoryview(content) as view:
+        return MappedTable(
+            Layout(names, capacities),
+            view[offset:volumes_end].cast("i", [length, size]) if size else [()] * length,
+            view[volumes_end:parents_end].cast("i"),
+            view[parents_end:parents_end + 4 * length].cast("i"),
+            content,
+            stopped == 0,
+            STOP_REASONS[stopped - 1] if stopped else None
+        )
@@ -0,0 +1,219 @@
+from src.models.actions.action import Action
+from src.models.context import Context
+from src.models.state import State
+from typing import Dict, List, Sequence, Tuple
+
+
+class Symmetry:
+    """
+    A class that represent the interchangeable buckets of a puzzle: the buckets
+    who have the same capacity and the same initial volume. The actions don't
+    depend on the names, so exchanging the volumes of these buckets in a reachable
+    context gives another reachable context, and the search can keep only one
+    canonical context per class, where the volumes of each group are sorted.
+
+    Attributes:
+        layout: Layout
+            the names and the maximum volumes of the buckets.
+        applyable_actions: List[Action]
+            the actions of the search, replayed to find the concrete moves.
+        groups: Tuple[Tuple[int, ...], ...]
+            the indexes of the interchangeable buckets, only the groups of several buckets.
+
+    Methods:
+        canonical(volumes: Sequence[int])
+            Return the canonical volumes of the class of the volumes.
+
+        canonicalize(context: Context)
+            Replace the state of the context by its canonical state. The move of the
+        context is kept: it is the move on its parent, who leads to a context of
+        the same class, so the history of a canonical context doesn't reach it,
+        concrete_history and describe_edge give the moves on its buckets.
+
+        group_of(index: int)
+            Return the indexes of the buckets interchangeable with the bucket at index.
+
+        concrete_moves(context: Context, volumes: Sequence[int])
+            Return the moves who lead from the initial context to the given volumes.
+
+        concrete_history(context: Context, volumes: Sequence[int])
+            Return the traces of the moves who lead from the initial context to the given volumes.
+
+        describe_edge(parent: Context, context: Context, move: int)
+            Return the trace of the move between two canonical contexts.
+    """
+
+    def __init__(self, initial_context: Context, applyable_actions: List[Action]) -> None:
+        """
+        Parameters:
+            initial_context: Context
+                the initial context of the search
+            applyable_actions: List[Action]
+                the actions of the search
+        """
+        self.layout = initial_context.layout
+        self.applyable_actions = applyable_actions
+
+        groups: Dict[Tuple[int, int], Tuple[int, ...]] = {}
+        for index, bucket in enumerate(zip(self.layout.capacities, initial_context.state.volumes)):
+            groups[bucket] = groups.get(bucket, ()) + (index,)
+        self.groups = tuple(group for group in groups.values() if len(group) > 1)
+
+
+    def canonical(self, volumes: Sequence[int]) -> Tuple[int, ...]:
+        """
+        Return the canonical volumes of the class of the volumes.
+
+        Parameters:
+            volumes: Sequence[int]
+                the volumes of the buckets
+
+        Return: Tuple[int, ...]
+            the volumes where the volumes of each group are sorted.
+        """
+        canonical_volumes = list(volumes)
+        for group in self.groups:
+            for index, volume in zip(group, sorted(volumes[index] for index in group)):
+                canonical_volumes[index] = volume
+        return tuple(canonical_volumes)
+
+
+    def canonicalize(self, context: Context) -> Context:
+        """
+        Replace the state of the context by its canonical state.
+
+        Parameters:
+            context: Context
+                a context who is not shared yet
+
+        Return: Context
+            the context itself.
+        """
+        volumes = self.canonical(context.state.volumes)
+        if volumes != context.state.volumes:
+            context.state = State(volumes)
+            context._buckets = None
+        return context
+
+
+    def group_of(self, index: int) -> Tuple[int, ...]:
+        """
+        Return the indexes of the buckets interchangeable with the bucket at index.
+
+        Parameters:
+            index: int
+                the index of the bucket
+
+        Return: Tuple[int, ...]
+            the indexes of its group, only the index itself if it has no group.
+        """
+        for group in self.groups:
+            if index in group:
+                return group
+        return (index,)
+
+
+    def concrete_moves(self, context: Context, volumes: Sequence[int]) -> List[int]:
+        """
+        Return the moves who lead from the initial context to the given volumes. The
+        moves of the canonical contexts are replayed from the initial context, then
+        the buckets of each group are exchanged to reach exactly the given volumes.
+
+        Parameters:
+            context: Context
+                the canonical context of the class of the volumes, found by the search
+            volumes: Sequence[int]
+                the volumes to reach, of the same class as the context
+
+        Return: List[int]
+            the moves on the buckets of the layout.
+
+        Error:
+            ValueError:
+                if the volumes are not of the class of the context.
+        """
+        if self.canonical(volumes) != context.state.volumes:
+            raise ValueError(f"the volumes {tuple(volumes)} are not equivalent to the context")
+
+        chain = []
+        while context is not None:
+            chain.append(context)
+            context = context.parent
+        chain.reverse()
+
+        current_context = Context.from_state(self.layout, chain[0].state)
+        moves = []
+        for next_context in chain[1:]:
+            current_context = next(
+                successor
+                for successor in current_context.successors(self.applyable_actions)
+                if self.canonical(successor.state.volumes) == next_context.state.volumes
+            )
+            moves.append(current_context.move)
+
+        permutation = list(range(len(self.layout)))
+        reached_volumes = current_context.state.volumes
+        for group in self.groups:
+            targets = sorted(group, key=lambda index: volumes[index])
+            for index, target in zip(sorted(group, key=lambda index: reached_volumes[index]), targets):
+                permutation[index] = target
+
+        size = len(self.layout)
+        concrete_moves = []
+        for move in moves:
+            code, on_bucket, target_bucket = Action.decode_move(move, size)
+            concrete_moves.append(Action.registry[code].encode_move(size, permutation[on_bucket], permutation[target_bucket]))
+        return concrete_moves
+
+
+    def concrete_history(self, context: Context, volumes: Sequence[int]) -> List[str]:
+        """
+        Return the traces of the moves who lead from the initial context to the given volumes.
+
+        Parameters:
+            context: Context
+                the canonical context of the class of the volumes, found by the search
+            volumes: Sequence[int]
+                the volumes to reach, of the same class as the context
+
+        Return: List[str]
+            the traces of the moves, with the names of the buckets of the layout.
+        """
+        names = self.layout.names
+        return [
+            Action.describe_move(move, names)
+            for move in self.concrete_moves(context, volumes)
+        ]
+
+
+    def describe_edge(self, parent: Context, context: Context, move: int) -> str:
+        """
+        Return the trace of the move between two canonical contexts. When a move
+        on the parent leads exactly to the volumes of the context, it is traced,
+        otherwise the move leads to the same volumes in other buckets of a group,
+        it is traced with the buckets exchanged to reach the context.
+
+        Parameters:
+            parent: Context
+                the canonical context on which the move is done
+            context: Context
+                the canonical context of the class of the successor
+            move: int
+                the move found by the search
+
+        Return: str
+            the trace of the move, with the names of the buckets of the layout.
+        """
+        names = self.layout.names
+        volumes = context.state.volumes
+        for successor in parent.successors(self.applyable_actions):
+            if successor.state.volumes == volumes:
+                return Action.describe_move(successor.move, names)
+
+        successor = next(successor for successor in parent.successors(self.applyable_actions) if successor.move == move)
+        exchanged = [
+            f"{names[index]} = {volumes[index]}"
+            for index in range(len(names))
+            if successor.state.volumes[index] != volumes[index]
+        ]
+        return f"{Action.describe_move(move, names)}, exchanged by symmetry to {', '.join(exchanged)}"
@@ -1,18 +1,50 @@
-from turtle import onclick
+from os import makedirs, path, replace
+from functools import partial
+from hashlib import sha1
+from tempfile import gettempdir
+from threading import get_ident
+from time import sleep
+from typing import TYPE_CHECKING
 import streamlit as st
 
 from src.components.bucket_input import BucketInput
 from src.models.actions.drain import Drain
 from src.models.actions.fill import Fill
 from src.models.actions.pour import Pour
-from src.models.director import Director
 from src.models.context import Context
+from src.models.feasibility import check_feasibility
+from src.models.solver_cache import SolverCache
 from src.models.bucket import Bucket
+from src.models.budget import SearchBudget
 from src.pages.ipage import IPage
+from src.utils.background_job import BackgroundJob
+from src.utils.config import Config
+from src.utils.profiling import SolveProfiler
+
+if TYPE_CHECKING:
+    from src.models.director import Director
+
+DOT_DIRECTORY = path.join(gettempdir(), "streamlit-bucket", "graphs")
+"""
+The directory of the DOT files of the full graphs, one file per puzzle and objectif.
+"""
+
+POLL_INTERVAL = 0.25
+"""
+The seconds between two runs of the page while a background job is running.
+"""
+
+rerun = getattr(st, "rerun", None) or st.experimental_rerun
+"""
+Stop the run of the page and start a new one, named experimental_rerun before Streamlit 1.27.
+"""
 
 class DataPage(IPage):
     """
-    A class that represent the data page.
+    A class that represent the data page. The page is shared by the sessions, so
+    the feasibility of the objectif and the result of the last calculation (the
+    graphviz, the DOT file of the full graph, the limit who stopped the search and
+    the profile) are kept in the session state, as the background job.
 
     Attributes:
         actions: List[str]
@@ -23,10 +55,16 @@ class DataPage(IPage):
             the list of the buckets
         bucket_number: int
             the number of the buckets
-        graphviz: str
-            the graphviz representation of the solution
         objectif_bucket: Bucket
             the bucket that is the objectif
+        graph_mode: str
+            the part of the graph displayed: "shortest_path", "depth", "cap" or "full"
+        graph_limit: int
+            the deepest level of the "depth" mode or the number of contexts of the "cap" mode
+        budget: SearchBudget
+            the limits of the search, bounded by the server configuration
+        profile: bool
+            True if the next calculation is profiled
 
     methods:
         load_page:
@@ -44,49 +82,177 @@ class DataPage(IPage):
                 the list of the buckets
             bucket_number: int
                 the number of the buckets
-            graphviz: str
-                the graphviz representation of the solution
             objectif_bucket: Bucket
                 the bucket that is the objectif
+            graph_mode: str
+                the part of the graph displayed: "shortest_path", "depth", "cap" or "full"
+            graph_limit: int
+                the deepest level of the "depth" mode or the number of contexts of the "cap" mode
+            budget: SearchBudget
+                the limits of the search, bounded by the server configuration
+            profile: bool
+                True if the next calculation is profiled
         """
         self.objectif_bucket = BucketInput(key="objectif")
         self.actions = [Drain(), Fill(), Pour()]
         self.active_actions = []
         self.bucket_number = 1
-        self.graphviz = None
+        self.graph_mode = "shortest_path"
+        self.graph_limit = 200
+        self.budget = SearchBudget()
+        self.profile = False
         self.buckets = []
 
 
     def __calculate_solution(self) -> None:
         """
         calculate the solution of the bucket problem and generate 
-        the graphviz of the visualization of it.
-        """
-        initial_context = Context(
-            [
-                Bucket(
-                    bucket_input.id,
-                    bucket_input.max_volume,
-                    bucket_input.current_volume,
-                )
-                for bucket_input in self.buckets
-            ]
-        )
+        the graphviz of the visualization of it in a background job 
+        stored in the session. The search is skipped when the buckets are
+        invalid or the objectif is impossible, and not started again when 
+        the same search is running.
+        """
+        try:
+            initial_context = Context(
+                [
+                    Bucket(
+                        bucket_input.id,
+                        bucket_input.max_volume,
+                        bucket_input.current_volume,
+                    )
+                    for bucket_input in self.buckets
+                ]
+            )
+        except ValueError as error:
+            st.session_state.pop("solve_result", None)
+            st.error(f"The buckets are invalid, {error}")
+            return
 
-        director = Director.generate(
-            initial_context,
-            self.active_actions
+        objectif = Bucket(
+            self.objectif_bucket.id,
+            self.objectif_bucket.max_volume,
+            self.objectif_bucket.current_volume
         )
 
-        director.set_objectif(
-            Bucket(
-                self.objectif_bucket.id,
-                self.objectif_bucket.max_volume,
-                self.objectif_bucket.current_volume
-            )
+        feasibility = st.session_state["feasibility"] = check_feasibility(initial_context, self.active_actions, objectif)
+        if feasibility.impossible:
+            st.session_state.pop("solve_result", None)
+            return
+
+        key = (
+            SolverCache.fingerprint(initial_context, self.active_actions),
+            (objectif.name, objectif.max_volume, objectif.current_volume),
+            self.graph_mode,
+            self.graph_limit,
+            tuple(getattr(self.budget, limit) for limit in SearchBudget.REASONS),
+            self.profile
         )
+        job = st.session_state.get("solve_job")
+        if job is not None and not job.done:
+            if job.key == key:
+                return
+            job.cancel()
+
+        st.session_state["solve_job"] = BackgroundJob(
+            partial(
+                self.__solve, 
+                initial_context=initial_context, 
+                applyable_actions=list(self.active_actions), 
+                objectif=objectif,
+                graph_mode=self.graph_mode,
+                graph_limit=self.graph_limit,
+                budget=self.budget,
+                profile=self.profile
+            ),
+            key
+        ).start()
+
+
+    def __solve(
+        self, 
+        job: BackgroundJob, 
+        initial_context: Context, 
+        applyable_actions: list, 
+        objectif: Bucket,
+        graph_mode: str,
+        graph_limit: int,
+        budget: SearchBudget,
+        profile: bool
+    ) -> tuple:
+        """
+        generate the director of the bucket problem and the graphviz of
+        the visualization of it, in the thread of the job. The graph of 
+        a search stopped by its budget is partial.
 
-        self.graphviz = director.generate_graph_visualization()
+        Return: Tuple[str, str, str, SolveProfiler]
+            the graphviz of the solution, the DOT file of the full graph, the 
+            limit who stopped the search and the profile of the calculation if 
+            it is profiled, None if the job was cancelled.
+        """
+        profiler = SolveProfiler(enabled=profile)
+        with profiler:
+            with profiler.phase("generation"):
+                director = SolverCache().generate(
+                    initial_context,
+                    applyable_actions,
+                    monitor=job.monitor,
+                    budget=budget
+                )
+            if director.stop_reason == "cancelled":
+                return None
+
+            with profiler.phase("querying"):
+                director.set_objectif(objectif)
+                director.get_result()
+
+            with profiler.phase("DOT file"):
+                dot_file = self.__write_dot(
+                    director, 
+                    (
+                        SolverCache.fingerprint(initial_context, applyable_actions),
+                        (objectif.name, objectif.max_volume, objectif.current_volume),
+                    ),
+                    budget
+                )
+
+            with profiler.phase("graph building"):
+                graph = director.generate_graph_visualization(
+                    mode=graph_mode,
+                    max_depth=graph_limit,
+                    max_nodes=graph_limit
+                )
+
+            with profiler.phase("DOT source"):
+                graphviz = graph.source
+
+        if profiler.enabled:
+            profiler.count_objects()
+        return graphviz, dot_file, director.stop_reason, profiler if profile else None
+
+
+    def __write_dot(self, director: 'Director', key: tuple, budget: SearchBudget) -> str:
+        """
+        write the DOT file of the full graph in a file of its own, named after 
+        the puzzle and the objectif, so the sessions never share a file who is 
+        being written. The file of a complete graph is written only once, the 
+        file of a partial graph also depends on the budget and is rewritten.
+
+        Return: str
+            the path of the DOT file.
+        """
+        if not director.complete:
+            key += (tuple(getattr(budget, limit) for limit in SearchBudget.REASONS),)
+        name = sha1(repr(key).encode("utf-8")).hexdigest() + ("" if director.complete else "-partial")
+        file_path = path.join(DOT_DIRECTORY, f"{name}.dot")
+
+        if director.complete and path.exists(file_path):
+            return file_path
+
+        makedirs(DOT_DIRECTORY, exist_ok=True)
+        temporary_path = f"{file_path}.{get_ident()}.tmp"
+        director.write_dot(temporary_path)
+        replace(temporary_path, file_path)
+        return file_path
 
 
     def __load_preset_input(self) -> None:
@@ -105,6 +271,80 @@ class DataPage(IPage):
             step=1
         )
 
+        self.profile = st.checkbox("Profile the calculation")
+
+
+    def __load_graph_options(self) -> None:
+        """
+        load the options of the part of the graph who is displayed.
+        """
+        modes = {
+            "shortest_path": "Shortest paths to the objectif",
+            "depth": "Levels up to a depth",
+            "cap": "Limited number of contexts",
+            "full": "Full graph",
+        }
+
+        self.graph_mode = st.selectbox(
+            "Graph detail",
+            list(modes),
+            format_func=modes.get
+        )
+
+        if self.graph_mode in ("depth", "cap"):
+            self.graph_limit = st.number_input(
+                "Insert the deepest level" if self.graph_mode == "depth" else "Insert the number of contexts",
+                min_value=0,
+                value=5 if self.graph_mode == "depth" else 200,
+                step=1
+            )
+
+
+    def __load_budget_options(self) -> None:
+        """
+        load the limits of the search, the server configuration gives
+        their default and maximum values. 0 disables a limit who is not
+        set by the server.
+        """
+        config = Config()
+
+        with st.expander("Search budget"):
+            max_states = st.number_input(
+                "Insert the maximum number of contexts",
+                min_value=0 if config.max_states is None else 1,
+                max_value=config.max_states,
+                value=config.max_states or 0,
+                step=1000
+            )
+            max_depth = st.number_input(
+                "Insert the maximum depth",
+                min_value=0 if config.max_depth is None else 1,
+                max_value=config.max_depth,
+                value=config.max_depth or 0,
+                step=1
+            )
+            max_memory = st.number_input(
+                "Insert the maximum memory (MB)",
+                min_value=0 if config.max_memory is None else 1,
+                max_value=config.max_memory,
+                value=config.max_memory or 0,
+                step=64
+            )
+            deadline = st.number_input(
+                "Insert the time limit (s)",
+                min_value=0.0 if config.deadline is None else 0.1,
+                max_value=config.deadline,
+                value=config.deadline or 0.0,
+                step=1.0
+            )
+
+        self.budget = SearchBudget(
+            max_states=max_states or None,
+            max_depth=max_depth or None,
+            max_memory=max_memory * 1024 ** 2 or None,
+            deadline=deadline or None
+        )
+
 
     def __load_bucket_input(self) -> None:
         """
@@ -119,12 +359,84 @@ class DataPage(IPage):
             bucket.render(columns[bucket.id % 3])
 
 
+    def __load_solve_job(self) -> None:
+        """
+        display the progress of the background job once and schedule a rerun 
+        of the page while it is running, so the run never waits for the job 
+        and the Cancel button is handled by the next run. Once the job is done, 
+        keep its result in the session.
+        """
+        job = st.session_state.get("solve_job")
+        if job is None:
+            return
+
+        if not job.done:
+            st.button("Cancel", on_click=job.cancel)
+            st.write(job.describe())
+            sleep(POLL_INTERVAL)
+            rerun()
+
+        del st.session_state["solve_job"]
+        if job.error is not None:
+            st.error(f"The search failed: {job.error}")
+        elif job.cancelled:
+            st.info("The search was cancelled")
+        else:
+            st.session_state["solve_result"] = job.result
+
+
     def __load_graphviz(self) -> None:
         """
         display the graphviz of the solution if he was calculate.
         """
-        if self.graphviz is not None:
-            st.graphviz_chart(self.graphviz)
+        feasibility = st.session_state.get("feasibility")
+        if feasibility is not None and feasibility.impossible:
+            st.warning(f"The objectif is impossible, {feasibility.proof}")
+
+        graphviz, dot_file_path, stop_reason, _ = st.session_state.get("solve_result", (None, None, None, None))
+        if graphviz is not None and stop_reason is not None:
+            limits = {
+                "max_states": "the maximum number of contexts",
+                "max_depth": "the maximum depth",
+                "max_memory": "the maximum memory",
+                "deadline": "the time limit",
+            }
+            st.warning(f"The search reached {limits[stop_reason]}, the graph is partial")
+
+        if graphviz is not None:
+            st.graphviz_chart(graphviz)
+
+            if dot_file_path is not None and path.exists(dot_file_path):
+                with open(dot_file_path, "rb") as dot_file:
+                    st.download_button("Download the full graph", dot_file, file_name="graph.dot")
+
+
+    def __load_profile(self) -> None:
+        """
+        display the profile of the last calculation if it was profiled.
+        """
+        _, _, _, profiler = st.session_state.get("solve_result", (None, None, None, None))
+        if profiler is None:
+            return
+
+        with st.expander("Profile of the calculation"):
+            st.write("Duration of each phase (s), the graph is drawn by the browser after them:")
+            st.table([
+                {"phase": phase, "seconds": round(seconds, 4)} 
+                for phase, seconds in profiler.summary().items()
+            ])
+            if profiler.refused:
+                st.warning("Another calculation was being profiled, only the duration of the phases was measured.")
+                return
+            st.write(f"Peak memory of the process: {profiler.peak_memory / 1024 ** 2:.1f} MB")
+            st.write("Live objects of the process by type:")
+            st.table([{"type": name, "count": count} for name, count in profiler.object_counts])
+            st.code(profiler.hot_spots())
+            st.download_button(
+                "Download the raw profile", 
+                profiler.raw_profile(), 
+                file_name="calculation.prof"
+            )
 
 
     def __load_objectif_bucket(self) -> None:
@@ -144,10 +456,14 @@ class DataPage(IPage):
         st.title("Data")
 
         self.__load_preset_input()
+        self.__load_graph_options()
+        self.__load_budget_options()
 
         st.markdown("----")
 
         self.__load_bucket_input()
         self.__load_objectif_bucket()
+        self.__load_solve_job()
         self.__load_graphviz()
+        self.__load_profile()
     
\ No newline at end of file
@@ -1,17 +1,23 @@
-from src.pages.data import DataPage
-from src.pages.home import HomePage
+from importlib import import_module
 from src.pages.ipage import IPage
 from src.utils.singleton import SingletonMeta
+from typing import Dict, Tuple, Union
 
 
 class Router(metaclass=SingletonMeta):
     """
-    A class that represent a routing system.
+    A class that represent a routing system. The pages are registered by the
+    module and the name of their class, a module is only imported the first
+    time its page is visited, so the heavy dependencies of a page are not
+    loaded at the start of the application.
 
     Attributes:
         current_page (IPage): The current page.
+        pages (Dict[str, Tuple[str, str]]): The module and the class of each page, by name.
 
     Methods:
+        register_page(name: str, module: str, class_name: str) -> None
+            Register a page, its module is imported when the page is visited.
         go_to_page(new_page: str) -> None
             Take string representation of the page you want to go to and
             set the current page to the new page.
@@ -19,38 +25,56 @@ class Router(metaclass=SingletonMeta):
             Return the current page.
     """
 
-    def __init__(self, initial_page: IPage)  -> None:
+    pages: Dict[str, Tuple[str, str]] = {
+        "home": ("src.pages.home", "HomePage"),
+        "data": ("src.pages.data", "DataPage"),
+    }
+
+    def __init__(self, initial_page: Union[IPage, str] = "home")  -> None:
         """
         Parameters:
-            initial_page (IPage): The initial page.
+            initial_page (Union[IPage, str]): The initial page, or the name of a registered page.
+        """
+        self.current_page = None
+        if isinstance(initial_page, str):
+            self.go_to_page(initial_page)
+        else:
+            self.current_page = initial_page
+
+    @classmethod
+    def register_page(cls, name: str, module: str, class_name: str) -> None:
         """
-        self.current_page = initial_page
+        Register a page, its module is imported when the page is visited.
+
+        Parameters:
+            name (str): String representation of the page.
+            module (str): The module of the page, as imported by import_module.
+            class_name (str): The name of the class of the page in its module.
+        """
+        cls.pages[name] = (module, class_name)
 
     def go_to_page(self, new_page: str) -> None:
         """
-        Take string representation of the page you want to go to and 
+        Take string representation of the page you want to go to and
         set the current page to the new page.
 
         Parameters:
             new_page (str): String representation of the page you want to go to.
-        
+
         Errors:
             ValueError: If the new page is not a valid page.
         """
-        match new_page:
-            case "home":
-                self.current_page = HomePage()
-            case "data":
-                self.current_page = DataPage()
-            case _:
-                raise ValueError(f"Unknown page {new_page}")
-                
+        if new_page not in self.pages:
+            raise ValueError(f"Unknown page {new_page}")
+
+        module, class_name = self.pages[new_page]
+        self.current_page = getattr(import_module(module), class_name)()
 
     def get_current_page(self)  -> IPage:
         """
         Return the current page.
-        
+
         Returns:
             IPage: The current page.
         """
-        return self.current_page
\ No newline at end of file
+        return self.current_page
@@ -0,0 +1,136 @@
+"""
+Solve a puzzle from the command line, without the application.
+
+Only src.models is imported: neither Streamlit nor the pages are loaded, and
+graphviz is only imported by the graph visualization, so the search starts
+without their import time. The puzzle is given by the arguments, or read from
+the standard input as a JSON object with the fields of a request of a batch
+(see src.models.batch). With a single objective and no DOT file, the search
+stops as soon as the objectif is found, otherwise the whole graph is generated.
+
+Usage (from the root of the repository):
+
+    python -m src.solve --bucket a:3 --bucket b:5 --objective b:4
+    python -m src.solve --bucket a:3:0 --bucket b:5:0 --actions fill pour --objective b:4 --json
+    python -m src.solve --bucket a:3 --bucket b:5 --objective b:4 --dot resources/graph.dot
+    echo '{"buckets": ["a:3", "b:5"], "actions": ["fill", "drain", "pour"], "objectives": ["b:4"]}' | python -m src.solve
+
+The exit code is 0 when every objective is reachable, 1 when one is not and
+2 when the puzzle is invalid.
+"""
+from src.models.batch import ACTIONS, BatchRequest, answer_objectives, parse_request
+from src.models.bucket import Bucket
+from src.models.budget import SearchBudget
+from src.models.director import Director
+from argparse import ArgumentParser
+from typing import Any, Dict, List
+import json
+import sys
+
+
+def solve_request(request: BatchRequest, engine: str = "object", budget: SearchBudget = None, full: bool = False) -> Director:
+    """
+    Search the contexts of the puzzle of a request.
+
+    Parameters:
+        request: BatchRequest
+            the puzzle and its objectives
+        engine: str (optional)
+            the engine of Director.generate
+        budget: SearchBudget (optional)
+            the limits of the search, only with the object engine
+        full: bool (optional)
+            generate the whole graph even if a single objective is asked
+
+    Return: Director
+        the director whose contexts answer the objectives of the request.
+    """
+    initial_context = request.build_context()
+    applyable_actions = request.build_actions()
+
+    if len(request.objectives) == 1 and not full and engine == "object":
+        name, volume = request.objectives[0]
+        max_volume = next(max_volume for bucket_name, max_volume, _ in request.buckets if bucket_name == name)
+        return Director.solve(initial_context, applyable_actions, Bucket(name, max_volume, volume), budget=budget)
+
+    return Director.generate(initial_context, applyable_actions, engine, budget=budget)
+
+
+def print_results(results: List[Dict[str, Any]]) -> None:
+    """
+    Print the path to each objective, one action per line.
+
+    Parameters:
+        results: List[Dict[str, Any]]
+            the results of answer_objectives
+    """
+    for result in results:
+        title = f"{result['bucket']} = {result['volume']}"
+        if result["reachable"]:
+            print(f"{title}: {result['moves']} moves")
+            for step, trace in enumerate(result["path"], 1):
+                print(f"  {step}. {trace}")
+        elif result["reachable"] is None:
+            print(f"{title}: not found, the search was stopped by {result['stop_reason']}")
+        else:
+            print(f"{title}: impossible")
+
+
+def main(arguments: List[str] = None) -> int:
+    """
+    Solve a puzzle from the command line.
+
+    Parameters:
+        arguments: List[str] (optional)
+            the arguments of the command line, sys.argv by default
+
+    Return: int
+        the exit code.
+    """
+    parser = ArgumentParser(prog="python -m src.solve", description="Solve a bucket puzzle.")
+    parser.add_argument("--bucket", action="append", default=[], help="a bucket name:max_volume[:current_volume], repeated for each bucket")
+    parser.add_argument("--actions", nargs="+", default=list(ACTIONS), help="the actions, all of them by default")
+    parser.add_argument("--objective", action="append", default=[], help="an objective name:volume, repeated for each objective")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    parser.add_argument("--dot", help="write the graph of the contexts in this DOT file")
+    parser.add_argument("--engine", default="object", help="the engine of Director.generate")
+    parser.add_argument("--max-states", type=int, help="the maximum number of contexts")
+    parser.add_argument("--deadline", type=float, help="the time limit in seconds")
+    options = parser.parse_args(arguments)
+
+    try:
+        if options.bucket:
+            record = {"buckets": options.bucket, "actions": options.actions, "objectives": options.objective}
+        else:
+            record = json.load(sys.stdin)
+            if not isinstance(record, dict):
+                raise ValueError("the puzzle must be a JSON object")
+        request = parse_request(record)
+    except ValueError as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 2
+
+    budget = None
+    if options.max_states is not None or options.deadline is not None:
+        budget = SearchBudget(max_states=options.max_states, deadline=options.deadline)
+
+    try:
+        director = solve_request(request, options.engine, budget, full=options.dot is not None)
+    except ValueError as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 2
+
+    if options.dot is not None:
+        director.write_dot(options.dot)
+
+    results = answer_objectives(director, request)
+    if options.json:
+        print(json.dumps({"states": len(director), "complete": director.complete, "results": results}, indent=2))
+    else:
+        print_results(results)
+
+    return 0 if all(result["reachable"] for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+from threading import Event, Thread
+from time import monotonic
+from typing import Any, Callable, Hashable
+
+
+class BackgroundJob:
+    """
+    A class that represent a function who runs in a daemon thread. The function
+    receives the job, it reports its progress and checks the cancellation with
+    the monitor method, so the job can be given as the monitor of Director.generate.
+
+    Attributes:
+        key: Hashable
+            the identifier of the work done by the job, two jobs with the same key do the same work.
+        states: int
+            the number of contexts discovered so far.
+        depth: int
+            the depth of the level explored so far.
+        result: Any
+            the value returned by the function, None until it is done.
+        error: Exception
+            the exception raised by the function, None if it didn't raise.
+
+    Methods:
+        start()
+            Run the function in a daemon thread.
+
+        cancel()
+            Ask the function to stop at its next call of monitor.
+
+        monitor(director: Director, depth: int)
+            Record the progress of the function and return True if the job was cancelled.
+
+        describe()
+            Return the progress of the job as a sentence.
+    """
+
+    def __init__(self, target: Callable[['BackgroundJob'], Any], key: Hashable = None) -> None:
+        """
+        Parameters:
+            target: Callable[[BackgroundJob], Any]
+                the function to run, it receives the job
+            key: Hashable (optional)
+                the identifier of the work done by the job
+        """
+        self.key = key
+        self.states = 0
+        self.depth = 0
+        self.result = None
+        self.error = None
+        self._target = target
+        self._cancelled = Event()
+        self._started_at = None
+        self._finished_at = None
+        self._thread = Thread(target=self.__run, daemon=True)
+
+
+    def __run(self) -> None:
+        """
+        Run the function and keep its result or its exception.
+        """
+        try:
+            self.result = self._target(self)
+        except Exception as error:
+            self.error = error
+        finally:
+            self._finished_at = monotonic()
+
+
+    def start(self) -> 'BackgroundJob':
+        """
+        Run the function in a daemon thread.
+
+        Return: BackgroundJob
+            the job itself.
+        """
+        self._started_at = monotonic()
+        self._thread.start()
+        return self
+
+
+    def cancel(self) -> None:
+        """
+        Ask the function to stop at its next call of monitor.
+        """
+        self._cancelled.set()
+
+
+    def monitor(self, director, depth: int) -> bool:
+        """
+        Record the progress of the function and return True if the job was cancelled.
+
+        Parameters:
+            director: Director
+                the director being generated
+            depth: int
+                the depth of the level about to be explored
+
+        Return: bool
+            True if the function must stop.
+        """
+        self.states = len(director)
+        self.depth = depth
+        return self._cancelled.is_set()
+
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        Return: bool
+            True if the job was cancelled.
+        """
+        return self._cancelled.is_set()
+
+
+    @property
+    def done(self) -> bool:
+        """
+        Return: bool
+            True if the function has returned or raised.
+        """
+        return self._finished_at is not None
+
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Return: float
+            the seconds since the job was started, until it is done.
+        """
+        if self._started_at is None:
+            return 0.0
+        return (self._finished_at or monotonic()) - self._started_at
+
+
+    def describe(self) -> str:
+        """
+        Return the progress of the job as a sentence.
+
+        Return: str
+            the number of contexts, the depth and the elapsed time.
+        """
+        return f"{self.states} contexts discovered, depth {self.depth}, {self.elapsed:.1f} s"
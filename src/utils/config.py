@@ -0,0 +1,60 @@
+from src.utils.singleton import SingletonMeta
+from os import environ
+from typing import Callable, Union
+
+
+def _read(name: str, default: Union[int, float, None], convert: Callable[[str], Union[int, float]]) -> Union[int, float, None]:
+    """
+    Read a limit from the environment, "none" or an empty value disables the limit.
+
+    Parameters:
+        name: str
+            the name of the environment variable
+        default: Union[int, float, None]
+            the limit when the variable is not set
+        convert: Callable[[str], Union[int, float]]
+            the conversion of the value of the variable
+
+    Return: Union[int, float, None]
+        the limit, None if it is disabled.
+
+    Error:
+        ValueError:
+            if the value of the variable is not a number.
+    """
+    value = environ.get(name)
+    if value is None:
+        return default
+    if value.strip().lower() in ("", "none"):
+        return None
+    try:
+        return convert(value)
+    except ValueError:
+        raise ValueError(f"the environment variable {name} must be a number, {value} is given")
+
+
+class Config(metaclass=SingletonMeta):
+    """
+    A class that represent the configuration of the server, read once from the
+    environment. The limits are the defaults and the maximums of the budget of
+    the searches started from the pages.
+
+    Attributes:
+        max_states: int
+            the maximum number of discovered contexts, BUCKET_MAX_STATES.
+        max_depth: int
+            the depth of the last level discovered, BUCKET_MAX_DEPTH.
+        max_memory: int
+            the maximum estimated memory of a director in MB, BUCKET_MAX_MEMORY_MB.
+        deadline: float
+            the maximum duration of a search in seconds, BUCKET_DEADLINE.
+        metrics_port: int
+            the port of the Prometheus metrics, BUCKET_METRICS_PORT, not served by default.
+    """
+
+    def __init__(self) -> None:
+        self.max_states = _read("BUCKET_MAX_STATES", 2_000_000, int)
+        self.max_depth = _read("BUCKET_MAX_DEPTH", None, int)
+        self.max_memory = _read("BUCKET_MAX_MEMORY_MB", 1024, int)
+        self.deadline = _read("BUCKET_DEADLINE", 120.0, float)
+        self.metrics_port = _read("BUCKET_METRICS_PORT", None, int)
@@ -0,0 +1,160 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Hashable
+
+
+class LRUCache:
+    """
+    A thread-safe cache who evicts the least recently used entries when it
+    holds too many entries or when their estimated size is too big.
+
+    Attributes:
+        max_entries: int
+            the maximum number of entries.
+        max_memory: int
+            the maximum estimated size of the entries, in bytes.
+        memory: int
+            the estimated size of the entries, in bytes.
+        hits: int
+            the number of get who found their key.
+        misses: int
+            the number of get who didn't find their key.
+        evictions: int
+            the number of entries removed to respect the bounds.
+
+    Methods:
+        get(key: Hashable)
+            Return the value of the key, or None if it is not in the cache.
+
+        peek(key: Hashable)
+            Return the value of the key without counting it nor making it recent.
+
+        put(key: Hashable, value: Any, size: int)
+            Store the value of the key and evict the least recently used entries if needed.
+
+        clear()
+            Remove all the entries.
+
+        stats()
+            Return the statistics of the cache.
+    """
+
+    def __init__(self, max_entries: int = 32, max_memory: int = 512 * 1024 ** 2) -> None:
+        """
+        Parameters:
+            max_entries: int (optional)
+                the maximum number of entries
+            max_memory: int (optional)
+                the maximum estimated size of the entries, in bytes
+        """
+        self.max_entries = max_entries
+        self.max_memory = max_memory
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Return the value of the key, or None if it is not in the cache.
+
+        Parameters:
+            key: Hashable
+                the key of the value
+
+        Return: Any
+            the value of the key, it becomes the most recently used entry.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+
+    def peek(self, key: Hashable) -> Any:
+        """
+        Return the value of the key, or None if it is not in the cache. Unlike get,
+        neither the hits and the misses nor the order of the entries change.
+
+        Parameters:
+            key: Hashable
+                the key of the value
+
+        Return: Any
+            the value of the key.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[0] if entry is not None else None
+
+
+    def put(self, key: Hashable, value: Any, size: int) -> None:
+        """
+        Store the value of the key and evict the least recently used entries if needed.
+        A value bigger than the maximum memory is not stored.
+
+        Parameters:
+            key: Hashable
+                the key of the value
+            value: Any
+                the value to store
+            size: int
+                the estimated size of the value, in bytes
+        """
+        with self._lock:
+            if key in self._entries:
+                self.memory -= self._entries.pop(key)[1]
+            if size > self.max_memory:
+                return
+
+            self._entries[key] = (value, size)
+            self.memory += size
+
+            while len(self._entries) > self.max_entries or self.memory > self.max_memory:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.memory -= evicted_size
+                self.evictions += 1
+
+
+    def clear(self) -> None:
+        """
+        Remove all the entries.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.memory = 0
+
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the statistics of the cache.
+
+        Return: Dict[str, int]
+            the number of entries, the estimated memory, the hits, the misses and the evictions.
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "memory": self.memory,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,85 @@
+from importlib.util import find_spec
+from threading import Lock
+
+_server_lock = Lock()
+_server_port = None
+_histograms = None
+
+
+def _load_histograms() -> tuple:
+    """
+    Import prometheus_client and create the histograms, only the first time. The
+    import is slow, so the processes who don't serve the metrics never pay it.
+
+    Return: tuple
+        the histogram of the durations and the histogram of the number of contexts.
+    """
+    global _histograms
+    if _histograms is None:
+        from prometheus_client import Histogram
+
+        _histograms = (
+            Histogram(
+                "bucket_solve_seconds",
+                "Duration of the generation of the contexts of a puzzle.",
+                ["engine"],
+                buckets=(0.001, 0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+            ),
+            Histogram(
+                "bucket_state_space_size",
+                "Number of contexts generated for a puzzle.",
+                ["engine"],
+                buckets=(10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+            ),
+        )
+    return _histograms
+
+
+def observe_search(engine: str, duration: float, states: int) -> None:
+    """
+    Record the duration and the number of contexts of a search in the histograms.
+    Nothing is recorded before the metrics are served, so a process who doesn't
+    serve them (the command line solvers) doesn't import prometheus_client.
+
+    Parameters:
+        engine: str
+            the engine of the search
+        duration: float
+            the duration of the search, in seconds
+        states: int
+            the number of contexts generated
+    """
+    if _histograms is None:
+        return
+    solve_latency, state_space = _histograms
+    solve_latency.labels(engine).observe(duration)
+    state_space.labels(engine).observe(states)
+
+
+def serve_metrics(port: int) -> bool:
+    """
+    Expose the metrics on an HTTP server, started only once per process. The
+    histograms are created here, on the first call, so prometheus_client is only
+    imported by the processes who serve the metrics (the application, not the
+    command line solvers). The searches are recorded from then on, observe_search
+    does nothing before.
+
+    Parameters:
+        port: int
+            the port of the server
+
+    Return: bool
+        True if the metrics are served, False if prometheus_client is not installed.
+    """
+    global _server_port
+    if find_spec("prometheus_client") is None:
+        return False
+
+    with _server_lock:
+        if _server_port is None:
+            from prometheus_client import start_http_server
+
+            _load_histograms()
+            start_http_server(port)
+            _server_port = port
+    return True
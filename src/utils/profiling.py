@@ -0,0 +1,195 @@
+from collections import Counter
+from contextlib import contextmanager
+from cProfile import Profile
+from io import StringIO
+from pstats import Stats
+from threading import RLock
+from time import perf_counter
+from typing import Dict, Iterator, List, Tuple
+import gc
+import marshal
+import tracemalloc
+
+_profiling = RLock()
+"""
+Held by the profile in progress: tracemalloc and the object count are global to
+the process, so two profiles at the same time would measure each other.
+"""
+
+
+class SolveProfiler:
+    """
+    A class that represent the profile of a calculation. The duration of each phase
+    is always measured, the CPU (cProfile), the memory (tracemalloc) and the objects
+    by type (Pympler, or the objects tracked by the garbage collector without it)
+    only when the profiler is enabled. The profiler is used as a context manager
+    around the calculation, in the thread who runs it.
+
+    cProfile only follows the thread who runs the calculation, but the memory and
+    the objects are measured for the whole process: the peak memory and the live
+    objects include the other sessions of the application. A single profile can
+    run at a time, a profiler entered while another one is running is refused:
+    it measures only the duration of the phases and its refused attribute is set.
+
+    Attributes:
+        enabled: bool
+            True if the CPU, the memory and the objects are profiled.
+        refused: bool
+            True if the profiler was disabled because another profile was running.
+        phases: Dict[str, float]
+            the seconds spent in each phase, in order of execution.
+        peak_memory: int
+            the peak of the memory allocated during the calculation, in bytes.
+        object_counts: List[Tuple[str, int]]
+            the most common types of the live objects and their number.
+
+    Methods:
+        phase(name: str)
+            Measure the duration of a phase of the calculation.
+
+        count_objects(limit: int = 15, watched: Tuple[str, ...] = ("Context", ...))
+            Count the live objects by type.
+
+        hot_spots(limit: int = 25)
+            Return the functions who take the most time, as text.
+
+        raw_profile()
+            Return the profile in the format of pstats, to open with pstats or snakeviz.
+
+        summary()
+            Return the seconds spent in each phase and in total.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        """
+        Parameters:
+            enabled: bool (optional)
+                profile the CPU, the memory and the objects
+        """
+        self.enabled = enabled
+        self.refused = False
+        self.phases = {}
+        self.peak_memory = 0
+        self.object_counts = []
+        self._profile = Profile() if enabled else None
+        self._traced = False
+
+
+    def __enter__(self) -> 'SolveProfiler':
+        if self.enabled and not _profiling.acquire(blocking=False):
+            self.enabled = False
+            self.refused = True
+            self._profile = None
+
+        if self.enabled:
+            self._traced = not tracemalloc.is_tracing()
+            if self._traced:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            self._profile.enable()
+        return self
+
+
+    def __exit__(self, *exception) -> None:
+        if self.enabled:
+            self._profile.disable()
+            _, self.peak_memory = tracemalloc.get_traced_memory()
+            if self._traced:
+                tracemalloc.stop()
+            _profiling.release()
+
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Measure the duration of a phase of the calculation.
+
+        Parameters:
+            name: str
+                the name of the phase
+        """
+        started_at = perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + perf_counter() - started_at
+
+
+    def count_objects(
+        self, 
+        limit: int = 15, 
+        watched: Tuple[str, ...] = ("Context", "State", "BucketView", "Bucket", "Layout")
+    ) -> List[Tuple[str, int]]:
+        """
+        Count the live objects by type. Every object of the process is visited, so
+        the count takes about a second for a million objects and includes the other
+        sessions, it waits for the profile in progress to finish. Without Pympler,
+        only the objects tracked by the garbage collector are counted, so the str
+        and the int are missing.
+
+        Parameters:
+            limit: int (optional)
+                the number of types kept
+            watched: Tuple[str, ...] (optional)
+                the names of the types always kept, even if they are not common
+
+        Return: List[Tuple[str, int]]
+            the most common types and the watched types, with their number.
+        """
+        try:
+            from pympler import muppy
+        except ImportError:
+            muppy = None
+
+        with _profiling:
+            objects = muppy.get_objects() if muppy is not None else gc.get_objects()
+            counts = Counter(type(item).__name__ for item in objects)
+            del objects
+
+        self.object_counts = counts.most_common(limit)
+        kept = {name for name, _ in self.object_counts}
+        self.object_counts += [(name, counts[name]) for name in watched if name not in kept]
+        return self.object_counts
+
+
+    def hot_spots(self, limit: int = 25) -> str:
+        """
+        Return the functions who take the most time, as text.
+
+        Parameters:
+            limit: int (optional)
+                the number of functions
+
+        Return: str
+            the functions sorted by cumulative time, then by own time.
+        """
+        if not self.enabled:
+            return ""
+
+        output = StringIO()
+        stats = Stats(self._profile, stream=output)
+        stats.sort_stats("cumulative").print_stats(limit)
+        stats.sort_stats("tottime").print_stats(limit)
+        return output.getvalue()
+
+
+    def raw_profile(self) -> bytes:
+        """
+        Return the profile in the format of pstats, to open with pstats or snakeviz.
+
+        Return: bytes
+            the content of the file written by Stats.dump_stats.
+        """
+        if not self.enabled:
+            return b""
+        return marshal.dumps(Stats(self._profile).stats)
+
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Return the seconds spent in each phase and in total.
+
+        Return: Dict[str, float]
+            the seconds spent in each phase and in total.
+        """
+        return {**self.phases, "total": sum(self.phases.values())}
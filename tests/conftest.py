@@ -0,0 +1,34 @@
+from src.models.actions.drain import Drain
+from src.models.actions.fill import Fill
+from src.models.actions.pour import Pour
+from src.models.bucket import Bucket
+from src.models.context import Context
+import pytest
+
+ACTIONS = {"drain": Drain(), "fill": Fill(), "pour": Pour()}
+
+PUZZLES = [
+    [("a", 3, 0), ("b", 5, 0)],
+    [("a", 3, 1), ("b", 5, 2), ("c", 8, 0)],
+    [("a", 4, 0), ("b", 9, 0), ("c", 7, 0)],
+]
+
+
+@pytest.fixture
+def build():
+    """
+    Give a function who build a puzzle from its buckets, as (name, max_volume, current_volume) tuples,
+    and the names of its actions, all of them by default.
+    The function return a new initial context and its applyable actions on each call.
+    """
+    def build(buckets, actions=tuple(ACTIONS)):
+        return Context([Bucket(*bucket) for bucket in buckets]), [ACTIONS[action] for action in actions]
+    return build
+
+
+@pytest.fixture(params=PUZZLES, ids=lambda buckets: "-".join(str(bucket[1]) for bucket in buckets))
+def buckets(request):
+    """
+    Give the buckets of each shared puzzle in turn.
+    """
+    return request.param
@@ -0,0 +1,52 @@
+from src.models.batch import parse_request, solve_batch
+import pytest
+
+RECORDS = [
+    {"id": "first", "buckets": "a:3 b:5", "actions": "fill drain pour", "objectives": "b:4"},
+    {"id": "second", "buckets": "a:2 b:4", "actions": "fill drain pour", "objectives": "b:3 a:2"},
+    {"id": "third", "buckets": "b:5 a:3", "actions": "pour fill drain", "objectives": "a:1 b:1"},
+    {"id": "fourth", "buckets": "a:4 b:9", "actions": "fill pour", "objectives": "b:8"},
+]
+
+EXPECTED = [
+    ("first", "b", 4, True),
+    ("second", "b", 3, False),
+    ("second", "a", 2, True),
+    ("third", "a", 1, True),
+    ("third", "b", 1, True),
+    ("fourth", "b", 8, True),
+]
+
+
+def requests():
+    return [parse_request(record, position) for position, record in enumerate(RECORDS, 1)]
+
+
+def summary(results):
+    return [(result["id"], result["bucket"], result["volume"], result["reachable"]) for result in results]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_the_ordered_results_follow_the_requests(workers):
+    assert summary(solve_batch(requests(), workers, ordered=True)) == EXPECTED
+
+
+def test_the_requests_who_share_their_puzzle_are_solved_together():
+    results = summary(solve_batch(requests(), 1))
+
+    assert [result[0] for result in results] == ["first", "third", "third", "second", "second", "fourth"]
+    assert sorted(results) == sorted(EXPECTED)
+
+
+def test_the_unordered_results_of_a_pool_are_all_given():
+    assert sorted(summary(solve_batch(requests(), 2))) == sorted(EXPECTED)
+
+
+@pytest.mark.parametrize("arguments", [
+    {"engine": "unknown"},
+    {"workers": 0},
+    {"engine": "parallel", "workers": 2},
+])
+def test_the_parameters_are_checked_before_the_first_result(arguments):
+    with pytest.raises(ValueError):
+        solve_batch(requests(), **arguments)
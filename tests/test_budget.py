@@ -0,0 +1,70 @@
+from src.models.budget import SearchBudget
+from src.models.director import Director
+from time import sleep
+import pytest
+
+PUZZLE = [("a", 4, 0), ("b", 9, 0), ("c", 7, 0)]
+
+
+def test_the_levels_are_yielded_by_depth_until_the_search_is_complete(build):
+    director = Director()
+    levels = list(director.iter_generate(*build(PUZZLE)))
+
+    assert [{context.depth for context in level} for level in levels] == [{depth} for depth in range(len(levels))]
+    assert sum(len(level) for level in levels) == len(director) == len(Director.generate(*build(PUZZLE)))
+    assert director.complete
+    assert director.stop_reason is None
+
+
+@pytest.mark.parametrize("budget, stop_reason", [
+    (SearchBudget(max_states=10), "max_states"),
+    (SearchBudget(max_depth=3), "max_depth"),
+    (SearchBudget(max_memory=1), "max_memory"),
+])
+def test_the_search_stops_at_the_exceeded_limit(build, budget, stop_reason):
+    director = Director()
+    for _ in director.iter_generate(*build(PUZZLE), budget=budget):
+        pass
+
+    assert not director.complete
+    assert director.stop_reason == stop_reason
+    assert len(director) < len(Director.generate(*build(PUZZLE)))
+
+
+def test_the_search_stops_at_the_depth_limit_with_the_levels_above(build):
+    director = Director()
+    levels = list(director.iter_generate(*build(PUZZLE), budget=SearchBudget(max_depth=3)))
+
+    assert len(levels) == 4
+    assert max(context.depth for context in director.context_cluster) == 3
+
+
+def test_the_search_stops_at_its_deadline(build):
+    director = Director()
+    for _ in director.iter_generate(*build(PUZZLE), budget=SearchBudget(deadline=0.01)):
+        sleep(0.02)
+
+    assert not director.complete
+    assert director.stop_reason == "deadline"
+
+
+def test_the_search_is_cancelled_by_its_monitor(build):
+    depths = []
+
+    def monitor(director, depth):
+        depths.append(depth)
+        return depth == 2
+
+    director = Director()
+    levels = list(director.iter_generate(*build(PUZZLE), monitor=monitor))
+
+    assert len(levels) == 2
+    assert depths == [0, 1, 2]
+    assert not director.complete
+    assert director.stop_reason == "cancelled"
+
+
+@pytest.mark.parametrize("limit", SearchBudget.REASONS)
+def test_a_negative_limit_is_refused(limit):
+    with pytest.raises(ValueError):
+        SearchBudget(**{limit: -1})
@@ -0,0 +1,64 @@
+from src.models.bucket import Bucket
+from src.models.context import Context
+from src.models.director import Director
+from src.models.engines.dense import MixedRadix
+import pytest
+
+EDGE_PUZZLES = [
+    ([("a", 3, 3), ("b", 5, 0), ("c", 8, 8)], ("pour",)),
+    ([("a", 4, 0), ("b", 4, 0), ("c", 7, 0)], ("fill", "pour")),
+    ([("a", 0, 0), ("b", 2, 0)], ("drain", "fill", "pour")),
+    ([], ("drain", "fill", "pour")),
+]
+
+ENGINES = [("numpy", None), ("dense", None), ("parallel", 2)]
+
+
+def depths(director):
+    return {context.state.volumes: context.depth for context in director.context_cluster}
+
+
+@pytest.mark.parametrize("engine, workers", ENGINES)
+def test_engines_find_the_contexts_of_the_object_engine(build, buckets, engine, workers):
+    expected = Director.generate(*build(buckets))
+    director = Director.generate(*build(buckets), engine, workers)
+
+    assert len(director) == len(expected)
+    assert depths(director) == depths(expected)
+
+
+@pytest.mark.parametrize("puzzle, actions", EDGE_PUZZLES)
+@pytest.mark.parametrize("engine, workers", ENGINES)
+def test_engines_find_the_contexts_of_the_object_engine_on_the_edge_puzzles(build, puzzle, actions, engine, workers):
+    expected = Director.generate(*build(puzzle, actions))
+    director = Director.generate(*build(puzzle, actions), engine, workers)
+
+    assert len(director) == len(expected)
+    assert depths(director) == depths(expected)
+
+
+@pytest.mark.parametrize("engine, workers", ENGINES)
+def test_engines_give_the_shortest_paths(build, engine, workers):
+    initial_context, applyable_actions = build([("a", 3, 0), ("b", 5, 0)])
+    expected = Director.generate(initial_context, applyable_actions)
+    director = Director.generate(initial_context, applyable_actions, engine, workers)
+
+    for volume in range(6):
+        objectif = Bucket("b", 5, volume)
+        assert len(director.path_to(objectif)) == len(expected.path_to(objectif))
+
+
+@pytest.mark.parametrize("current_volume", [-1, 4])
+def test_a_volume_out_of_its_bucket_is_refused(current_volume):
+    with pytest.raises(ValueError):
+        Context([Bucket("a", 3, current_volume), Bucket("b", 5, 0)])
+
+
+def test_the_dense_engine_refuses_a_volume_above_its_capacity():
+    with pytest.raises(ValueError):
+        MixedRadix((3, 5)).encode((4, 0))
+
+
+def test_the_parallel_engine_refuses_no_worker(build):
+    with pytest.raises(ValueError):
+        Director.generate(*build([("a", 3, 0), ("b", 5, 0)]), "parallel", 0)
@@ -0,0 +1,44 @@
+from src.models.bucket import Bucket
+from src.models.director import Director
+from src.models.feasibility import Feasibility, check_feasibility
+from itertools import combinations
+import pytest
+
+ACTION_SETS = [
+    actions for length in range(1, 4) for actions in combinations(("drain", "fill", "pour"), length)
+]
+
+
+@pytest.mark.parametrize("puzzle, actions, objectif, verdict", [
+    ([("a", 3, 0), ("b", 5, 0)], ("drain", "fill", "pour"), Bucket("c", 5, 4), Feasibility.IMPOSSIBLE),
+    ([("a", 3, 0), ("b", 5, 0)], ("drain", "fill", "pour"), Bucket("b", 3, 1), Feasibility.IMPOSSIBLE),
+    ([("a", 3, 0), ("b", 5, 0)], ("drain", "fill", "pour"), Bucket("b", 5, 6), Feasibility.IMPOSSIBLE),
+    ([("a", 3, 0), ("b", 5, 2)], ("pour",), Bucket("b", 5, 2), Feasibility.POSSIBLE),
+    ([("a", 2, 0), ("b", 4, 0)], ("drain", "fill", "pour"), Bucket("b", 4, 3), Feasibility.IMPOSSIBLE),
+    ([("a", 3, 0), ("b", 5, 0)], ("fill",), Bucket("b", 5, 5), Feasibility.POSSIBLE),
+    ([("a", 3, 0), ("b", 5, 2)], ("drain",), Bucket("b", 5, 0), Feasibility.POSSIBLE),
+    ([("a", 3, 0), ("b", 5, 0)], ("drain", "fill"), Bucket("b", 5, 4), Feasibility.IMPOSSIBLE),
+    ([("a", 3, 3), ("b", 5, 0)], ("pour",), Bucket("b", 5, 4), Feasibility.IMPOSSIBLE),
+    ([("a", 3, 0), ("b", 5, 0)], ("drain", "fill", "pour"), Bucket("b", 5, 4), Feasibility.POSSIBLE),
+    ([("a", 3, 3), ("b", 5, 0), ("c", 8, 8)], ("pour",), Bucket("b", 5, 4), Feasibility.UNKNOWN),
+])
+def test_the_verdict_of_each_argument(build, puzzle, actions, objectif, verdict):
+    feasibility = check_feasibility(*build(puzzle, actions), objectif)
+
+    assert feasibility.verdict == verdict
+    assert feasibility.proof
+
+
+@pytest.mark.parametrize("actions", ACTION_SETS, ids="-".join)
+def test_the_verdicts_agree_with_the_search(build, buckets, actions):
+    director = Director.generate(*build(buckets, actions))
+
+    for name, max_volume, _ in buckets:
+        for volume in range(max_volume + 1):
+            objectif = Bucket(name, max_volume, volume)
+            feasibility = check_feasibility(*build(buckets, actions), objectif)
+
+            if feasibility.possible:
+                assert director.path_to(objectif) is not None, feasibility
+            elif feasibility.impossible:
+                assert director.path_to(objectif) is None, feasibility
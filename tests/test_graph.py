@@ -0,0 +1,115 @@
+from src.models.bucket import Bucket
+from src.models.director import Director
+import pytest
+import re
+
+PUZZLE = [("a", 3, 0), ("b", 5, 0)]
+
+NODE = re.compile(r'^\t(\w+) \[(.*)\]$')
+EDGE = re.compile(r'^\t(\w+) -> (\w+) \[(.*)\]$')
+ATTRIBUTE = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+
+def read_dot(file_path):
+    nodes, edges = {}, []
+    with open(file_path, encoding="utf-8") as dot_file:
+        lines = dot_file.read().splitlines()
+
+    assert lines[0] == "digraph {" and lines[-1] == "}"
+    for line in lines[1:-1]:
+        edge = EDGE.match(line)
+        if edge is not None:
+            edges.append((edge[1], edge[2], attributes(edge[3])))
+        else:
+            node = NODE.match(line)
+            assert node is not None, line
+            nodes[node[1]] = attributes(node[2])
+    return nodes, edges
+
+
+def attributes(text):
+    return {key: re.sub(r'\\(.)', lambda match: "\n" if match[1] == "n" else match[1], value)
+            for key, value in ATTRIBUTE.findall(text)}
+
+
+def test_the_full_mode_draws_every_context_and_its_discovery(build, tmp_path):
+    director = Director.generate(*build(PUZZLE))
+    nodes, edges = read_dot(director.write_dot(str(tmp_path / "graph.dot")))
+
+    assert [node["label"] for node in nodes.values()] == [
+        context.get_representation() for context in director.context_cluster
+    ]
+    assert len(edges) == len(director) - 1
+    assert all(edge[2]["label"] for edge in edges)
+
+
+def test_the_shortest_path_mode_draws_only_the_paths_to_the_objectif(build, tmp_path):
+    director = Director.generate(*build(PUZZLE))
+    director.set_objectif(Bucket("b", 5, 4))
+    nodes, edges = read_dot(director.write_dot(str(tmp_path / "graph.dot"), mode="shortest_path"))
+
+    drawn = set()
+    for context in director.get_result():
+        while context is not None:
+            drawn.add(context.get_representation())
+            context = context.parent
+    assert {node["label"] for node in nodes.values()} == drawn
+    assert len(edges) == len(nodes) - 1
+    assert [node["color"] for node in nodes.values()].count("red") == len(director.get_result())
+
+
+def test_the_depth_mode_gathers_the_deeper_contexts_by_level(build, tmp_path):
+    director = Director.generate(*build(PUZZLE))
+    nodes, edges = read_dot(director.write_dot(str(tmp_path / "graph.dot"), mode="depth", max_depth=2))
+
+    deepest = max(context.depth for context in director.context_cluster)
+    summaries = {
+        node_id: node["label"] for node_id, node in nodes.items() if node.get("style") == "dashed"
+    }
+    assert sorted(summaries) == sorted(f"depth_{depth}" for depth in range(3, deepest + 1))
+    for depth in range(3, deepest + 1):
+        count = sum(context.depth == depth for context in director.context_cluster)
+        assert summaries[f"depth_{depth}"] == f"{count} contexts at depth {depth}"
+    assert len(nodes) - len(summaries) == sum(context.depth <= 2 for context in director.context_cluster)
+    assert all(tail != head for tail, head, _ in edges)
+
+
+def test_the_cap_mode_gathers_the_contexts_after_the_first_ones(build, tmp_path):
+    director = Director.generate(*build(PUZZLE))
+    nodes, edges = read_dot(director.write_dot(str(tmp_path / "graph.dot"), mode="cap", max_nodes=5))
+
+    assert list(nodes)[:5] == ["0", "1", "2", "3", "4"]
+    assert nodes["others"]["label"] == f"{len(director) - 5} other contexts"
+    assert len(nodes) == 6
+    assert len(set((tail, head) for tail, head, _ in edges)) == len(edges)
+
+
+def test_all_the_transitions_are_drawn_when_they_are_recorded(build, tmp_path):
+    director = Director.generate(*build(PUZZLE), record_transitions=True)
+    _, edges = read_dot(director.write_dot(str(tmp_path / "graph.dot"), all_transitions=True))
+
+    assert len(edges) == len(director.transitions) > len(director) - 1
+
+    with pytest.raises(ValueError):
+        Director.generate(*build(PUZZLE)).write_dot(str(tmp_path / "graph.dot"), all_transitions=True)
+
+
+@pytest.mark.parametrize("arguments", [
+    {"mode": "unknown"},
+    {"mode": "depth"},
+    {"mode": "cap"},
+])
+def test_a_mode_unknown_or_without_its_parameter_is_refused(build, tmp_path, arguments):
+    with pytest.raises(ValueError):
+        Director.generate(*build(PUZZLE)).write_dot(str(tmp_path / "graph.dot"), **arguments)
+
+
+def test_the_labels_are_escaped(build, tmp_path):
+    puzzle = [('a\\', 3, 0), ('b"', 5, 0)]
+    director = Director.generate(*build(puzzle))
+    nodes, edges = read_dot(director.write_dot(str(tmp_path / "graph.dot")))
+
+    assert [node["label"] for node in nodes.values()] == [
+        context.get_representation() for context in director.context_cluster
+    ]
+    assert any('b"' in edge[2]["label"] for edge in edges)
@@ -0,0 +1,48 @@
+from src.solve import main
+import io
+import json
+import pytest
+
+
+def test_a_reachable_objective_exits_with_0(capsys):
+    assert main(["--bucket", "a:3", "--bucket", "b:5", "--objective", "b:4"]) == 0
+    assert "b = 4: 6 moves" in capsys.readouterr().out
+
+
+def test_an_impossible_objective_exits_with_1(capsys):
+    assert main(["--bucket", "a:2", "--bucket", "b:4", "--objective", "b:3", "--json"]) == 1
+    results = json.loads(capsys.readouterr().out)["results"]
+    assert results[0]["reachable"] is False
+
+
+def test_an_objective_not_found_before_the_budget_exits_with_1(capsys):
+    assert main(["--bucket", "a:3", "--bucket", "b:5", "--objective", "b:4", "--max-states", "3", "--json"]) == 1
+    output = json.loads(capsys.readouterr().out)
+    assert not output["complete"]
+    assert output["results"][0]["reachable"] is None
+
+
+@pytest.mark.parametrize("arguments", [
+    ["--bucket", "a:3:4", "--objective", "a:1"],
+    ["--bucket", "a:3", "--objective", "b:1"],
+    ["--bucket", "a:3", "--actions", "spill", "--objective", "a:1"],
+    ["--bucket", "a:3", "--objective", "a:1", "--engine", "unknown"],
+])
+def test_an_invalid_puzzle_exits_with_2(arguments, capsys):
+    assert main(arguments) == 2
+    assert capsys.readouterr().err.startswith("error:")
+
+
+def test_the_puzzle_is_read_from_the_standard_input(monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO(json.dumps({
+        "buckets": ["a:3", "b:5"], "actions": ["fill", "drain", "pour"], "objectives": ["b:4", "a:2"]
+    })))
+
+    assert main([]) == 0
+    assert "a = 2" in capsys.readouterr().out
+
+
+def test_a_standard_input_who_is_not_an_object_exits_with_2(monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO("[]"))
+
+    assert main([]) == 2
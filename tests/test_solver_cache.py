@@ -0,0 +1,124 @@
+from src.models.budget import SearchBudget
+from src.models.director import Director
+from src.models.solver_cache import SolverCache
+from src.utils.lru_cache import LRUCache
+from threading import Barrier, Thread
+from time import sleep
+import pytest
+
+PUZZLE = [("a", 3, 0), ("b", 5, 0)]
+
+
+@pytest.fixture
+def solver_cache(monkeypatch):
+    """
+    Give the process-wide solver cache with an empty cache, restored after the test.
+    """
+    solver_cache = SolverCache()
+    monkeypatch.setattr(solver_cache, "cache", LRUCache(max_entries=2))
+    return solver_cache
+
+
+def test_the_least_recently_used_entry_is_evicted_first():
+    cache = LRUCache(max_entries=2)
+    cache.put("a", 1, 10)
+    cache.put("b", 2, 10)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3, 10)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.stats() == {"entries": 2, "memory": 20, "hits": 3, "misses": 0, "evictions": 1}
+
+
+def test_the_entries_are_evicted_until_their_memory_fits():
+    cache = LRUCache(max_entries=10, max_memory=100)
+    for key in "abc":
+        cache.put(key, key, 40)
+
+    assert "a" not in cache
+    assert cache.memory == 80
+
+    cache.put("d", "d", 101)
+    assert "d" not in cache
+    assert cache.memory == 80
+
+
+def test_a_peek_is_neither_counted_nor_recent():
+    cache = LRUCache(max_entries=2)
+    cache.put("a", 1, 10)
+    cache.put("b", 2, 10)
+
+    assert cache.peek("a") == 1
+    assert cache.peek("c") is None
+    cache.put("c", 3, 10)
+
+    assert "a" not in cache
+    assert cache.stats()["hits"] == cache.stats()["misses"] == 0
+
+
+def test_a_puzzle_is_generated_once_then_hit(build, solver_cache):
+    first = solver_cache.generate(*build(PUZZLE))
+    assert solver_cache.stats()["misses"] == 1
+
+    again = solver_cache.generate(*build(PUZZLE, ("pour", "fill", "drain")))
+    assert again is not first
+    assert again.context_cluster is first.context_cluster
+    assert len(again) == len(Director.generate(*build(PUZZLE)))
+    assert solver_cache.stats()["hits"] == 1
+
+    other = solver_cache.generate(*build(PUZZLE, ("fill", "pour")))
+    assert other.context_cluster is not first.context_cluster
+    assert solver_cache.stats()["misses"] == 2
+
+
+def test_the_least_recently_solved_puzzle_is_evicted(build, solver_cache):
+    puzzles = [PUZZLE, [("a", 2, 0), ("b", 7, 0)], [("a", 4, 0), ("b", 9, 0)]]
+    for puzzle in puzzles:
+        solver_cache.generate(*build(puzzle))
+
+    assert solver_cache.stats()["evictions"] == 1
+    solver_cache.generate(*build(puzzles[2]))
+    solver_cache.generate(*build(puzzles[0]))
+    assert solver_cache.stats()["hits"] == 1
+    assert solver_cache.stats()["misses"] == 4
+
+
+def test_a_director_stopped_by_its_budget_is_not_cached(build, solver_cache):
+    director = solver_cache.generate(*build(PUZZLE), budget=SearchBudget(max_states=3))
+
+    assert not director.complete
+    assert solver_cache.stats()["entries"] == 0
+
+
+def test_concurrent_lookups_of_a_puzzle_generate_it_once(build, solver_cache, monkeypatch):
+    generate = Director.generate
+    calls = []
+
+    def slow_generate(*args, **kwargs):
+        calls.append(args)
+        sleep(0.3)
+        return generate(*args, **kwargs)
+
+    monkeypatch.setattr(Director, "generate", slow_generate)
+    barrier = Barrier(4)
+    directors = []
+
+    def lookup():
+        barrier.wait()
+        directors.append(solver_cache.generate(*build(PUZZLE)))
+
+    threads = [Thread(target=lookup) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(directors) == 4
+    assert len({id(director.context_cluster) for director in directors}) == 1
+    assert solver_cache.stats() == {
+        "entries": 1, "memory": directors[0].estimate_memory(), "hits": 0, "misses": 4, "evictions": 0
+    }
+    assert solver_cache.flights == {}
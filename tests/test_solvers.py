@@ -0,0 +1,56 @@
+from src.models.bucket import Bucket
+from src.models.budget import SearchBudget
+from src.models.context import Context
+from src.models.director import Director
+from src.models.heuristics import gcd_bound, target_volume_distance
+import pytest
+
+
+def test_the_bidirectional_search_is_as_short_as_the_breadth_first_search(build, buckets):
+    director = Director.generate(*build(buckets))
+
+    for context in director.context_cluster:
+        objectif = Context.from_state(context.layout, context.state)
+        bidirectional = Director.solve_bidirectional(*build(buckets), objectif)
+
+        assert len(bidirectional.solutions) == 1
+        assert bidirectional.solutions[0].state == context.state
+        assert len(bidirectional.path_to(objectif)) == context.depth
+
+
+def test_the_bidirectional_search_stops_at_its_budget(build):
+    puzzle = [("a", 4, 0), ("b", 9, 0), ("c", 7, 0)]
+    director = Director.generate(*build(puzzle))
+    deepest = max(director.context_cluster, key=lambda context: context.depth)
+    objectif = Context.from_state(deepest.layout, deepest.state)
+
+    bidirectional = Director.solve_bidirectional(*build(puzzle), objectif, SearchBudget(max_states=10))
+
+    assert bidirectional.solutions == []
+    assert not bidirectional.complete
+    assert bidirectional.stop_reason == "max_states"
+
+
+@pytest.mark.parametrize("heuristic", [target_volume_distance, gcd_bound])
+def test_the_astar_search_is_as_short_as_the_breadth_first_search(build, buckets, heuristic):
+    director = Director.generate(*build(buckets))
+
+    for name, max_volume, _ in buckets:
+        for volume in range(max_volume + 1):
+            objectif = Bucket(name, max_volume, volume)
+            expected = Director.solve(*build(buckets), objectif)
+            astar = Director.solve_astar(*build(buckets), objectif, heuristic)
+
+            assert bool(astar.solutions) == bool(expected.solutions) == (director.path_to(objectif) is not None)
+            if expected.solutions:
+                assert astar.solutions[0].depth == expected.solutions[0].depth
+
+
+def test_the_astar_search_skips_the_contexts_too_deep(build):
+    puzzle = [("a", 3, 0), ("b", 5, 0)]
+    objectif = Bucket("b", 5, 4)
+
+    assert Director.solve_astar(*build(puzzle), objectif, budget=SearchBudget(max_depth=6)).solutions
+    astar = Director.solve_astar(*build(puzzle), objectif, budget=SearchBudget(max_depth=5))
+    assert astar.solutions == []
+    assert astar.stop_reason == "max_depth"
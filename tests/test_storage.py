@@ -0,0 +1,85 @@
+from src.models.bucket import Bucket
+from src.models.budget import SearchBudget
+from src.models.director import Director
+from src.models.state import Layout, StateTable
+from src.models.storage import read_table, write_table
+import pytest
+
+PUZZLE = [("a", 3, 0), ("b", 5, 0), ("c", 8, 8)]
+
+
+@pytest.mark.parametrize("engine", ["object", "numpy"])
+def test_a_saved_director_is_loaded_with_the_same_contexts(build, tmp_path, engine):
+    director = Director.generate(*build(PUZZLE), engine)
+    file_path = str(tmp_path / "graph" / "puzzle.bin")
+    director.save(file_path)
+
+    loaded = Director.load(file_path)
+    assert len(loaded) == len(director)
+    assert {
+        context.state.volumes: (context.depth, context.history) for context in loaded.context_cluster
+    } == {
+        context.state.volumes: (context.depth, context.history) for context in director.context_cluster
+    }
+    assert loaded.path_to(Bucket("c", 8, 4)) == director.path_to(Bucket("c", 8, 4))
+    assert loaded.table.content.closed
+
+
+def test_a_loaded_director_closes_its_file_as_a_context_manager(build, tmp_path):
+    file_path = str(tmp_path / "puzzle.bin")
+    Director.generate(*build(PUZZLE)).save(file_path)
+
+    with Director.load(file_path) as loaded:
+        assert not loaded.table.content.closed
+
+    assert loaded.table.content.closed
+    assert loaded.path_to(Bucket("c", 8, 4)) is not None
+
+
+def test_a_table_is_read_as_it_was_written(build, tmp_path):
+    table = Director.generate(*build(PUZZLE)).to_table()
+    file_path = str(tmp_path / "table.bin")
+    write_table(table, file_path)
+
+    with read_table(file_path) as read:
+        assert read.layout.names == table.layout.names
+        assert read.layout.capacities == table.layout.capacities
+        assert list(read.rows()) == list(table.rows())
+
+    assert read.content.closed
+
+
+def test_a_name_who_is_not_a_str_is_refused(tmp_path):
+    table = StateTable(Layout([1, "b"], [3, 5]), [(0, 0)], [-1], [-1])
+
+    with pytest.raises(ValueError):
+        write_table(table, str(tmp_path / "table.bin"))
+
+
+def test_a_file_who_is_not_a_table_is_refused(tmp_path):
+    file_path = tmp_path / "table.bin"
+    file_path.write_bytes(b"not a state table at all")
+
+    with pytest.raises(ValueError):
+        read_table(str(file_path))
+
+
+def test_a_director_stopped_by_its_budget_is_loaded_incomplete(build, tmp_path):
+    director = Director.generate(*build(PUZZLE), budget=SearchBudget(max_states=10))
+    file_path = str(tmp_path / "puzzle.bin")
+    director.save(file_path)
+
+    with Director.load(file_path) as loaded:
+        assert not loaded.complete
+        assert loaded.stop_reason == "max_states"
+
+
+def test_a_truncated_file_is_refused(build, tmp_path):
+    file_path = tmp_path / "table.bin"
+    write_table(Director.generate(*build(PUZZLE)).to_table(), str(file_path))
+    content = file_path.read_bytes()
+
+    for length in (len(content) - 1, 30):
+        file_path.write_bytes(content[:length])
+        with pytest.raises(ValueError, match="truncated"):
+            read_table(str(file_path))
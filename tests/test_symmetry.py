@@ -0,0 +1,51 @@
+from src.models.director import Director
+import pytest
+import re
+
+SYMMETRIC_PUZZLES = [
+    [("a", 3, 0), ("b", 3, 0), ("c", 5, 0)],
+    [("a", 4, 0), ("b", 4, 0), ("c", 4, 0), ("d", 7, 0)],
+    [("a", 3, 1), ("b", 3, 0)],
+]
+
+
+def replay(initial_context, applyable_actions, history):
+    context = initial_context
+    for trace in history:
+        context = next(
+            successor for successor in context.successors(applyable_actions)
+            if successor.history[-1] == trace
+        )
+    return context
+
+
+@pytest.mark.parametrize("puzzle", SYMMETRIC_PUZZLES)
+def test_the_paths_of_a_symmetric_search_are_as_short_and_reach_the_context(build, puzzle):
+    director = Director.generate(*build(puzzle))
+    symmetric = Director.generate(*build(puzzle), symmetric=True)
+
+    assert len(symmetric) <= len(director)
+    for context in director.context_cluster:
+        path = symmetric.path_to(context)
+        assert len(path) == len(director.path_to(context))
+        assert replay(*build(puzzle), path).state.volumes == context.state.volumes
+
+
+@pytest.mark.parametrize("puzzle", SYMMETRIC_PUZZLES[:2])
+def test_the_edges_of_a_symmetric_graph_name_the_buckets_of_their_contexts(build, puzzle):
+    initial_context, applyable_actions = build(puzzle)
+    symmetric = Director.generate(initial_context, applyable_actions, symmetric=True)
+    contexts = list(symmetric.context_cluster)
+
+    source = symmetric.generate_graph_visualization().source
+    edges = re.findall(r'\t(\d+) -> (\d+) \[label="([^"]*)"', source)
+    assert edges
+
+    for tail, head, label in edges:
+        parent, context = contexts[int(tail)], contexts[int(head)]
+        if "exchanged by symmetry" in label:
+            continue
+        assert any(
+            successor.state.volumes == context.state.volumes and successor.history[-1] == label
+            for successor in parent.successors(applyable_actions)
+        )